@@ -1,26 +1,56 @@
-"""CAN Gateway CLI - Command line interface (redirects to GUI)."""
+"""CAN Gateway CLI - Command line interface (redirects to GUI).
 
-import click
+The click command is built on first access to ``main``, so importing this
+package (entry-point discovery, test collection) does not import click.
+"""
 
+from typing import TYPE_CHECKING, Any
 
-@click.command()
-@click.option("--vcan", "-v", is_flag=True, help="Use virtual CAN interfaces (vcan0, vcan1)")
-@click.option("--iface0", "-0", default=None, help="First CAN interface (default: can0 or vcan0)")
-@click.option("--iface1", "-1", default=None, help="Second CAN interface (default: can1 or vcan1)")
-def main(vcan: bool, iface0: str | None, iface1: str | None) -> None:
-    """CAN Gateway - Launches the GUI application.
+if TYPE_CHECKING:
+    import click
 
-    Start with --vcan for virtual CAN interfaces (development/testing).
-    """
-    # Import here to avoid circular imports and speed up CLI help
-    import sys
+    # Declared for type checkers; the command is built by __getattr__
+    main: click.Command
 
-    from wp4.gui import main as gui_main
 
-    # Pass args to GUI
-    if vcan and "--vcan" not in sys.argv:
-        sys.argv.append("--vcan")
-    gui_main()
+def _build_main() -> "click.Command":
+    """Build the click command for the CLI entry point."""
+    import click
+
+    @click.command()
+    @click.option("--vcan", "-v", is_flag=True, help="Use virtual CAN interfaces (vcan0, vcan1)")
+    @click.option(
+        "--iface0", "-0", default=None, help="First CAN interface (default: can0 or vcan0)"
+    )
+    @click.option(
+        "--iface1", "-1", default=None, help="Second CAN interface (default: can1 or vcan1)"
+    )
+    def main(vcan: bool, iface0: str | None, iface1: str | None) -> None:
+        """CAN Gateway - Launches the GUI application.
+
+        Start with --vcan for virtual CAN interfaces (development/testing).
+        """
+        # Import here to avoid circular imports and speed up CLI help
+        import sys
+
+        from wp4.gui import main as gui_main
+
+        # Pass args to GUI
+        if vcan and "--vcan" not in sys.argv:
+            sys.argv.append("--vcan")
+        gui_main()
+
+    return main
+
+
+def __getattr__(name: str) -> Any:
+    """Build ``main`` lazily on first access and cache it as a module global."""
+    if name == "main":
+        main = _build_main()
+        globals()["main"] = main
+        return main
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 __all__ = ["main"]
@@ -7,7 +7,7 @@ Provides an abstraction for creating CAN Bus objects, allowing:
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import can
 
@@ -121,8 +121,11 @@ class MockBusFactory(BusFactory):
         return self._buses[channel]
 
 
+# Shared production factory (stateless, so one instance serves every reset)
+_SINGLETON: Final[BusFactory] = SocketCANBusFactory()
+
 # Default factory instance for production use
-_default_factory: BusFactory = SocketCANBusFactory()
+_default_factory: BusFactory = _SINGLETON
 
 
 def get_default_factory() -> BusFactory:
@@ -149,4 +152,4 @@ def set_default_factory(factory: BusFactory) -> None:
 def reset_default_factory() -> None:
     """Reset the default factory to SocketCANBusFactory."""
     global _default_factory
-    _default_factory = SocketCANBusFactory()
+    _default_factory = _SINGLETON
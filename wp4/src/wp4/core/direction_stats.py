@@ -4,36 +4,237 @@ Encapsulates all per-direction statistics and state to reduce code duplication
 in the gateway implementation.
 """
 
-import threading
-from collections import deque
+import contextlib
+import heapq
+import time
+from array import array
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from queue import Empty, SimpleQueue
 from typing import Literal
 
+from wp4.core.timer_wheel import TimerWheel
+
 Direction = Literal["0to1", "1to0"]
 
+LATENCY_SAMPLE_CAPACITY = 100
+SCHEDULED_QUEUE_CAPACITY = 10000
+PAYLOAD_FRAME_SIZE = 64  # CAN FD maximum data length
+LATENCY_STAT_KEYS = ("min", "max", "avg", "p95", "p99")
+
+# Scheduled entry layout: (send_ns, recv_ns, arb_id, data, is_extended), with
+# times as time.monotonic_ns() values
+ScheduledEntry = tuple[int, int, int, bytes, bool]
+
+
+class LatencyRingBuffer:
+    """Fixed-capacity ring buffer of latency samples.
+
+    Samples are stored as raw single-precision floats in a preallocated
+    ``array`` (4 bytes per sample, better than 0.1 us resolution for
+    latencies under a second) so appends never allocate and min/max/sum
+    run at C level without boxing each sample.
+    Once full, the oldest sample is overwritten (like ``deque(maxlen=...)``).
+    ``epoch`` changes on every modification so derived values can be cached.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_count", "_idx", "epoch")
+
+    def __init__(self, capacity: int = LATENCY_SAMPLE_CAPACITY):
+        self._buf = array("f", bytes(4 * capacity))
+        self._capacity = capacity
+        self._idx = 0
+        self._count = 0
+        self.epoch = 0
+
+    def append(self, value: float) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        self._buf[self._idx] = value
+        self._idx = (self._idx + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+        self.epoch += 1
+
+    def clear(self) -> None:
+        """Drop all samples (storage is kept)."""
+        self._idx = 0
+        self._count = 0
+        self.epoch += 1
+
+    def values(self) -> array:
+        """Get a copy of the stored samples in storage order (not chronological)."""
+        return self._buf[: self._count]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate samples from oldest to newest."""
+        if self._count < self._capacity:
+            return iter(self._buf[: self._count])
+        return iter(self._buf[self._idx :] + self._buf[: self._idx])
+
+
+class PayloadPool:
+    """Preallocated storage for frame payloads addressed by slot index.
+
+    All payloads share one ``bytearray`` of ``capacity * frame_size`` bytes,
+    with lengths in a parallel ``array``. Writing copies into the slot in
+    place, so queued frames hold no per-frame ``bytes`` objects.
+    """
+
+    __slots__ = ("_buf", "_frame_size", "_lengths")
+
+    def __init__(self, capacity: int, frame_size: int = PAYLOAD_FRAME_SIZE):
+        self._buf = bytearray(capacity * frame_size)
+        self._frame_size = frame_size
+        self._lengths = array("B", bytes(capacity))
+
+    @property
+    def frame_size(self) -> int:
+        """Get the largest payload a slot can hold."""
+        return self._frame_size
+
+    def write(self, idx: int, data: bytes) -> None:
+        """Copy data (at most frame_size bytes) into slot idx."""
+        offset = idx * self._frame_size
+        self._buf[offset : offset + len(data)] = data
+        self._lengths[idx] = len(data)
+
+    def read(self, idx: int) -> bytes:
+        """Get a copy of the payload in slot idx."""
+        offset = idx * self._frame_size
+        return bytes(self._buf[offset : offset + self._lengths[idx]])
+
+
+class ScheduledRingBuffer:
+    """Scheduler queue with struct-of-arrays storage for delayed frames.
+
+    Timestamps and IDs live in parallel preallocated arrays and payloads in
+    a PayloadPool, instead of one tuple and bytes object per frame. With a
+    constant delay, frames become due in arrival order, so entries whose
+    send time is not earlier than the tail are appended to the ring and
+    popped from its head in O(1). Out-of-order
+    entries (jitter, per-rule delays) and oversized payloads go to a
+    TimerWheel; ``pop_min`` returns whichever head is earlier.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_count",
+        "_ext",
+        "_head",
+        "_ids",
+        "_late",
+        "_payloads",
+        "_recv_times",
+        "_send_times",
+    )
+
+    def __init__(self, capacity: int = SCHEDULED_QUEUE_CAPACITY):
+        self._capacity = capacity
+        self._send_times = array("q", bytes(8 * capacity))
+        self._recv_times = array("q", bytes(8 * capacity))
+        self._ids = array("I", bytes(4 * capacity))
+        self._ext = bytearray(capacity)
+        self._payloads = PayloadPool(capacity)
+        self._head = 0
+        self._count = 0
+        self._late = TimerWheel()
+
+    def push(self, send_time: int, recv_time: int, arb_id: int, data: bytes, is_ext: bool) -> None:
+        """Add a frame scheduled for send_time."""
+        count = self._count
+        capacity = self._capacity
+        tail = (self._head + count - 1) % capacity
+        if (
+            count == capacity
+            or (count and send_time < self._send_times[tail])
+            or len(data) > self._payloads.frame_size
+        ):
+            # bytes() only copies a mutable buffer; the ring copies into its pool
+            self._late.add((send_time, recv_time, arb_id, bytes(data), is_ext))
+            return
+
+        slot = (self._head + count) % capacity
+        self._send_times[slot] = send_time
+        self._recv_times[slot] = recv_time
+        self._ids[slot] = arb_id
+        self._ext[slot] = is_ext
+        self._payloads.write(slot, data)
+        self._count = count + 1
+
+    def peek_time(self) -> int | None:
+        """Get the earliest send time, or None if empty."""
+        late_time = self._late.peek_time()
+        if self._count:
+            head_time = self._send_times[self._head]
+            if late_time is not None and late_time < head_time:
+                return late_time
+            return head_time
+        return late_time
+
+    def pop_min(self) -> ScheduledEntry:
+        """Remove and return the entry with the earliest send time.
+
+        Raises:
+            IndexError: If the buffer is empty
+        """
+        if not self._count:
+            return self._late.pop()
+        if self._late:
+            late_time = self._late.peek_time()
+            if late_time is not None and late_time < self._send_times[self._head]:
+                return self._late.pop()
+
+        slot = self._head
+        self._head = (slot + 1) % self._capacity
+        self._count -= 1
+        return (
+            self._send_times[slot],
+            self._recv_times[slot],
+            self._ids[slot],
+            self._payloads.read(slot),
+            bool(self._ext[slot]),
+        )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._head = 0
+        self._count = 0
+        self._late.clear()
 
-@dataclass
+    def __len__(self) -> int:
+        return self._count + len(self._late)
+
+
+@dataclass(slots=True)
 class DirectionStats:
     """Statistics and state for a single direction in the gateway.
 
     This dataclass encapsulates all per-direction data:
-    - Message counters (received, forwarded, dropped)
-    - Priority queue for delayed sending
-    - Condition variable for sender thread coordination
+    - Message counters (received, forwarded, dropped, tx_dropped)
+    - FIFO handing frames from the receive thread to the send thread
+    - Scheduler queue for delayed sending, owned by the send thread
     - Latency samples for monitoring
     - Enable flag for direction control
 
     Thread Safety:
-    - Counter updates should be protected by external stats_lock
-    - Queue operations should be protected by the condition
+    - Each counter has a single writer thread and needs no lock: received and
+      dropped are written by the receive thread, forwarded and tx_dropped
+      by whichever thread sends: the send thread, or the receive thread
+      while it forwards inline (only once sender_idle). Readers may see a
+      slightly stale value.
+    - The FIFO is a SimpleQueue and is the only handoff between the threads;
+      the receive thread calls push_batch(), the send thread next_due()
+    - The scheduler queue is only modified by the send thread (next_due)
     - Latency samples should be protected by external latency_lock
-    - Enable flag should be protected by external direction_lock
+    - The enable flag is a plain bool; reads and writes need no lock
 
     Example:
         stats = DirectionStats(direction="0to1")
-        with stats.condition:
-            heapq.heappush(stats.queue, (send_time, recv_time, arb_id, data, ext))
-            stats.condition.notify()
+        dropped = stats.push_batch([(send_ns, recv_ns, arb_id, data, ext)], max_size)
+        entry = stats.next_due(max_size)  # In the send thread
     """
 
     direction: Direction
@@ -41,29 +242,139 @@ class DirectionStats:
     # Message counters
     received: int = 0
     forwarded: int = 0
-    dropped: int = 0
+    dropped: int = 0  # Dropped by the receive thread (rules, loss, full FIFO)
+    tx_dropped: int = 0  # Dropped by the send thread (full scheduler, failed send)
 
-    # Priority queue: (send_time, recv_time, arb_id, data, is_extended)
-    queue: list[tuple[float, float, int, bytes, bool]] = field(default_factory=list)
+    # Scheduler queue ordered by send time (send thread only)
+    queue: ScheduledRingBuffer = field(default_factory=ScheduledRingBuffer)
 
-    # Condition variable for sender thread coordination
-    condition: threading.Condition = field(default_factory=threading.Condition)
+    # Frames handed from the receive thread to the send thread; None is a wake-up token
+    fifo: SimpleQueue[ScheduledEntry | None] = field(default_factory=SimpleQueue)
 
-    # Latency samples (microseconds)
-    latency_samples: deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    # Latency samples (microseconds), last LATENCY_SAMPLE_CAPACITY only
+    latency_samples: LatencyRingBuffer = field(default_factory=LatencyRingBuffer)
 
-    # Direction enable flag
+    # Direction enable flag (set by the GUI thread, read lock-free by the receive thread)
     enabled: bool = True
 
+    # Entries put into the FIFO and not evicted again (receive thread only), and
+    # entries the send thread finished with: sent, failed or dropped (send thread only)
+    handed_off: int = 0
+    settled: int = 0
+
+    # Cached results, invalidated by latency epoch / counter snapshot changes
+    _latency_epoch: int = field(default=-1, init=False, repr=False, compare=False)
+    _latency_cache: dict[str, float | None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _dict_key: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def reset_counters(self) -> None:
         """Reset message counters to zero."""
         self.received = 0
         self.forwarded = 0
         self.dropped = 0
+        self.tx_dropped = 0
 
     def clear_queue(self) -> None:
-        """Clear the message queue."""
+        """Clear the message queues (scheduler queue and FIFO).
+
+        Only call while the send thread is not running.
+        """
         self.queue.clear()
+        with contextlib.suppress(Empty):
+            while True:
+                self.fifo.get_nowait()
+        self.settled = self.handed_off
+
+    @property
+    def sender_idle(self) -> bool:
+        """Check whether the send thread has finished every entry handed to it.
+
+        Unlike an empty queue_size, this stays False while the send thread is
+        still sending the last entry it took. Only meaningful in the receive
+        thread, which is the only one handing off entries.
+        """
+        return self.settled == self.handed_off
+
+    def wake_sender(self) -> None:
+        """Wake the sender thread blocked on the FIFO so it re-checks its state."""
+        self.fifo.put(None)
+
+    def push_batch(self, batch: list[ScheduledEntry], max_size: int) -> int:
+        """Hand received entries to the send thread (receive thread only).
+
+        When max_size frames are already pending, the oldest frame still in
+        the FIFO is dropped to make room. Frames already moved to the
+        scheduler queue belong to the send thread, so if the FIFO is empty
+        the new frame is dropped instead.
+
+        Args:
+            batch: Entries as (send_ns, recv_ns, arb_id, data, is_extended)
+            max_size: Queue size limit
+
+        Returns:
+            Number of entries dropped to stay within max_size
+        """
+        dropped = 0
+        fifo = self.fifo
+        for entry in batch:
+            if self.queue_size >= max_size:
+                try:
+                    oldest = fifo.get_nowait()
+                except Empty:
+                    dropped += 1
+                    continue
+                if oldest is not None:  # Not a wake-up token
+                    dropped += 1
+                    self.handed_off -= 1
+            fifo.put(entry)
+            self.handed_off += 1
+        return dropped
+
+    def next_due(self, max_size: int, timeout: float = 0.5) -> ScheduledEntry | None:
+        """Wait for the next frame that is due for sending (send thread only).
+
+        Frames arriving through the FIFO are returned right away when they
+        are due and no earlier frame is scheduled; otherwise they are moved
+        to the scheduler queue, dropping its earliest frame if it already
+        holds max_size.
+
+        Args:
+            max_size: Scheduler queue size limit
+            timeout: Maximum time to block in seconds
+
+        Returns:
+            The next due entry, or None on timeout or a wake-up token
+        """
+        queue = self.queue
+        fifo = self.fifo
+        while True:
+            head = queue.peek_time()
+            now = time.monotonic_ns()
+            if head is not None and head <= now:
+                return queue.pop_min()
+
+            wait = timeout if head is None else (head - now) / 1e9
+            try:
+                entry = fifo.get(timeout=min(wait, timeout))
+            except Empty:
+                if head is not None and wait <= timeout:  # The scheduled head is due now
+                    continue
+                return None
+            if entry is None:  # Wake-up token
+                return None
+
+            # Due on arrival (no delay) or by now, and nothing earlier is scheduled
+            due = entry[0] <= entry[1] or entry[0] <= time.monotonic_ns()
+            if due and (head is None or entry[0] < head):
+                return entry
+            if len(queue) >= max_size:
+                queue.pop_min()
+                self.tx_dropped += 1
+                self.settled += 1
+            queue.push(*entry)
 
     def clear_latency_samples(self) -> None:
         """Clear latency samples."""
@@ -75,53 +386,85 @@ class DirectionStats:
         self.clear_queue()
         self.clear_latency_samples()
 
+    @property
+    def total_dropped(self) -> int:
+        """Get all dropped frames (receive and send side)."""
+        return self.dropped + self.tx_dropped
+
     @property
     def queue_size(self) -> int:
-        """Get current queue size."""
-        return len(self.queue)
+        """Get current queue size (scheduler queue plus FIFO).
+
+        Pending wake-up tokens are included and the scheduler queue is read
+        without locking, so the value is approximate.
+        """
+        return len(self.queue) + self.fifo.qsize()
 
     def get_latency_stats(self) -> dict[str, float | None]:
         """Calculate latency statistics from samples.
 
+        The result is cached until the samples change.
+
         Returns:
             Dictionary with min, max, avg, p95, p99 latency in microseconds,
             or None values if no samples available.
         """
-        if not self.latency_samples:
-            return {
-                "min": None,
-                "max": None,
-                "avg": None,
-                "p95": None,
-                "p99": None,
-            }
+        epoch = self.latency_samples.epoch
+        if epoch != self._latency_epoch:
+            self._latency_cache = self._compute_latency_stats()
+            self._latency_epoch = epoch
+        return dict(self._latency_cache)
 
-        samples = sorted(self.latency_samples)
+    def _compute_latency_stats(self) -> dict[str, float | None]:
+        """Compute latency statistics from the current samples."""
+        samples = self.latency_samples.values()
         n = len(samples)
+        if not n:
+            return dict.fromkeys(LATENCY_STAT_KEYS)
+
+        # Nearest-rank indices in exact integer arithmetic. Only the top tail
+        # is needed for p95/p99, so select it instead of sorting every
+        # sample: top[i] is the (n - 1 - i)-th order statistic.
+        k95 = n * 95 // 100
+        k99 = n * 99 // 100
+        top = heapq.nlargest(n - k95, samples)
 
         return {
-            "min": samples[0],
-            "max": samples[-1],
+            "min": min(samples),
+            "max": top[0],
             "avg": sum(samples) / n,
-            "p95": samples[int(n * 0.95)] if n > 0 else None,
-            "p99": samples[int(n * 0.99)] if n > 0 else None,
+            "p95": top[n - 1 - k95],
+            "p99": top[n - 1 - k99],
         }
 
     def to_dict(self) -> dict:
         """Convert statistics to dictionary for serialization.
 
+        The result is cached and rebuilt only when a counter, the queue size,
+        the enable flag or the latency samples changed since the last call.
+
         Returns:
             Dictionary with direction statistics (excludes thread objects).
         """
-        return {
-            "direction": self.direction,
-            "received": self.received,
-            "forwarded": self.forwarded,
-            "dropped": self.dropped,
-            "queue_size": self.queue_size,
-            "enabled": self.enabled,
-            "latency_stats": self.get_latency_stats(),
-        }
+        received, forwarded, dropped = self.received, self.forwarded, self.total_dropped
+        queue_size, enabled = self.queue_size, self.enabled
+        key = (received, forwarded, dropped, queue_size, enabled, self.latency_samples.epoch)
+        if key != self._dict_key:
+            self._dict_cache = {
+                "direction": self.direction,
+                "received": received,
+                "forwarded": forwarded,
+                "dropped": dropped,
+                "queue_size": queue_size,
+                "enabled": enabled,
+                "latency_stats": self.get_latency_stats(),
+            }
+            self._dict_key = key
+
+        # Copies, so callers can't mutate the cache
+        result = dict(self._dict_cache)
+        result["latency_stats"] = dict(result["latency_stats"])
+        return result
 
 
 def create_direction_pair() -> tuple[DirectionStats, DirectionStats]:
@@ -1,11 +1,16 @@
 """Framework-agnostic event system for decoupling components."""
 
-import contextlib
+import inspect
 import logging
+import sys
+import weakref
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wp4.core.direction_stats import DirectionStats
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +43,14 @@ class Direction(Enum):
         Raises:
             ValueError: If string doesn't match any direction
         """
-        for member in cls:
-            if member.value == value:
-                return member
-        msg = f"Invalid direction: {value}"
-        raise ValueError(msg)
+        try:
+            return _DIRECTION_BY_STRING[value]
+        except KeyError:
+            msg = f"Invalid direction: {value}"
+            raise ValueError(msg) from None
+
+
+_DIRECTION_BY_STRING: dict[str, Direction] = {member.value: member for member in Direction}
 
 
 # Type alias for gradual migration from strings to enum
@@ -54,7 +62,7 @@ DirectionLike = Direction | str
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GatewayStartedEvent:
     """Event data for GATEWAY_STARTED event.
 
@@ -73,7 +81,7 @@ class GatewayStartedEvent:
     jitter_ms: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GatewayStoppedEvent:
     """Event data for GATEWAY_STOPPED event.
 
@@ -86,7 +94,7 @@ class GatewayStoppedEvent:
     iface1: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsChangedEvent:
     """Event data for SETTINGS_CHANGED event.
 
@@ -101,7 +109,7 @@ class SettingsChangedEvent:
     jitter_ms: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatsUpdatedEvent:
     """Event data for STATS_UPDATED event.
 
@@ -119,8 +127,34 @@ class StatsUpdatedEvent:
     dropped: int
     queue_size: int
 
+    @classmethod
+    def from_stats(cls, stats: "DirectionStats") -> "StatsUpdatedEvent":
+        """Build an event from live DirectionStats.
+
+        Counters are read without locking; each value is consistent on its
+        own, which is sufficient for display.
+
+        Args:
+            stats: Direction statistics to snapshot
+
+        Returns:
+            StatsUpdatedEvent with the current counters
+        """
+        return cls(
+            _DIRECTION_0TO1 if stats.direction == _DIRECTION_0TO1 else _DIRECTION_1TO0,
+            stats.received,
+            stats.forwarded,
+            stats.total_dropped,
+            stats.queue_size,
+        )
+
 
-@dataclass(frozen=True)
+# Shared direction strings, so every event references the same two objects
+_DIRECTION_0TO1 = sys.intern("0to1")
+_DIRECTION_1TO0 = sys.intern("1to0")
+
+
+@dataclass(frozen=True, slots=True)
 class InterfaceStateChangedEvent:
     """Event data for INTERFACE_STATE_CHANGED event.
 
@@ -159,9 +193,16 @@ class EventType(Enum):
     INTERFACE_STATE_CHANGED = "interface_state_changed"
 
 
+# Stored subscriber: a callable, or a weak reference to a bound method
+_Listener = Callable[[Any], None] | weakref.WeakMethod[Callable[[Any], None]]
+
+
 class EventBus:
     """Simple pub/sub event bus for decoupling components.
 
+    Bound-method subscribers are held by weak reference, so subscribing
+    does not keep their object alive; they are dropped once it is collected.
+
     Example:
         bus = EventBus()
         bus.subscribe(EventType.GATEWAY_STARTED, lambda data: print(f"Started: {data}"))
@@ -169,7 +210,14 @@ class EventBus:
     """
 
     def __init__(self):
-        self._listeners: dict[EventType, list[Callable[[Any], None]]] = {}
+        self._listeners: dict[EventType, list[_Listener]] = {}
+        # Immutable per-type snapshots read by publish(), for types whose
+        # subscribers are all strongly referenced
+        self._fast: dict[EventType, tuple[Callable[[Any], None], ...]] = {}
+        # Same, for types with weakly referenced subscribers (resolved per publish)
+        self._weak: dict[EventType, tuple[_Listener, ...]] = {}
+        # Event types with at least one subscriber
+        self._active: frozenset[EventType] = frozenset()
 
     def subscribe(self, event_type: EventType, callback: Callable[[Any], None]) -> None:
         """Subscribe to an event type.
@@ -178,9 +226,9 @@ class EventBus:
             event_type: The event type to subscribe to
             callback: Function to call when event is published, receives event data
         """
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
-        self._listeners[event_type].append(callback)
+        entry: _Listener = weakref.WeakMethod(callback) if inspect.ismethod(callback) else callback
+        self._listeners.setdefault(event_type, []).append(entry)
+        self._rebuild(event_type)
 
     def unsubscribe(self, event_type: EventType, callback: Callable[[Any], None]) -> None:
         """Unsubscribe from an event type.
@@ -189,9 +237,45 @@ class EventBus:
             event_type: The event type to unsubscribe from
             callback: The callback function to remove
         """
+        entries = self._listeners.get(event_type, [])
+        for i, entry in enumerate(entries):
+            if _deref(entry) == callback:
+                del entries[i]
+                break
+        self._rebuild(event_type)
+
+    def _rebuild(self, event_type: EventType) -> None:
+        """Rebuild the dispatch snapshot for an event type."""
+        entries = tuple(self._listeners.get(event_type, ()))
+        strong = tuple(cb for cb in entries if not isinstance(cb, weakref.WeakMethod))
+        # Install the new snapshot before removing the old one, so a concurrent
+        # publish() always finds one of them
+        if len(strong) != len(entries):
+            self._weak[event_type] = entries
+            self._fast.pop(event_type, None)
+        elif entries:
+            self._fast[event_type] = strong
+            self._weak.pop(event_type, None)
+        else:
+            self._fast.pop(event_type, None)
+            self._weak.pop(event_type, None)
+        self._active = frozenset(self._fast) | frozenset(self._weak)
+
+    def _resolve(self, event_type: EventType) -> tuple[Callable[[Any], None], ...]:
+        """Dereference weak subscribers, pruning those whose object is gone."""
+        entries = self._weak[event_type]
+        live = tuple(cb for cb in map(_deref, entries) if cb is not None)
+        if len(live) != len(entries):
+            self._prune(event_type)
+        return live
+
+    def _prune(self, event_type: EventType) -> None:
+        """Remove weak subscribers whose object has been collected."""
         if event_type in self._listeners:
-            with contextlib.suppress(ValueError):
-                self._listeners[event_type].remove(callback)
+            self._listeners[event_type] = [
+                entry for entry in self._listeners[event_type] if _deref(entry) is not None
+            ]
+        self._rebuild(event_type)
 
     def publish(self, event_type: EventType, data: Any = None) -> None:
         """Publish an event to all subscribers.
@@ -200,17 +284,46 @@ class EventBus:
             event_type: The event type to publish
             data: Optional data to pass to subscribers
         """
-        for callback in self._listeners.get(event_type, []):
+        callbacks = self._fast.get(event_type)
+        if callbacks is None:
+            if event_type not in self._active:
+                return
+            callbacks = self._resolve(event_type)
+
+        # Single subscriber is the common case: skip the loop
+        if len(callbacks) == 1:
+            try:
+                callbacks[0](data)
+            except Exception:
+                self._log_handler_error(event_type, callbacks[0])
+            return
+
+        for callback in callbacks:
             # Don't let one subscriber's error break other subscribers
             try:
                 callback(data)
             except Exception:
-                logger.exception(
-                    "Exception in event handler for %s (callback: %s)",
-                    event_type.value,
-                    callback.__name__ if hasattr(callback, "__name__") else repr(callback),
-                )
+                self._log_handler_error(event_type, callback)
+
+    @staticmethod
+    def _log_handler_error(event_type: EventType, callback: Callable[[Any], None]) -> None:
+        """Log an exception raised by a subscriber (call from an except block)."""
+        logger.exception(
+            "Exception in event handler for %s (callback: %s)",
+            event_type.value,
+            callback.__name__ if hasattr(callback, "__name__") else repr(callback),
+        )
 
     def clear(self) -> None:
         """Clear all subscribers."""
         self._listeners.clear()
+        self._fast.clear()
+        self._weak.clear()
+        self._active = frozenset()
+
+
+def _deref(entry: _Listener) -> Callable[[Any], None] | None:
+    """Get the callable for a stored subscriber, or None if it was collected."""
+    if isinstance(entry, weakref.WeakMethod):
+        return entry()
+    return entry
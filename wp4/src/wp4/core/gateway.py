@@ -1,15 +1,19 @@
 """Bidirectional CAN gateway with delay and packet loss - core business logic."""
 
-import heapq
-import random
+import os
+import socket
+import struct
 import threading
 import time
+from array import array
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import can
 
 from wp4.core.bus_factory import BusFactory, get_default_factory
-from wp4.core.direction_stats import DirectionStats, create_direction_pair
+from wp4.core.direction_stats import DirectionStats, ScheduledEntry, create_direction_pair
+from wp4.core.manipulation import Action
 
 if TYPE_CHECKING:
     from can import BusABC
@@ -17,6 +21,96 @@ if TYPE_CHECKING:
     from wp4.core.gateway_logger import GatewayLogger
     from wp4.core.manipulation import ManipulationEngine
 
+# SocketCAN frame layout (struct can_frame / canfd_frame): can_id, len, pad, data
+_CAN_FRAME_HEADER = struct.Struct("=IB3x")
+_CANFD_MTU = 72
+_CAN_EFF_FLAG = 0x80000000
+_CAN_RTR_FLAG = 0x40000000
+_CAN_ERR_FLAG = 0x20000000
+_CAN_EFF_MASK = 0x1FFFFFFF
+_CAN_SFF_MASK = 0x000007FF
+
+# Random draws are uniform 64-bit integers in [0, _RANDOM_RANGE)
+_RANDOM_RANGE = 1 << 64
+
+
+class _RandomPool:
+    """Batch of random 64-bit integers refilled from os.urandom.
+
+    Each receive thread owns one, so draws need no locking and the
+    per-frame cost is an array iteration step instead of an RNG call.
+    """
+
+    __slots__ = ("_size", "_values")
+
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._values = iter(())
+
+    def draw(self) -> int:
+        """Get the next random integer in [0, _RANDOM_RANGE)."""
+        value = next(self._values, None)
+        if value is None:
+            words = array("Q")
+            words.frombytes(os.urandom(self._size * words.itemsize))
+            self._values = iter(words)
+            value = next(self._values)
+        return value
+
+
+def _raw_can_socket(bus: "BusABC") -> socket.socket | None:
+    """Get the raw SocketCAN socket behind a bus, or None for other interfaces."""
+    sock = getattr(bus, "socket", None)
+    af_can = getattr(socket, "AF_CAN", None)
+    if isinstance(sock, socket.socket) and af_can is not None and sock.family == af_can:
+        return sock
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class _ReceiveConfig:
+    """Snapshot of the settings read for every received frame.
+
+    Receive threads keep one in a local and replace it only when the
+    gateway's config version changes.
+    """
+
+    delay_ns: int
+    jitter_ns: int
+    loss_threshold: int  # Draws below this are lost (loss_pct of _RANDOM_RANGE)
+    logger: "GatewayLogger | None"
+    manipulator: "ManipulationEngine | None"
+
+    @property
+    def passthrough(self) -> bool:
+        """Check if frames are forwarded unchanged and without delay."""
+        return not (self.delay_ns or self.jitter_ns or self.loss_threshold or self.manipulator)
+
+
+def _schedule_frame(
+    recv_ns: int, config: _ReceiveConfig, rng: _RandomPool, extra_delay_ns: int = 0
+) -> int:
+    """Decide the fate of a received frame from the loss, delay and jitter settings.
+
+    Args:
+        recv_ns: Monotonic receive time in nanoseconds
+        config: Settings snapshot of the receive thread
+        rng: Random pool of the receive thread
+        extra_delay_ns: Additional delay from manipulation rules
+
+    Returns:
+        Monotonic send time in nanoseconds, or -1 if the frame is lost
+    """
+    if config.loss_threshold and rng.draw() < config.loss_threshold:
+        return -1
+    send_ns = recv_ns + config.delay_ns + extra_delay_ns
+    jitter_ns = config.jitter_ns
+    if jitter_ns:
+        # Symmetric random delay between -jitter and +jitter; the modulo
+        # bias is negligible for spans far below 2**64
+        send_ns += rng.draw() % (jitter_ns * 2 + 1) - jitter_ns
+    return send_ns
+
 
 class BidirectionalGateway:
     """Bidirectional CAN gateway with delay and packet loss.
@@ -34,6 +128,7 @@ class BidirectionalGateway:
     """
 
     MAX_QUEUE_SIZE = 10000  # Drop oldest if queue exceeds this
+    RX_BATCH_SIZE = 64  # Max frames drained from a socket per drain cycle
 
     def __init__(
         self,
@@ -51,8 +146,13 @@ class BidirectionalGateway:
         self._delay_ms = delay_ms
         self._loss_pct = loss_pct
         self._jitter_ms = max(0.0, jitter_ms)
+        # Scheduler times are integer time.monotonic_ns() values
+        self._delay_ns = delay_ms * 1_000_000
+        self._jitter_ns = int(self._jitter_ms * 1_000_000)
         self._logger = logger
         self._manipulator = manipulator
+        # Bumped after any setting in _ReceiveConfig changes
+        self._config_version = 0
         self._bus_factory = bus_factory or get_default_factory()
         self._running = False
 
@@ -69,9 +169,9 @@ class BidirectionalGateway:
         # Per-direction statistics and state (encapsulated in DirectionStats)
         self._stats_0to1, self._stats_1to0 = create_direction_pair()
 
-        # Locks for thread-safe access to DirectionStats fields
-        self._stats_lock = threading.Lock()  # Protects counters
-        self._direction_lock = threading.Lock()  # Protects enabled flag
+        # Locks for thread-safe access to DirectionStats fields. Counters need
+        # none: each has a single writer thread (see DirectionStats). The enabled
+        # flag needs none either: it is a single attribute store/load.
         self._latency_lock = threading.Lock()  # Protects latency samples
 
         # Sync logger config if logger was provided
@@ -89,6 +189,8 @@ class BidirectionalGateway:
     @delay_ms.setter
     def delay_ms(self, value: int):
         self._delay_ms = value
+        self._delay_ns = value * 1_000_000
+        self._config_version += 1
         self._sync_logger_config()
 
     @property
@@ -98,6 +200,7 @@ class BidirectionalGateway:
     @loss_pct.setter
     def loss_pct(self, value: float):
         self._loss_pct = value
+        self._config_version += 1
         self._sync_logger_config()
 
     @property
@@ -107,8 +210,20 @@ class BidirectionalGateway:
     @jitter_ms.setter
     def jitter_ms(self, value: float):
         self._jitter_ms = max(0.0, value)
+        self._jitter_ns = int(self._jitter_ms * 1_000_000)
+        self._config_version += 1
         self._sync_logger_config()
 
+    def _receive_config(self) -> _ReceiveConfig:
+        """Snapshot the settings used by the receive threads."""
+        return _ReceiveConfig(
+            delay_ns=self._delay_ns,
+            jitter_ns=self._jitter_ns,
+            loss_threshold=int(self._loss_pct / 100 * _RANDOM_RANGE),
+            logger=self._logger,
+            manipulator=self._manipulator,
+        )
+
     def _sync_logger_config(self) -> None:
         """Sync current gateway config to logger for CSV output."""
         if self._logger:
@@ -127,6 +242,7 @@ class BidirectionalGateway:
             logger: GatewayLogger instance, or None to disable logging
         """
         self._logger = logger
+        self._config_version += 1
         self._sync_logger_config()
 
     @property
@@ -141,64 +257,50 @@ class BidirectionalGateway:
         """Get DirectionStats for the specified direction."""
         return self._stats_0to1 if direction == "0to1" else self._stats_1to0
 
-    # Statistics properties for 0→1 direction (thread-safe reads)
+    def get_direction_stats(self, direction: str) -> DirectionStats:
+        """Get the live DirectionStats for a direction.
+
+        The object is updated by the worker threads; treat it as read-only.
+
+        Args:
+            direction: '0to1' or '1to0'
+        """
+        return self._get_stats(direction)
+
+    # Statistics properties for 0→1 direction (lock-free reads)
     @property
     def received_0to1(self) -> int:
-        with self._stats_lock:
-            return self._stats_0to1.received
+        return self._stats_0to1.received
 
     @property
     def forwarded_0to1(self) -> int:
-        with self._stats_lock:
-            return self._stats_0to1.forwarded
+        return self._stats_0to1.forwarded
 
     @property
     def dropped_0to1(self) -> int:
-        with self._stats_lock:
-            return self._stats_0to1.dropped
+        return self._stats_0to1.total_dropped
 
     @property
     def queue_size_0to1(self) -> int:
         return self._stats_0to1.queue_size
 
-    # Statistics properties for 1→0 direction (thread-safe reads)
+    # Statistics properties for 1→0 direction (lock-free reads)
     @property
     def received_1to0(self) -> int:
-        with self._stats_lock:
-            return self._stats_1to0.received
+        return self._stats_1to0.received
 
     @property
     def forwarded_1to0(self) -> int:
-        with self._stats_lock:
-            return self._stats_1to0.forwarded
+        return self._stats_1to0.forwarded
 
     @property
     def dropped_1to0(self) -> int:
-        with self._stats_lock:
-            return self._stats_1to0.dropped
+        return self._stats_1to0.total_dropped
 
     @property
     def queue_size_1to0(self) -> int:
         return self._stats_1to0.queue_size
 
-    def _increment_received(self, direction: str) -> None:
-        """Thread-safe increment of received counter."""
-        with self._stats_lock:
-            stats = self._get_stats(direction)
-            stats.received += 1
-
-    def _increment_forwarded(self, direction: str) -> None:
-        """Thread-safe increment of forwarded counter."""
-        with self._stats_lock:
-            stats = self._get_stats(direction)
-            stats.forwarded += 1
-
-    def _increment_dropped(self, direction: str) -> None:
-        """Thread-safe increment of dropped counter."""
-        with self._stats_lock:
-            stats = self._get_stats(direction)
-            stats.dropped += 1
-
     def get_latency_samples(self, direction: str) -> list[float]:
         """Get latency samples for a direction (in microseconds)."""
         with self._latency_lock:
@@ -214,11 +316,10 @@ class BidirectionalGateway:
     def set_direction_enabled(self, direction: str, enabled: bool):
         """Enable or disable a specific direction ('0to1' or '1to0').
 
-        Thread-safe: Uses _direction_lock to prevent race conditions with _receive_loop.
+        Thread-safe: the flag is a single attribute store, read by _receive_loop
+        without a lock.
         """
-        with self._direction_lock:
-            stats = self._get_stats(direction)
-            stats.enabled = enabled
+        self._get_stats(direction).enabled = enabled
 
     def start(self):
         """Start the bidirectional gateway."""
@@ -244,10 +345,10 @@ class BidirectionalGateway:
 
         # Start receiver threads
         self._recv_thread_0 = threading.Thread(
-            target=self._receive_loop, args=(self._bus0, "0to1"), daemon=True
+            target=self._receive_loop, args=(self._bus0, self._bus1, "0to1"), daemon=True
         )
         self._recv_thread_1 = threading.Thread(
-            target=self._receive_loop, args=(self._bus1, "1to0"), daemon=True
+            target=self._receive_loop, args=(self._bus1, self._bus0, "1to0"), daemon=True
         )
 
         # Start sender threads
@@ -267,11 +368,9 @@ class BidirectionalGateway:
         """Stop the gateway and clean up resources."""
         self._running = False
 
-        # Wake up sender threads (notify_all to ensure all waiting threads wake up)
-        with self._stats_0to1.condition:
-            self._stats_0to1.condition.notify_all()
-        with self._stats_1to0.condition:
-            self._stats_1to0.condition.notify_all()
+        # Wake up sender threads blocked on their FIFO
+        self._stats_0to1.wake_sender()
+        self._stats_1to0.wake_sender()
 
         # Wait for threads to finish with increased timeout
         threads = [
@@ -297,113 +396,213 @@ class BidirectionalGateway:
         self._send_thread_0to1 = None
         self._send_thread_1to0 = None
 
-    def _receive_loop(self, bus: "BusABC", direction: str):
+    def _receive_loop(self, bus: "BusABC", send_bus: "BusABC", direction: str):
         """Receive messages and schedule them for delayed forwarding.
 
+        After a blocking receive, any frames already waiting in the socket are
+        drained without blocking (up to RX_BATCH_SIZE) and handed to the send
+        thread together.
+
+        On SocketCAN the drain reads raw frames from the bus socket into a
+        preallocated buffer, skipping python-can's per-frame recvmsg and
+        Message construction.
+
+        Without delay, jitter, loss or manipulation, frames are sent to
+        send_bus directly from this thread, bypassing the scheduler.
+
         Args:
             bus: The bus to receive from
+            send_bus: The bus the direction forwards to
             direction: '0to1' or '1to0'
         """
         stats = self._get_stats(direction)
+        sock = _raw_can_socket(bus)
+        frame_buf = bytearray(_CANFD_MTU)
+        rng = _RandomPool()
+        config_version = -1
+        config = self._receive_config()
+        passthrough = False
+        send_msg = can.Message()
 
         while self._running:
+            # Re-snapshot settings only after a setter changed them
+            if self._config_version != config_version:
+                config_version = self._config_version
+                config = self._receive_config()
+            # Switch to inline forwarding only once the send thread has finished
+            # every frame handed to it, so frames stay in order and only one
+            # thread sends and counts at a time
+            passthrough = config.passthrough and (passthrough or stats.sender_idle)
+
+            batch: list[ScheduledEntry] = []
+            received = 0
             try:
                 msg = bus.recv(timeout=0.1)
-                if msg is None:
-                    continue
-
-                # Check if this direction is enabled (thread-safe read)
-                with self._direction_lock:
-                    direction_enabled = stats.enabled
-                if not direction_enabled:
-                    continue
-
-                # Update received counter (thread-safe)
-                recv_time = time.time()
-                msg_data = bytes(msg.data)
-                self._increment_received(direction)
-
-                # Log RX event
-                if self._logger:
-                    self._logger.log_rx(
-                        direction, recv_time, msg.arbitration_id, msg_data, msg.is_extended_id
+                if msg is not None:
+                    received = 1
+                    entry = self._prepare_entry(
+                        config,
+                        rng,
+                        msg.arbitration_id,
+                        bytes(msg.data),
+                        msg.is_extended_id,
+                        direction,
+                        stats,
                     )
-
-                # Apply manipulation rules
-                extra_delay = 0.0
-                if self._manipulator:
-                    from wp4.core.manipulation import Action
-
-                    action, msg_data, extra_delay = self._manipulator.process(
-                        msg.arbitration_id, msg_data, direction
-                    )
-                    if action == Action.DROP:
-                        self._increment_dropped(direction)
-                        if self._logger:
-                            self._logger.log_drop(
-                                direction,
-                                recv_time,
+                    if entry is not None:
+                        batch.append(entry)
+                    if sock is not None:
+                        received += self._drain_socket(
+                            sock, frame_buf, config, rng, direction, stats, batch
+                        )
+                    else:
+                        while received < self.RX_BATCH_SIZE:
+                            msg = bus.recv(timeout=0.0)
+                            if msg is None:
+                                break
+                            received += 1
+                            entry = self._prepare_entry(
+                                config,
+                                rng,
                                 msg.arbitration_id,
-                                msg_data,
+                                bytes(msg.data),
                                 msg.is_extended_id,
+                                direction,
+                                stats,
                             )
-                        continue
-
-                # Simulate packet loss
-                if self._loss_pct > 0 and random.random() * 100 < self._loss_pct:
-                    self._increment_dropped(direction)
-                    # Log DROP event
-                    if self._logger:
-                        self._logger.log_drop(
-                            direction, recv_time, msg.arbitration_id, msg_data, msg.is_extended_id
-                        )
-                    continue
-
-                # Schedule for delayed sending with optional jitter
-                base_delay = self._delay_ms / 1000.0
-                # Jitter: symmetric random delay between -jitter_ms and +jitter_ms
-                jitter = (
-                    random.uniform(-self._jitter_ms, self._jitter_ms) / 1000.0
-                    if self._jitter_ms > 0
-                    else 0.0
-                )
-                # Include extra delay from manipulation rules
-                rule_delay = extra_delay / 1000.0
-                send_time = recv_time + base_delay + jitter + rule_delay
-
-                with stats.condition:
-                    # Drop oldest if queue is too large
-                    while stats.queue_size >= self.MAX_QUEUE_SIZE:
-                        heapq.heappop(stats.queue)
-                        self._increment_dropped(direction)
-
-                    heapq.heappush(
-                        stats.queue,
-                        (
-                            send_time,
-                            recv_time,
-                            msg.arbitration_id,
-                            msg_data,
-                            msg.is_extended_id,
-                        ),
-                    )
-                    stats.condition.notify()
-
-                    # Log QUEUE event
-                    if self._logger:
-                        self._logger.log_queue(
-                            direction,
-                            recv_time,
-                            msg.arbitration_id,
-                            msg_data,
-                            msg.is_extended_id,
-                            send_time,
-                        )
-
+                            if entry is not None:
+                                batch.append(entry)
             except Exception:
                 if not self._running:
                     break
 
+            if batch and passthrough:
+                for entry in batch:
+                    self._transmit(send_bus, send_msg, entry, direction, stats)
+            elif batch:
+                dropped = stats.push_batch(batch, self.MAX_QUEUE_SIZE)
+                if dropped:
+                    stats.dropped += dropped
+
+    def _drain_socket(
+        self,
+        sock: socket.socket,
+        frame_buf: bytearray,
+        config: _ReceiveConfig,
+        rng: _RandomPool,
+        direction: str,
+        stats: DirectionStats,
+        batch: list[ScheduledEntry],
+    ) -> int:
+        """Read frames already waiting on a SocketCAN socket without blocking.
+
+        Args:
+            sock: Raw SocketCAN socket of the bus
+            frame_buf: Reusable buffer of at least _CANFD_MTU bytes
+            config: Settings snapshot of the receive thread
+            rng: Random pool of the receive thread
+            direction: '0to1' or '1to0'
+            stats: DirectionStats for the direction
+            batch: List the prepared entries are appended to
+
+        Returns:
+            Number of frames read, error frames included (at most RX_BATCH_SIZE - 1)
+        """
+        # Payloads are copied out once through the view; frame_buf is reused for
+        # the next frame while the entry may still be queued or logged
+        frame_view = memoryview(frame_buf)
+        read = 0
+        while read < self.RX_BATCH_SIZE - 1:
+            try:
+                sock.recv_into(frame_buf, _CANFD_MTU, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                break
+            read += 1
+            can_id, length = _CAN_FRAME_HEADER.unpack_from(frame_buf)
+            if can_id & _CAN_ERR_FLAG:  # Error frames are not forwarded
+                continue
+            if can_id & _CAN_RTR_FLAG:  # Remote frames carry no payload, as with python-can
+                length = 0
+            is_ext = bool(can_id & _CAN_EFF_FLAG)
+            entry = self._prepare_entry(
+                config,
+                rng,
+                can_id & (_CAN_EFF_MASK if is_ext else _CAN_SFF_MASK),
+                bytes(frame_view[8 : 8 + length]),
+                is_ext,
+                direction,
+                stats,
+            )
+            if entry is not None:
+                batch.append(entry)
+        return read
+
+    def _prepare_entry(
+        self,
+        config: _ReceiveConfig,
+        rng: _RandomPool,
+        arb_id: int,
+        msg_data: bytes,
+        is_ext: bool,
+        direction: str,
+        stats: DirectionStats,
+    ) -> ScheduledEntry | None:
+        """Apply direction, manipulation and loss handling to a received frame.
+
+        Args:
+            config: Settings snapshot of the receive thread
+            rng: Random pool of the receive thread
+            arb_id: Arbitration ID of the received frame
+            msg_data: Frame payload, queued as is
+            is_ext: True for an extended (29-bit) ID
+            direction: '0to1' or '1to0'
+            stats: DirectionStats for the direction
+
+        Returns:
+            Scheduled entry to queue, or None if the frame is not forwarded
+        """
+        # Check if this direction is enabled (atomic attribute read)
+        if not stats.enabled:
+            return None
+
+        # Update received counter
+        recv_ns = time.monotonic_ns()
+        stats.received += 1
+
+        # Every received frame gets one BLF entry: from log_tx when forwarded
+        # (which also writes the receive time to CSV), from log_drop when dropped.
+        # The logger takes the monotonic ns times as they are.
+        logger = config.logger
+
+        # Apply manipulation rules
+        extra_delay_ns = 0
+        manipulator = config.manipulator
+        if manipulator:
+            received_data = msg_data
+            action, msg_data, extra_delay = manipulator.process(arb_id, msg_data, direction)
+            if action == Action.DROP:
+                stats.dropped += 1
+                if logger and logger.is_enabled:
+                    logger.log_drop(direction, recv_ns, arb_id, msg_data, is_ext)
+                return None
+            # log_tx only has the modified payload, so keep the received one as an RX entry
+            if msg_data != received_data and logger and logger.is_enabled:
+                logger.log_rx(direction, recv_ns, arb_id, received_data, is_ext)
+            extra_delay_ns = int(extra_delay * 1_000_000)
+
+        # Simulate packet loss, then schedule with delay and jitter (integer nanoseconds)
+        send_ns = _schedule_frame(recv_ns, config, rng, extra_delay_ns)
+        if send_ns < 0:
+            stats.dropped += 1
+            # Log DROP event
+            if logger and logger.is_enabled:
+                logger.log_drop(direction, recv_ns, arb_id, msg_data, is_ext)
+            return None
+
+        # No QUEUE event either: GatewayLogger.log_queue is a no-op (the delay
+        # shows in the TX time), so it is not called for every queued frame
+        return (send_ns, recv_ns, arb_id, msg_data, is_ext)
+
     def _send_loop(self, bus: "BusABC", direction: str):
         """Send scheduled messages when their time comes.
 
@@ -412,55 +611,55 @@ class BidirectionalGateway:
             direction: '0to1' or '1to0'
         """
         stats = self._get_stats(direction)
+        # Owned by this thread only: refilled for every frame instead of reallocated
+        msg_to_send = can.Message()
 
         while self._running:
-            msg_to_send = None
-            recv_time = None
-
-            with stats.condition:
-                while self._running:
-                    now = time.time()
-
-                    if not stats.queue:
-                        stats.condition.wait(timeout=0.5)
-                        continue
-
-                    next_send_time = stats.queue[0][0]
-                    wait_time = next_send_time - now
-
-                    if wait_time <= 0:
-                        send_time, recv_time, arb_id, data, is_ext = heapq.heappop(stats.queue)
-                        msg_to_send = can.Message(
-                            arbitration_id=arb_id,
-                            data=data,
-                            is_extended_id=is_ext,
-                        )
-                        break
-                    else:
-                        stats.condition.wait(timeout=wait_time)
-
-            if msg_to_send:
-                assert recv_time is not None  # recv_time is set when msg_to_send is set
-                try:
-                    bus.send(msg_to_send)
-                    actual_send_time = time.time()
-
-                    # Record actual latency (in microseconds)
-                    latency_us = (actual_send_time - recv_time) * 1_000_000
-                    with self._latency_lock:
-                        stats.latency_samples.append(latency_us)
-
-                    self._increment_forwarded(direction)
-
-                    # Log TX event
-                    if self._logger:
-                        self._logger.log_tx(
-                            direction,
-                            actual_send_time,
-                            msg_to_send.arbitration_id,
-                            bytes(msg_to_send.data),
-                            msg_to_send.is_extended_id,
-                            latency_us,
-                        )
-                except Exception:
-                    self._increment_dropped(direction)
+            # Blocks until a frame is due; None on timeout or wake-up
+            entry = stats.next_due(self.MAX_QUEUE_SIZE)
+            if entry is None:
+                continue
+
+            self._transmit(bus, msg_to_send, entry, direction, stats)
+            stats.settled += 1
+
+    def _transmit(
+        self,
+        bus: "BusABC",
+        msg: can.Message,
+        entry: ScheduledEntry,
+        direction: str,
+        stats: DirectionStats,
+    ) -> None:
+        """Send a scheduled entry and record latency, counters and the TX log.
+
+        Args:
+            bus: The bus to send to
+            msg: Message owned by the calling thread, refilled in place
+            entry: Entry to send
+            direction: '0to1' or '1to0'
+            stats: DirectionStats for the direction
+        """
+        _, recv_ns, arb_id, data, is_ext = entry
+        msg.arbitration_id = arb_id
+        msg.is_extended_id = is_ext
+        msg.data[:] = data
+        msg.dlc = len(data)
+
+        try:
+            bus.send(msg)
+            actual_send_ns = time.monotonic_ns()
+
+            # Record actual latency (in microseconds)
+            latency_us = (actual_send_ns - recv_ns) / 1000
+            with self._latency_lock:
+                stats.latency_samples.append(latency_us)
+
+            stats.forwarded += 1
+
+            # Log TX event
+            logger = self._logger
+            if logger and logger.is_enabled:
+                logger.log_tx(direction, actual_send_ns, arb_id, data, is_ext, latency_us)
+        except Exception:
+            stats.tx_dropped += 1
@@ -10,20 +10,224 @@ BLF (Binary Logging Format) is an industry-standard format that:
 Additionally writes a CSV file with gateway-specific metadata:
 - RX/TX timestamps, latency, drop status
 - Configured delay, jitter, and loss percentage per message
+
+With metadata_format="binary" the metadata is written as fixed-size binary
+records (BINARY_RECORD) instead of CSV, which skips all per-row string
+formatting; LogExporter.binary_to_csv() converts such a file afterwards.
+
+The gateway logs one BLF frame per received message: at its TX time when
+forwarded (the RX time is recorded in the CSV row), at its RX time when
+dropped. A frame modified by a manipulation rule also gets an RX frame
+with the payload as received. Event timestamps are
+time.monotonic_ns() values; they are made relative to the log start only when
+written, so no wall clock is read per frame. The log_* methods only
+enqueue events; formatting and file I/O run in a background flusher thread
+so the gateway's forwarding threads never block on disk writes.
 """
 
 import csv
+import itertools
+import math
+import os
+import struct
+import threading
 import time
+import zlib
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import TextIO
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, BinaryIO, TextIO
 
 import can
-from can.io.blf import BLFWriter
+from can.io.blf import (
+    CAN_MESSAGE,
+    CAN_MSG_EXT,
+    LOG_CONTAINER,
+    NO_COMPRESSION,
+    TIME_ONE_NANS,
+    ZLIB_DEFLATE,
+    BLFWriter,
+)
+
+if TYPE_CHECKING:
+    from _csv import Writer
+
+
+# Queued log event: (event, direction, timestamp_ns, arb_id, data, is_extended, latency_us,
+# config). A threading.Event in the queue is a flush request, None stops the flusher.
+LogEvent = tuple[str, str, int, int, bytes, bool, "float | None", "GatewayConfig"]
+
+# Binary metadata file: BINARY_MAGIC, then one BINARY_RECORD per event with
+# seq, event, direction, is_extended, dlc, arb_id, rx_ns, tx_ns (relative to the
+# log start, -1 if none), delay_ms, jitter_ms, loss_pct, latency_us (NaN if
+# none) and the payload padded to 64 bytes (CAN FD).
+BINARY_MAGIC = b"WP4LOG\x01\x00"
+BINARY_RECORD = struct.Struct("<QBBBBIqqffff64s")
+BINARY_EVENTS = ("forwarded", "dropped")
+BINARY_DIRECTIONS = ("0to1", "1to0")
+
+# Formatted standard (11-bit) IDs, which make up most of the traffic
+_STD_ARB_IDS = tuple(f"0x{arb_id:03X}" for arb_id in range(0x800))
+
+
+class _FrameBLFWriter(BLFWriter):
+    """BLFWriter with a fast path for classic CAN frames.
+
+    log_frame() packs the object header and CAN_MESSAGE body of a frame with
+    a single struct call and no can.Message. The bookkeeping matches
+    BLFWriter._add_object(), so the file is the same as the one
+    on_message_received() writes for the same frames.
+
+    All objects are packed into one preallocated container buffer that is
+    reused for every container, instead of a list of byte strings joined
+    on each flush. The file is opened unbuffered and each log container is
+    written with a single os.writev() of its header, compressed data and
+    padding.
+    """
+
+    # OBJ_HEADER_BASE + OBJ_HEADER_V1 + CAN_MESSAGE, 16 bytes each (no padding)
+    _FRAME = struct.Struct("<4sHHLLLHHQHBBL8s")
+    # OBJ_HEADER_BASE + OBJ_HEADER_V1
+    _OBJECT = struct.Struct("<4sHHLLLHHQ")
+    # OBJ_HEADER_BASE + LOG_CONTAINER header
+    _CONTAINER = struct.Struct("<4sHHLLH6xL4x")
+
+    def __init__(
+        self, file: Path | str, max_container_size: int = BLFWriter.max_container_size
+    ) -> None:
+        """Create the BLF file.
+
+        Args:
+            file: Path of the BLF file
+            max_container_size: Uncompressed bytes per log container
+        """
+        super().__init__(
+            Path(file).open("wb", buffering=0),  # noqa: SIM115 - closed by stop()
+            max_container_size=max_container_size,
+        )
+        # Packed objects; _buffer_size bytes are in use. Room for a full
+        # container plus the object that overflows it, grown only for
+        # objects larger than that.
+        self._container = bytearray(max_container_size + 1024)
+
+    def log_frame(
+        self, channel: int, timestamp: float, arb_id: int, data: bytes, is_extended: bool
+    ) -> None:
+        """Add a classic CAN frame (at most 8 data bytes) to the log.
+
+        Args:
+            channel: Channel as in can.Message.channel (stored + 1, like BLFWriter)
+            timestamp: Timestamp in seconds
+            arb_id: CAN arbitration ID
+            data: Message data bytes
+            is_extended: True if extended CAN ID
+        """
+        if self.start_timestamp is None:
+            # Same millisecond truncation as BLFWriter._add_object()
+            self.start_timestamp = int(timestamp * 1000) / 1000
+        self.stop_timestamp = timestamp
+        offset = self._buffer_size
+        if offset + self._FRAME.size > len(self._container):
+            self._grow(self._FRAME.size)
+        self._FRAME.pack_into(
+            self._container,
+            offset,
+            b"LOBJ",
+            32,  # Header size
+            1,  # Header version
+            self._FRAME.size,
+            CAN_MESSAGE,
+            TIME_ONE_NANS,
+            0,
+            0,
+            max(int((timestamp - self.start_timestamp) * 1e9), 0),
+            channel + 1,
+            0,  # Flags (received frame)
+            len(data),
+            arb_id | CAN_MSG_EXT if is_extended else arb_id,
+            data,
+        )
+        self._buffer_size = offset + self._FRAME.size
+        self.object_count += 1
+        if self._buffer_size >= self.max_container_size:
+            self._flush()
 
+    def _add_object(self, obj_type: int, data: bytes, timestamp: float | None = None) -> None:
+        """Add any other BLF object (CAN FD frames, markers) to the container buffer.
 
-@dataclass
+        Same object layout and timestamps as BLFWriter._add_object().
+        """
+        if timestamp is None:
+            timestamp = self.stop_timestamp or time.time()
+        if self.start_timestamp is None:
+            self.start_timestamp = int(timestamp * 1000) / 1000
+        self.stop_timestamp = timestamp
+        obj_size = self._OBJECT.size + len(data)
+        padded_size = obj_size + len(data) % 4
+
+        offset = self._buffer_size
+        if offset + padded_size > len(self._container):
+            self._grow(padded_size)
+        self._OBJECT.pack_into(
+            self._container,
+            offset,
+            b"LOBJ",
+            32,
+            1,
+            obj_size,
+            obj_type,
+            TIME_ONE_NANS,
+            0,
+            0,
+            max(int((timestamp - self.start_timestamp) * 1e9), 0),
+        )
+        self._container[offset + self._OBJECT.size : offset + obj_size] = data
+        self._container[offset + obj_size : offset + padded_size] = bytes(padded_size - obj_size)
+        self._buffer_size = offset + padded_size
+        self.object_count += 1
+        if self._buffer_size >= self.max_container_size:
+            self._flush()
+
+    def _grow(self, size: int) -> None:
+        """Make room for an object of size bytes after the used part of the buffer."""
+        self._container.extend(bytes(self._buffer_size + size - len(self._container)))
+
+    def _flush(self) -> None:
+        """Compress the buffer into a log container and write it in one syscall.
+
+        Writes the same container as BLFWriter._flush(), which issues four
+        write() calls per container.
+        """
+        size = self._buffer_size
+        if self.file.closed or not size:
+            return
+        used = min(size, self.max_container_size)
+        with memoryview(self._container) as view:
+            uncompressed = view[:used]
+            if self.compression_level:
+                data: bytes | memoryview = zlib.compress(uncompressed, self.compression_level)
+                method = ZLIB_DEFLATE
+            else:
+                data = uncompressed
+                method = NO_COMPRESSION
+
+            obj_size = self._CONTAINER.size + len(data)
+            header = self._CONTAINER.pack(b"LOBJ", 16, 1, obj_size, LOG_CONTAINER, method, used)
+            parts = [header, data, bytes(obj_size % 4)]
+            if hasattr(os, "writev"):
+                written = os.writev(self.file.fileno(), parts)
+                if written < obj_size + obj_size % 4:  # Short write, write the rest
+                    self.file.write(b"".join(parts)[written:])
+            else:
+                self.file.write(b"".join(parts))
+            # Data beyond the container size goes into the next container
+            tail = bytes(view[used:size])
+        self._container[: len(tail)] = tail
+        self._buffer_size = len(tail)
+        self.uncompressed_size += self._CONTAINER.size + used
+
+
+@dataclass(slots=True)
 class GatewayConfig:
     """Gateway configuration for CSV logging."""
 
@@ -64,6 +268,22 @@ class GatewayLogger:
         "1to0": 2,  # Direction 1→0 uses channel 2
     }
 
+    # Maximum number of events written per flusher wake-up
+    FLUSH_BATCH_SIZE = 256
+    # Events waiting for the flusher beyond this are dropped (see dropped_events)
+    MAX_PENDING_EVENTS = 1 << 16
+    # CSV file buffer size; the flusher pushes it to disk every FLUSH_INTERVAL seconds
+    CSV_BUFFER_SIZE = 1 << 20
+    FLUSH_INTERVAL = 0.5
+    # Binary records are packed into a chunk of about this size before each write
+    BINARY_CHUNK_SIZE = 1 << 16
+
+    # Uncompressed bytes per BLF log container; each container is one zlib call
+    # (python-can's default is 128 KiB)
+    BLF_CONTAINER_SIZE = 512 * 1024
+
+    METADATA_FORMATS = ("csv", "binary")
+
     CSV_COLUMNS = [
         "seq",
         "event",
@@ -79,24 +299,52 @@ class GatewayLogger:
         "latency_us",
     ]
 
-    def __init__(self, base_path: Path | str | None = None):
+    def __init__(self, base_path: Path | str | None = None, metadata_format: str = "csv"):
         """Initialize gateway logger.
 
         Args:
             base_path: Base directory for log files. If None, logging is disabled.
+            metadata_format: "csv" for a CSV metadata file, "binary" for
+                fixed-size binary records (.bin)
+
+        Raises:
+            ValueError: If metadata_format is unknown
         """
+        if metadata_format not in self.METADATA_FORMATS:
+            raise ValueError(f"Unknown metadata format: {metadata_format}")
         self._base_path = Path(base_path) if base_path else None
-        self._writer: BLFWriter | None = None
+        self._metadata_format = metadata_format
+        self._writer: _FrameBLFWriter | None = None
         self._csv_file: TextIO | None = None
-        self._csv_writer: csv.DictWriter | None = None
-        self._enabled = False
-        self._start_time: float | None = None
+        self._csv_writer: Writer | None = None
+        self._binary_file: BinaryIO | None = None
+        self._binary_buf = bytearray(
+            self.BINARY_CHUNK_SIZE // BINARY_RECORD.size * BINARY_RECORD.size
+        )
+        self._binary_offset = 0
+        # True while logging (start() to stop()). A plain attribute rather than
+        # a property, so callers can skip log calls per frame at no call cost.
+        self.is_enabled = False
+        self._start_ns: int | None = None
         self._blf_path: Path | None = None
         self._csv_path: Path | None = None
+        self._binary_path: Path | None = None
         self._iface0: str = ""
         self._iface1: str = ""
-        self._seq: int = 0
+        self._next_seq = itertools.count(1).__next__
         self._config = GatewayConfig()
+        # CSV delay/jitter/loss columns, formatted once per config (flusher only)
+        self._formatted_config = self._config
+        self._config_fields = self._format_config(self._config)
+        self._events: SimpleQueue[LogEvent | threading.Event | None] = SimpleQueue()
+        self._flush_thread: threading.Thread | None = None
+        self._dropped_events = 0
+        # One BLF message per direction with its channel preset, refilled by the
+        # flusher for CAN FD payloads (BLFWriter serializes it immediately)
+        self._blf_messages = {
+            direction: can.Message(channel=channel)
+            for direction, channel in self.CHANNEL_MAP.items()
+        }
 
     def set_log_path(self, path: Path | str | None) -> None:
         """Set or change the log path."""
@@ -117,6 +365,11 @@ class GatewayLogger:
         """
         self._config = GatewayConfig(delay_ms=delay_ms, jitter_ms=jitter_ms, loss_pct=loss_pct)
 
+    @staticmethod
+    def _format_config(config: GatewayConfig) -> tuple[str, str, str]:
+        """Format the config columns written to every CSV row."""
+        return f"{config.delay_ms:.1f}", f"{config.jitter_ms:.1f}", f"{config.loss_pct:.1f}"
+
     def start(self, iface0: str, iface1: str, custom_name: str | None = None) -> None:
         """Start logging to BLF and CSV files.
 
@@ -131,7 +384,7 @@ class GatewayLogger:
 
         self._iface0 = iface0
         self._iface1 = iface1
-        self._seq = 0
+        self._next_seq = itertools.count(1).__next__
 
         self._base_path.mkdir(parents=True, exist_ok=True)
 
@@ -140,26 +393,45 @@ class GatewayLogger:
             # Remove extension if present
             base_name = custom_name.removesuffix(".blf").removesuffix(".csv")
         else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             base_name = f"gateway_{iface0}_{iface1}_{timestamp}"
 
         self._blf_path = self._base_path / f"{base_name}.blf"
-        self._csv_path = self._base_path / f"{base_name}.csv"
 
         # Start BLF writer
-        self._writer = BLFWriter(str(self._blf_path))
-
-        # Start CSV writer
-        self._csv_file = self._csv_path.open("w", newline="", encoding="utf-8")
-        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.CSV_COLUMNS)
-        self._csv_writer.writeheader()
-
-        self._start_time = time.time()
-        self._enabled = True
+        self._writer = _FrameBLFWriter(self._blf_path, max_container_size=self.BLF_CONTAINER_SIZE)
+
+        if self._metadata_format == "binary":
+            # Records are packed into _binary_buf, so the file needs no buffer
+            self._binary_path = self._base_path / f"{base_name}.bin"
+            self._binary_file = self._binary_path.open("wb", buffering=0)
+            self._binary_file.write(BINARY_MAGIC)
+            self._binary_offset = 0
+        else:
+            # Start CSV writer
+            self._csv_path = self._base_path / f"{base_name}.csv"
+            self._csv_file = self._csv_path.open(
+                "w", buffering=self.CSV_BUFFER_SIZE, newline="", encoding="utf-8"
+            )
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(self.CSV_COLUMNS)
+
+        self._start_ns = time.monotonic_ns()
+        self._events = SimpleQueue()
+        self._dropped_events = 0
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, args=(self._events,), daemon=True
+        )
+        self._flush_thread.start()
+        self.is_enabled = True
 
     def stop(self) -> None:
-        """Stop logging and close BLF and CSV files."""
-        self._enabled = False
+        """Stop logging, write all queued events and close the log files."""
+        self.is_enabled = False
+        if self._flush_thread:
+            self._events.put(None)
+            self._flush_thread.join()
+            self._flush_thread = None
         if self._writer:
             self._writer.stop()
             self._writer = None
@@ -167,69 +439,255 @@ class GatewayLogger:
             self._csv_file.close()
             self._csv_file = None
             self._csv_writer = None
+        if self._binary_file:
+            self._flush_files()
+            self._binary_file.close()
+            self._binary_file = None
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Write all queued events and flush buffered data to disk.
 
-    def flush(self) -> None:
-        """Flush buffered data to disk."""
+        Args:
+            timeout: Maximum time to wait for the flusher thread in seconds
+        """
+        if self._flush_thread:
+            done = threading.Event()
+            self._events.put(done)
+            done.wait(timeout)
+        else:
+            self._flush_files()
+
+    def _enqueue(self, item: LogEvent) -> None:
+        """Queue an event for the flusher, dropping it if the flusher is too far behind."""
+        if self._events.qsize() >= self.MAX_PENDING_EVENTS:
+            self._dropped_events += 1
+            return
+        self._events.put(item)
+
+    def _flush_files(self) -> None:
+        """Push buffered metadata to disk (flusher thread, or when it is stopped)."""
         if self._csv_file:
             self._csv_file.flush()
+        if self._binary_file and self._binary_offset:
+            self._binary_file.write(memoryview(self._binary_buf)[: self._binary_offset])
+            self._binary_offset = 0
+
+    def _flush_loop(self, events: "SimpleQueue[LogEvent | threading.Event | None]") -> None:
+        """Write queued events to BLF and CSV in batches until stopped.
+
+        The metadata file is flushed at least every FLUSH_INTERVAL seconds so
+        the log can be followed while the gateway runs.
+
+        Args:
+            events: Queue filled by the log_* methods
+        """
+        next_flush = time.monotonic() + self.FLUSH_INTERVAL
+        while True:
+            batch: list[LogEvent | threading.Event | None] = []
+            try:
+                batch.append(events.get(timeout=self.FLUSH_INTERVAL))
+                while len(batch) < self.FLUSH_BATCH_SIZE:
+                    batch.append(events.get_nowait())
+            except Empty:
+                pass
+
+            rows = []
+            for item in batch:
+                if item is None:
+                    self._write_batch(rows)
+                    return
+                if isinstance(item, threading.Event):
+                    self._write_batch(rows)
+                    rows = []
+                    self._flush_files()
+                    item.set()
+                    continue
+                self._write_event(item, rows)
+            self._write_batch(rows)
+
+            now = time.monotonic()
+            if now >= next_flush:
+                self._flush_files()
+                next_flush = now + self.FLUSH_INTERVAL
+
+    def _write_event(self, item: LogEvent, rows: list[tuple]) -> None:
+        """Write one event to BLF and collect its CSV row or binary record.
+
+        Args:
+            item: Queued log event
+            rows: CSV rows of the current batch
+        """
+        event, direction, timestamp_ns, arb_id, data, is_extended, latency_us, config = item
+        rel_ns = timestamp_ns - self._start_ns if self._start_ns is not None else 0
+
+        # BLF gets every event; dropped frames at their RX time
+        if self._writer:
+            if len(data) <= 8:
+                self._writer.log_frame(
+                    self.CHANNEL_MAP.get(direction, 1), rel_ns * 1e-9, arb_id, data, is_extended
+                )
+            else:
+                self._write_blf_message(direction, rel_ns, arb_id, data, is_extended)
+
+        if event == "forwarded" and latency_us is not None:
+            # Calculate RX timestamp from TX timestamp and latency
+            rx_ns = rel_ns - round(latency_us * 1000)
+            tx_ns: int | None = rel_ns
+        elif event == "dropped":
+            rx_ns, tx_ns = rel_ns, None
+        else:
+            return
+
+        if self._binary_file:
+            self._pack_record(
+                event,
+                direction,
+                rx_ns,
+                tx_ns,
+                arb_id,
+                data,
+                is_extended,
+                config,
+                latency_us,
+            )
+            return
+
+        if config is not self._formatted_config:
+            self._formatted_config = config
+            self._config_fields = self._format_config(config)
+        rows.append(
+            self._csv_row(
+                event,
+                direction,
+                rx_ns,
+                tx_ns,
+                arb_id,
+                data,
+                is_extended,
+                self._config_fields,
+                latency_us,
+            )
+        )
+
+    def _write_blf_message(
+        self, direction: str, rel_ns: int, arb_id: int, data: bytes, is_extended: bool
+    ) -> None:
+        """Write a frame to BLF through a can.Message (payloads over 8 bytes)."""
+        if self._writer is None:
+            return
+        msg = self._blf_messages.get(direction)
+        if msg is None:  # Unknown direction, logged on channel 1
+            msg = self._blf_messages["0to1"]
+        msg.arbitration_id = arb_id
+        msg.is_extended_id = is_extended
+        msg.data[:] = data
+        msg.dlc = len(data)
+        msg.timestamp = rel_ns * 1e-9
+        self._writer.on_message_received(msg)
+
+    def _pack_record(
+        self,
+        event: str,
+        direction: str,
+        rx_ns: int,
+        tx_ns: int | None,
+        arb_id: int,
+        data: bytes,
+        is_extended: bool,
+        config: GatewayConfig,
+        latency_us: float | None,
+    ) -> None:
+        """Pack a binary metadata record into the chunk buffer.
+
+        Arguments are as for _csv_row; the full chunk is written to the file
+        before it would overflow.
+        """
+        offset = self._binary_offset
+        if offset + BINARY_RECORD.size > len(self._binary_buf):
+            self._flush_files()
+            offset = 0
+        BINARY_RECORD.pack_into(
+            self._binary_buf,
+            offset,
+            self._next_seq(),
+            BINARY_EVENTS.index(event),
+            1 if direction == "1to0" else 0,
+            is_extended,
+            len(data),
+            arb_id,
+            rx_ns,
+            tx_ns if tx_ns is not None else -1,
+            config.delay_ms,
+            config.jitter_ms,
+            config.loss_pct,
+            latency_us if latency_us is not None else math.nan,
+            data,
+        )
+        self._binary_offset = offset + BINARY_RECORD.size
+
+    def _write_batch(self, rows: list[tuple]) -> None:
+        """Write a batch of CSV rows in one call."""
+        if rows and self._csv_writer:
+            self._csv_writer.writerows(rows)
 
     def _format_arb_id(self, arb_id: int, is_extended: bool) -> str:
         """Format arbitration ID as hex string."""
         if is_extended:
             return f"0x{arb_id:08X}"
+        if arb_id < 0x800:
+            return _STD_ARB_IDS[arb_id]
         return f"0x{arb_id:03X}"
 
     def _format_data(self, data: bytes) -> str:
         """Format data bytes as hex string."""
-        return " ".join(f"{b:02X}" for b in data)
+        return data.hex(" ").upper()
 
-    def _write_csv_row(
+    def _csv_row(
         self,
         event: str,
         direction: str,
-        rx_ts: float | None,
-        tx_ts: float | None,
+        rx_ns: int | None,
+        tx_ns: int | None,
         arb_id: int,
         data: bytes,
         is_extended: bool,
+        config_fields: tuple[str, str, str],
         latency_us: float | None = None,
-    ) -> None:
-        """Write a row to the CSV file.
+    ) -> tuple:
+        """Build a CSV row for an event.
 
         Args:
             event: Event type ("forwarded" or "dropped")
             direction: "0to1" or "1to0"
-            rx_ts: Receive timestamp (absolute time.time() value)
-            tx_ts: Transmit timestamp (absolute), None for dropped messages
+            rx_ns: Receive time in ns since the log start
+            tx_ns: Transmit time in ns since the log start, None for dropped messages
             arb_id: CAN arbitration ID
             data: Message data bytes
             is_extended: True if extended CAN ID
+            config_fields: Formatted delay, jitter and loss when the event was logged
             latency_us: Actual latency in microseconds, None for dropped
-        """
-        if not self._csv_writer or not self._start_time:
-            return
 
-        self._seq += 1
-
-        # Convert absolute timestamps to relative (from start)
-        rx_rel = f"{rx_ts - self._start_time:.6f}" if rx_ts else ""
-        tx_rel = f"{tx_ts - self._start_time:.6f}" if tx_ts else ""
-
-        row = {
-            "seq": self._seq,
-            "event": event,
-            "direction": direction,
-            "rx_ts": rx_rel,
-            "tx_ts": tx_rel,
-            "arb_id": self._format_arb_id(arb_id, is_extended),
-            "dlc": len(data),
-            "data": self._format_data(data),
-            "delay_ms": f"{self._config.delay_ms:.1f}",
-            "jitter_ms": f"{self._config.jitter_ms:.1f}",
-            "loss_pct": f"{self._config.loss_pct:.1f}",
-            "latency_us": f"{latency_us:.1f}" if latency_us is not None else "",
-        }
-        self._csv_writer.writerow(row)
+        Returns:
+            Row tuple in CSV_COLUMNS order
+        """
+        rx_rel = f"{rx_ns / 1e9:.6f}" if rx_ns is not None else ""
+        tx_rel = f"{tx_ns / 1e9:.6f}" if tx_ns is not None else ""
+
+        delay_ms, jitter_ms, loss_pct = config_fields
+        return (
+            self._next_seq(),
+            event,
+            direction,
+            rx_rel,
+            tx_rel,
+            self._format_arb_id(arb_id, is_extended),
+            len(data),
+            self._format_data(data),
+            delay_ms,
+            jitter_ms,
+            loss_pct,
+            f"{latency_us:.1f}" if latency_us is not None else "",
+        )
 
     def _log_message(self, direction: str, msg: can.Message) -> None:
         """Internal method to log a CAN message to BLF.
@@ -238,23 +696,27 @@ class GatewayLogger:
             direction: "0to1" or "1to0"
             msg: The CAN message to log
         """
-        if not self._enabled or not self._writer:
+        if not self.is_enabled or not self._writer:
             return
 
-        # Set channel based on direction
-        msg.channel = self.CHANNEL_MAP.get(direction, 1)
-
-        # Set relative timestamp from start
-        if self._start_time:
-            msg.timestamp = time.time() - self._start_time
-
-        # Write message to BLF
-        self._writer.on_message_received(msg)
+        # Written by the flusher with the channel of the direction and a relative timestamp
+        self._enqueue(
+            (
+                "received",
+                direction,
+                time.monotonic_ns(),
+                msg.arbitration_id,
+                bytes(msg.data),
+                msg.is_extended_id,
+                None,
+                self._config,
+            )
+        )
 
     def log_rx(
         self,
         direction: str,
-        timestamp: float,
+        timestamp: int,
         arb_id: int,
         data: bytes,
         is_extended: bool,
@@ -263,49 +725,41 @@ class GatewayLogger:
 
         Args:
             direction: "0to1" or "1to0"
-            timestamp: Reception timestamp (time.time() value)
+            timestamp: Reception time (time.monotonic_ns() value)
             arb_id: CAN arbitration ID
             data: Message data bytes
             is_extended: True if extended CAN ID
         """
-        if not self._enabled or not self._writer:
+        if not self.is_enabled or not self._writer:
             return
 
-        msg = can.Message(
-            arbitration_id=arb_id,
-            data=data,
-            is_extended_id=is_extended,
-            channel=self.CHANNEL_MAP.get(direction, 1),
+        self._enqueue(
+            ("received", direction, timestamp, arb_id, data, is_extended, None, self._config)
         )
 
-        # Set relative timestamp
-        if self._start_time:
-            msg.timestamp = timestamp - self._start_time
-
-        self._writer.on_message_received(msg)
-
     def log_queue(
         self,
         direction: str,
-        timestamp: float,
+        timestamp: int,
         arb_id: int,
         data: bytes,
         is_extended: bool,
-        scheduled_time: float,
+        scheduled_time: int,
     ) -> None:
         """Log QUEUE event (message queued for delayed send).
 
-        Note: BLF format doesn't have a native "queue" event type.
-        This is logged as a regular message - the delay information
-        is implicit from the time difference between RX and TX events.
+        Note: BLF format doesn't have a native "queue" event type, so
+        nothing is logged - the delay information is implicit from the RX
+        and TX times of the forwarded frame. BidirectionalGateway does not
+        call this method.
 
         Args:
             direction: "0to1" or "1to0"
-            timestamp: Queue timestamp
+            timestamp: Queue time (time.monotonic_ns() value)
             arb_id: CAN arbitration ID
             data: Message data bytes
             is_extended: True if extended CAN ID
-            scheduled_time: When the message is scheduled to be sent
+            scheduled_time: When the message is scheduled to be sent (monotonic ns)
         """
         # QUEUE events are not logged in BLF - the delay is visible
         # from the time difference between RX and TX events
@@ -314,7 +768,7 @@ class GatewayLogger:
     def log_tx(
         self,
         direction: str,
-        timestamp: float,
+        timestamp: int,
         arb_id: int,
         data: bytes,
         is_extended: bool,
@@ -324,81 +778,59 @@ class GatewayLogger:
 
         Args:
             direction: "0to1" or "1to0"
-            timestamp: Transmission timestamp (time.time() value)
+            timestamp: Transmission time (time.monotonic_ns() value)
             arb_id: CAN arbitration ID
             data: Message data bytes
             is_extended: True if extended CAN ID
             latency_us: Actual latency in microseconds (for statistics)
         """
-        if not self._enabled:
+        if not self.is_enabled:
             return
 
-        # Calculate RX timestamp from TX timestamp and latency
-        rx_timestamp = timestamp - (latency_us / 1_000_000)
-
-        # Write to BLF
-        if self._writer:
-            msg = can.Message(
-                arbitration_id=arb_id,
-                data=data,
-                is_extended_id=is_extended,
-                channel=self.CHANNEL_MAP.get(direction, 1),
+        self._enqueue(
+            (
+                "forwarded",
+                direction,
+                timestamp,
+                arb_id,
+                data,
+                is_extended,
+                latency_us,
+                self._config,
             )
-            if self._start_time:
-                msg.timestamp = timestamp - self._start_time
-            self._writer.on_message_received(msg)
-
-        # Write to CSV
-        self._write_csv_row(
-            event="forwarded",
-            direction=direction,
-            rx_ts=rx_timestamp,
-            tx_ts=timestamp,
-            arb_id=arb_id,
-            data=data,
-            is_extended=is_extended,
-            latency_us=latency_us,
         )
 
     def log_drop(
         self,
         direction: str,
-        timestamp: float,
+        timestamp: int,
         arb_id: int,
         data: bytes,
         is_extended: bool,
     ) -> None:
-        """Log DROP event to CSV (message dropped due to packet loss or rule).
+        """Log DROP event (message dropped due to packet loss or rule).
 
-        Note: BLF doesn't have a native "drop" marker, so dropped messages
-        are only logged to CSV where they can be analyzed.
+        The frame is written to BLF like a received one, as BLF has no drop
+        marker; the CSV row marks it as dropped.
 
         Args:
             direction: "0to1" or "1to0"
-            timestamp: Drop timestamp (= RX timestamp)
+            timestamp: Drop time (= RX time, time.monotonic_ns() value)
             arb_id: CAN arbitration ID
             data: Message data bytes
             is_extended: True if extended CAN ID
         """
-        if not self._enabled:
+        if not self.is_enabled:
             return
 
-        # Write to CSV only (BLF doesn't support drop markers)
-        self._write_csv_row(
-            event="dropped",
-            direction=direction,
-            rx_ts=timestamp,
-            tx_ts=None,
-            arb_id=arb_id,
-            data=data,
-            is_extended=is_extended,
-            latency_us=None,
+        self._enqueue(
+            ("dropped", direction, timestamp, arb_id, data, is_extended, None, self._config)
         )
 
     @property
-    def is_enabled(self) -> bool:
-        """Check if logging is enabled."""
-        return self._enabled
+    def dropped_events(self) -> int:
+        """Get the number of events not logged because the flusher fell behind."""
+        return self._dropped_events
 
     def get_blf_path(self) -> Path | None:
         """Get path to current BLF file."""
@@ -408,6 +840,10 @@ class GatewayLogger:
         """Get path to current CSV file."""
         return self._csv_path
 
+    def get_binary_path(self) -> Path | None:
+        """Get path to current binary metadata file."""
+        return self._binary_path
+
     def get_log_paths(self) -> dict[str, Path | None]:
         """Get all log file paths.
 
@@ -415,11 +851,13 @@ class GatewayLogger:
             Dictionary with paths to all log files:
             - 'blf': Path to BLF file (CAN messages for CANalyzer)
             - 'csv': Path to CSV file (gateway metadata)
+            - 'binary': Path to binary metadata file (metadata_format="binary")
             - '0to1', '1to0': Same as 'blf' (for backward compatibility)
         """
         return {
             "blf": self._blf_path,
             "csv": self._csv_path,
+            "binary": self._binary_path,
             "0to1": self._blf_path,
             "1to0": self._blf_path,
         }
@@ -9,7 +9,7 @@ from wp4.core.gateway_logger import GatewayLogger
 from wp4.core.manipulation import ManipulationEngine, ManipulationRule
 
 
-@dataclass
+@dataclass(slots=True)
 class GatewayConfig:
     """Configuration for a CAN gateway."""
 
@@ -167,7 +167,8 @@ class GatewayManager:
             direction: '0to1' or '1to0'
 
         Returns:
-            Dictionary with received, forwarded, dropped, queue_size
+            Dictionary with received, forwarded, dropped, queue_size. A new
+            dictionary is returned on every call, so callers may keep it.
         """
         if self._gateway is None:
             return {
@@ -177,20 +178,14 @@ class GatewayManager:
                 "queue_size": 0,
             }
 
-        if direction == "0to1":
-            return {
-                "received": self._gateway.received_0to1,
-                "forwarded": self._gateway.forwarded_0to1,
-                "dropped": self._gateway.dropped_0to1,
-                "queue_size": self._gateway.queue_size_0to1,
-            }
-        else:
-            return {
-                "received": self._gateway.received_1to0,
-                "forwarded": self._gateway.forwarded_1to0,
-                "dropped": self._gateway.dropped_1to0,
-                "queue_size": self._gateway.queue_size_1to0,
-            }
+        # Read the live counters directly instead of through four gateway properties
+        stats = self._gateway.get_direction_stats(direction)
+        return {
+            "received": stats.received,
+            "forwarded": stats.forwarded,
+            "dropped": stats.total_dropped,
+            "queue_size": stats.queue_size,
+        }
 
     def get_latency_samples(self, direction: str) -> list[float]:
         """Get latency samples for a direction.
@@ -1,6 +1,11 @@
 """Interface manager - wraps CAN interface operations with event publishing."""
 
-import contextlib
+import atexit
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import ClassVar
 
 from wp4.core.events import EventBus, EventType
 from wp4.core.gateway_manager import GatewayConfig
@@ -17,8 +22,27 @@ class InterfaceManager:
 
     This class wraps lib.canif operations and prevents direct interface
     manipulation from GUI code. All state changes are published via EventBus.
+
+    Single-interface operations publish INTERFACE_STATE_CHANGED with
+    {"interface", "state"} (plus "error" on failure). Operations on both
+    interfaces run in parallel on a shared thread pool and publish one
+    INTERFACE_STATE_CHANGED from the calling thread with {"states"} mapping
+    each interface to its state (None on failure) and, if any failed,
+    {"errors"} mapping those interfaces to their error message.
+
+    Queried states are reused for STATE_CACHE_TTL seconds, so GUI polling
+    does not run `ip` on every call; bringing an interface up or down
+    refreshes its cached state. Fresh cached states are returned from the
+    calling thread; only expired ones are queried on the thread pool.
     """
 
+    # Seconds a queried interface state is reused for
+    STATE_CACHE_TTL = 0.1
+
+    # Shared by all managers, created on first use and shut down at exit
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    _executor_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, config: GatewayConfig, event_bus: EventBus):
         """Initialize interface manager.
 
@@ -28,19 +52,60 @@ class InterfaceManager:
         """
         self._config = config
         self._event_bus = event_bus
+        # Interface names in event order (the config's names are fixed)
+        self._ifaces = (config.iface0, config.iface1)
         self._bitrate = 500000  # Default bitrate
+        # Interface name -> (state, time.monotonic() of the query); written
+        # from pool threads, so only accessed under _cache_lock
+        self._state_cache: dict[str, tuple[CanInterfaceState | None, float]] = {}
+        self._cache_lock = threading.Lock()
 
-    def bring_up_interface(self, iface: str) -> None:
-        """Bring up a single interface with configured bitrate.
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared thread pool, creating it on first use."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="iface")
+            return cls._executor
+
+    @classmethod
+    def shutdown_executor(cls) -> None:
+        """Shut down the shared thread pool, waiting for running operations.
+
+        Runs at interpreter exit; a later operation creates a new pool.
+        """
+        with cls._executor_lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _submit_both(
+        self, operation: Callable[[str], CanInterfaceState | None]
+    ) -> list[tuple[str, Future[CanInterfaceState | None]]]:
+        """Start an operation on both configured interfaces in parallel.
 
         Args:
-            iface: Interface name to bring up
+            operation: Function called with the interface name
 
-        Publishes INTERFACE_STATE_CHANGED event.
+        Returns:
+            (interface name, future) pairs in interface order
+        """
+        executor = self._get_executor()
+        return [(iface, executor.submit(operation, iface)) for iface in self._ifaces]
+
+    def _publish_result(
+        self, iface: str, operation: Callable[[str], CanInterfaceState | None]
+    ) -> None:
+        """Run an interface operation and publish the state it left, or its error.
+
+        Args:
+            iface: Interface name
+            operation: Function called with the interface name, returns the new state
+
+        Publishes INTERFACE_STATE_CHANGED event; errors are re-raised.
         """
         try:
-            set_interface_up(iface, self._bitrate)
-            state = get_interface_state(iface)
+            state = operation(iface)
             self._event_bus.publish(
                 EventType.INTERFACE_STATE_CHANGED,
                 {"interface": iface, "state": state},
@@ -52,14 +117,85 @@ class InterfaceManager:
             )
             raise
 
+    def _publish_states(self, futures: list[tuple[str, Future[CanInterfaceState | None]]]) -> None:
+        """Wait for an operation on both interfaces and publish one event for both.
+
+        Args:
+            futures: (interface name, future) pairs from _submit_both
+
+        Publishes a single INTERFACE_STATE_CHANGED event; errors are not raised.
+        """
+        states: dict[str, CanInterfaceState | None] = {}
+        errors: dict[str, str] = {}
+        for iface, future in futures:
+            try:
+                states[iface] = future.result()
+            except Exception as e:
+                states[iface] = None
+                errors[iface] = str(e)
+
+        data: dict[str, dict] = {"states": states}
+        if errors:
+            data["errors"] = errors
+        self._event_bus.publish(EventType.INTERFACE_STATE_CHANGED, data)
+
+    def _query_state(self, iface: str) -> CanInterfaceState | None:
+        """Query the state of an interface and cache it."""
+        state = get_interface_state(iface)
+        with self._cache_lock:
+            self._state_cache[iface] = (state, time.monotonic())
+        return state
+
+    def _fresh_state(self, iface: str) -> tuple[bool, CanInterfaceState | None]:
+        """Look up a cached state younger than STATE_CACHE_TTL.
+
+        Returns:
+            (True, state) on a cache hit, (False, None) otherwise
+        """
+        with self._cache_lock:
+            cached = self._state_cache.get(iface)
+        if cached is not None and time.monotonic() - cached[1] < self.STATE_CACHE_TTL:
+            return True, cached[0]
+        return False, None
+
+    def _cached_state(self, iface: str) -> CanInterfaceState | None:
+        """Get the state of an interface, queried at most every STATE_CACHE_TTL seconds."""
+        hit, state = self._fresh_state(iface)
+        return state if hit else self._query_state(iface)
+
+    def _invalidate_state(self, iface: str) -> None:
+        """Drop the cached state of an interface."""
+        with self._cache_lock:
+            self._state_cache.pop(iface, None)
+
+    def _set_up(self, iface: str) -> CanInterfaceState | None:
+        """Bring up an interface and return its new state."""
+        self._invalidate_state(iface)
+        set_interface_up(iface, self._bitrate)
+        return self._query_state(iface)
+
+    def _set_down(self, iface: str) -> CanInterfaceState | None:
+        """Bring down an interface and return its new state."""
+        self._invalidate_state(iface)
+        set_interface_down(iface)
+        return self._query_state(iface)
+
+    def bring_up_interface(self, iface: str) -> None:
+        """Bring up a single interface with configured bitrate.
+
+        Args:
+            iface: Interface name to bring up
+
+        Publishes INTERFACE_STATE_CHANGED event.
+        """
+        self._publish_result(iface, self._set_up)
+
     def bring_up_interfaces(self) -> None:
-        """Bring up both interfaces with configured bitrate.
+        """Bring up both interfaces in parallel with configured bitrate.
 
-        Publishes INTERFACE_STATE_CHANGED events for each interface.
+        Publishes one INTERFACE_STATE_CHANGED event for both interfaces.
         """
-        for iface in [self._config.iface0, self._config.iface1]:
-            with contextlib.suppress(Exception):
-                self.bring_up_interface(iface)
+        self._publish_states(self._submit_both(self._set_up))
 
     def bring_down_interface(self, iface: str) -> None:
         """Bring down a single interface.
@@ -69,28 +205,14 @@ class InterfaceManager:
 
         Publishes INTERFACE_STATE_CHANGED event.
         """
-        try:
-            set_interface_down(iface)
-            state = get_interface_state(iface)
-            self._event_bus.publish(
-                EventType.INTERFACE_STATE_CHANGED,
-                {"interface": iface, "state": state},
-            )
-        except Exception as e:
-            self._event_bus.publish(
-                EventType.INTERFACE_STATE_CHANGED,
-                {"interface": iface, "state": None, "error": str(e)},
-            )
-            raise
+        self._publish_result(iface, self._set_down)
 
     def bring_down_interfaces(self) -> None:
-        """Bring down both interfaces.
+        """Bring down both interfaces in parallel.
 
-        Publishes INTERFACE_STATE_CHANGED events for each interface.
+        Publishes one INTERFACE_STATE_CHANGED event for both interfaces.
         """
-        for iface in [self._config.iface0, self._config.iface1]:
-            with contextlib.suppress(Exception):
-                self.bring_down_interface(iface)
+        self._publish_states(self._submit_both(self._set_down))
 
     def get_state(self, iface: str) -> CanInterfaceState | None:
         """Get current state of an interface.
@@ -101,18 +223,34 @@ class InterfaceManager:
         Returns:
             Current interface state or None if error
         """
-        return get_interface_state(iface)
+        return self._cached_state(iface)
 
     def get_states(self) -> dict[str, CanInterfaceState | None]:
         """Get states of both configured interfaces.
 
+        Fresh cached states are used as they are; if both interfaces need a
+        query, they are queried in parallel.
+
         Returns:
             Dictionary mapping interface names to their states
         """
-        return {
-            self._config.iface0: get_interface_state(self._config.iface0),
-            self._config.iface1: get_interface_state(self._config.iface1),
-        }
+        states: dict[str, CanInterfaceState | None] = {}
+        misses: list[str] = []
+        for iface in self._ifaces:
+            hit, state = self._fresh_state(iface)
+            if hit:
+                states[iface] = state
+            else:
+                misses.append(iface)
+
+        if len(misses) == 1:
+            states[misses[0]] = self._query_state(misses[0])
+        elif misses:
+            executor = self._get_executor()
+            futures = [(iface, executor.submit(self._query_state, iface)) for iface in misses]
+            for iface, future in futures:
+                states[iface] = future.result()
+        return {iface: states[iface] for iface in self._ifaces}
 
     def set_bitrate(self, bitrate: int) -> None:
         """Set bitrate for future interface operations.
@@ -129,3 +267,6 @@ class InterfaceManager:
             Bitrate in bits per second
         """
         return self._bitrate
+
+
+atexit.register(InterfaceManager.shutdown_executor)
@@ -5,14 +5,550 @@ Provides conversion from BLF (Binary Logging Format) to:
 - Human-readable text logs (for debugging)
 - Statistics extraction (message counts, duration, throughput)
 - Timing-accurate replay to a CAN bus
+
+Also converts binary gateway metadata (GatewayLogger metadata_format="binary")
+to the regular CSV format.
 """
 
+import contextlib
+import csv
+import heapq
+import math
+import mmap
+import operator
+import shutil
+import tempfile
+import zlib
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
 
 import can
 from can.io.asc import ASCWriter
-from can.io.blf import BLFReader
+from can.io.blf import (
+    CAN_ERROR_EXT,
+    CAN_ERROR_EXT_STRUCT,
+    CAN_FD_MESSAGE,
+    CAN_FD_MESSAGE_64,
+    CAN_FD_MSG_64_STRUCT,
+    CAN_FD_MSG_STRUCT,
+    CAN_MESSAGE,
+    CAN_MESSAGE2,
+    CAN_MSG_EXT,
+    CAN_MSG_STRUCT,
+    DIR,
+    FILE_HEADER_STRUCT,
+    LOG_CONTAINER,
+    LOG_CONTAINER_STRUCT,
+    NO_COMPRESSION,
+    OBJ_HEADER_BASE_STRUCT,
+    OBJ_HEADER_V1_STRUCT,
+    OBJ_HEADER_V2_STRUCT,
+    REMOTE_FLAG,
+    ZLIB_DEFLATE,
+    BLFParseError,
+    BLFReader,
+    systemtime_to_timestamp,
+)
+from can.io.generic import MessageWriter
+
+from wp4.core.gateway_logger import (
+    BINARY_DIRECTIONS,
+    BINARY_EVENTS,
+    BINARY_MAGIC,
+    BINARY_RECORD,
+    GatewayLogger,
+)
+
+# One CAN frame from a BLF file: (timestamp, channel, arbitration_id, is_extended_id, data)
+_Record = tuple[float, int, int, bool, bytes]
+
+# Text exports collect this many lines per write, into a file buffer of this size
+_WRITE_BATCH_LINES = 4096
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# export_all keeps up to this many parsed frames (about 180 bytes each) for its
+# second text export; larger logs are parsed again instead
+_EXPORT_CACHE_FRAMES = 100_000
+
+# Human-readable log line: timestamp, direction, ID, DLC, data (direction and ID come formatted)
+_HUMAN_READABLE_ROW = "[%.6f] %s | ID=%s | DLC=%d | DATA=%s\n"
+
+# Per-frame analysis row: number, timestamp (s), timestamp (ns), direction, ID, DLC, delta (us),
+# data. Direction and ID arrive already padded, as they repeat across frames.
+_ANALYSIS_ROW = "%6d | %18.9f | %18d | %s | %s | %3d | %12.3f | %s\n"
+
+# One classic CAN frame, ready for ASC: (timestamp, channel, event text after the timestamp)
+_ASCFrame = tuple[float, int, str]
+
+
+class _UnsupportedFrameError(Exception):
+    """A BLF object that only ASCWriter knows how to write (CAN FD or error frame)."""
+
+
+def _channel_int(raw: object) -> int:
+    """Get the channel number of a message.
+
+    Args:
+        raw: can.Message.channel, which can be int, str, Sequence, or None
+
+    Returns:
+        The channel as int, or 0 if it is not a number
+    """
+    # Exact type checks first: BLFReader always gives a plain int
+    if type(raw) is int:
+        return raw
+    if isinstance(raw, int):
+        return int(raw)
+    if isinstance(raw, str):
+        return int(raw) if raw.isdigit() else 0
+    return 0
+
+
+def _parse_frames(data: bytes, start_timestamp: float) -> tuple[list[_Record], int]:
+    """Decode the CAN frames in the uncompressed content of log containers.
+
+    Args:
+        data: Container content, possibly starting with the unparsed tail of
+            the previous container
+        start_timestamp: File start time that object timestamps are relative to
+
+    Returns:
+        The decoded frames and the offset of the first object that does not
+        end inside data (it continues in the next container)
+
+    Raises:
+        BLFParseError: If no object follows where one is expected
+    """
+    frames: list[_Record] = []
+    append = frames.append
+    unpack_base = OBJ_HEADER_BASE_STRUCT.unpack_from
+    end = len(data)
+    pos = 0
+
+    while True:
+        # Objects are padded, so the next one starts within a few bytes
+        obj_pos = data.find(b"LOBJ", pos, pos + 8)
+        if obj_pos < 0:
+            if pos + 8 > end:
+                return frames, pos
+            raise BLFParseError("Could not find next object")
+        if obj_pos + OBJ_HEADER_BASE_STRUCT.size > end:
+            return frames, pos
+        _, header_size, header_version, obj_size, obj_type = unpack_base(data, obj_pos)
+        next_pos = obj_pos + obj_size
+        if next_pos > end:
+            return frames, pos
+        pos = next_pos
+
+        body = obj_pos + OBJ_HEADER_BASE_STRUCT.size
+        if header_version == 1:
+            flags, _, _, timestamp = OBJ_HEADER_V1_STRUCT.unpack_from(data, body)
+            body += OBJ_HEADER_V1_STRUCT.size
+        elif header_version == 2:
+            flags, _, _, timestamp = OBJ_HEADER_V2_STRUCT.unpack_from(data, body)
+            body += OBJ_HEADER_V2_STRUCT.size
+        else:
+            continue
+        # Integer true division rounds exactly like BLFReader's Decimal scaling
+        timestamp = timestamp / (100_000 if flags == 1 else 1_000_000_000) + start_timestamp
+
+        if obj_type in (CAN_MESSAGE, CAN_MESSAGE2):
+            channel, flags, dlc, can_id, payload = CAN_MSG_STRUCT.unpack_from(data, body)
+            payload = b"" if flags & REMOTE_FLAG else payload[:dlc]
+        elif obj_type == CAN_FD_MESSAGE:
+            channel, flags, _, can_id, _, _, _, valid_bytes, payload = (
+                CAN_FD_MSG_STRUCT.unpack_from(data, body)
+            )
+            payload = b"" if flags & REMOTE_FLAG else payload[:valid_bytes]
+        elif obj_type == CAN_FD_MESSAGE_64:
+            members = CAN_FD_MSG_64_STRUCT.unpack_from(data, body)
+            channel, _, valid_bytes, _, can_id, _, fd_flags = members[:7]
+            if fd_flags & 0x0010:  # Remote frame
+                payload = b""
+            else:
+                payload_pos = body + CAN_FD_MSG_64_STRUCT.size
+                available = (members[13] or obj_size) - header_size - CAN_FD_MSG_64_STRUCT.size
+                payload = data[payload_pos : payload_pos + min(valid_bytes, available)]
+                payload = payload.ljust(valid_bytes, b"\x00")
+        elif obj_type == CAN_ERROR_EXT:
+            members = CAN_ERROR_EXT_STRUCT.unpack_from(data, body)
+            channel, dlc, can_id, payload = members[0], members[5], members[7], members[9]
+            payload = payload[:dlc]
+        else:
+            continue
+
+        append((timestamp, channel - 1, can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT), payload))
+
+
+def _iter_records(blf_path: Path) -> Iterator[_Record]:
+    """Iterate over the CAN frames of a BLF file without building messages.
+
+    A lighter alternative to BLFReader for exports that only need a few
+    fields: the file is memory-mapped and each object is unpacked in place.
+    Values are identical to the matching can.Message attributes from
+    BLFReader, including which objects are reported.
+
+    Args:
+        blf_path: Path to input BLF file
+
+    Yields:
+        (timestamp, channel, arbitration_id, is_extended_id, data) per frame
+
+    Raises:
+        BLFParseError: If the file is not a valid BLF file
+    """
+    return _iter_parsed(blf_path, _parse_frames)
+
+
+def _iter_parsed(
+    blf_path: Path, parse_frames: Callable[[bytes, float], tuple[list, int]]
+) -> Iterator:
+    """Iterate over the objects of a BLF file, as decoded by parse_frames.
+
+    Args:
+        blf_path: Path to input BLF file
+        parse_frames: Decoder for container content with the signature of
+            _parse_frames()
+
+    Yields:
+        The items parse_frames returns, in file order
+
+    Raises:
+        BLFParseError: If the file is not a valid BLF file
+    """
+    with blf_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header = FILE_HEADER_STRUCT.unpack_from(mm)
+        if header[0] != b"LOGG":
+            raise BLFParseError("Unexpected file format")
+        start_timestamp = systemtime_to_timestamp(header[14:22])
+        end = len(mm)
+        pos = header[1]
+        tail = b""
+
+        with memoryview(mm) as view:
+            while pos + OBJ_HEADER_BASE_STRUCT.size <= end:
+                signature, _, _, obj_size, obj_type = OBJ_HEADER_BASE_STRUCT.unpack_from(mm, pos)
+                if signature != b"LOBJ":
+                    raise BLFParseError()
+                content_pos = pos + OBJ_HEADER_BASE_STRUCT.size + LOG_CONTAINER_STRUCT.size
+                content_end = pos + obj_size
+                pos = content_end + obj_size % 4
+                if obj_type != LOG_CONTAINER:
+                    continue
+
+                method, _ = LOG_CONTAINER_STRUCT.unpack_from(
+                    mm, content_pos - LOG_CONTAINER_STRUCT.size
+                )
+                if method == ZLIB_DEFLATE:
+                    data = zlib.decompress(view[content_pos:content_end])
+                elif method == NO_COMPRESSION:
+                    data = mm[content_pos:content_end]
+                else:
+                    continue
+                if tail:
+                    data = tail + data
+
+                frames, parsed = parse_frames(data, start_timestamp)
+                tail = data[parsed:]
+                yield from frames
+
+
+def _parse_asc_frames(data: bytes, start_timestamp: float) -> tuple[list[_ASCFrame], int]:
+    """Decode container content straight into ASC event text.
+
+    Formats classic CAN data and remote frames exactly like ASCWriter does
+    for the messages BLFReader would return.
+
+    Args:
+        data: Container content, possibly starting with the unparsed tail of
+            the previous container
+        start_timestamp: File start time that object timestamps are relative to
+
+    Returns:
+        The formatted frames and the offset of the first object that does not
+        end inside data (it continues in the next container)
+
+    Raises:
+        BLFParseError: If no object follows where one is expected
+        _UnsupportedFrameError: If data contains a CAN FD or error frame
+    """
+    frames: list[_ASCFrame] = []
+    append = frames.append
+    unpack_base = OBJ_HEADER_BASE_STRUCT.unpack_from
+    unpack_msg = CAN_MSG_STRUCT.unpack_from
+    # Event text up to the data bytes, which repeats for every (channel, ID, flags, DLC)
+    prefixes: dict[tuple[int, int, int, int], str] = {}
+    end = len(data)
+    pos = 0
+
+    while True:
+        obj_pos = data.find(b"LOBJ", pos, pos + 8)
+        if obj_pos < 0:
+            if pos + 8 > end:
+                return frames, pos
+            raise BLFParseError("Could not find next object")
+        if obj_pos + OBJ_HEADER_BASE_STRUCT.size > end:
+            return frames, pos
+        _, _, header_version, obj_size, obj_type = unpack_base(data, obj_pos)
+        next_pos = obj_pos + obj_size
+        if next_pos > end:
+            return frames, pos
+        pos = next_pos
+
+        if obj_type != CAN_MESSAGE and obj_type != CAN_MESSAGE2:
+            if obj_type in (CAN_FD_MESSAGE, CAN_FD_MESSAGE_64, CAN_ERROR_EXT):
+                raise _UnsupportedFrameError(obj_type)
+            continue
+
+        body = obj_pos + OBJ_HEADER_BASE_STRUCT.size
+        if header_version == 1:
+            flags, _, _, timestamp = OBJ_HEADER_V1_STRUCT.unpack_from(data, body)
+            body += OBJ_HEADER_V1_STRUCT.size
+        elif header_version == 2:
+            flags, _, _, timestamp = OBJ_HEADER_V2_STRUCT.unpack_from(data, body)
+            body += OBJ_HEADER_V2_STRUCT.size
+        else:
+            continue
+        timestamp = timestamp / (100_000 if flags == 1 else 1_000_000_000) + start_timestamp
+
+        channel, flags, dlc, can_id, payload = unpack_msg(data, body)
+        key = (channel, can_id, flags, dlc)
+        prefix = prefixes.get(key)
+        if prefix is None:
+            arb_id = f"{can_id & 0x1FFFFFFF:X}" + ("x" if can_id & CAN_MSG_EXT else "")
+            direction = "Tx" if flags & DIR else "Rx"
+            dtype = "r" if flags & REMOTE_FLAG else "d"
+            # ASCWriter numbers channels from 1, BLFReader from 0
+            prefix = prefixes[key] = f"{channel}  {arb_id:<15} {direction:<4} {dtype} {dlc:x} "
+        if flags & REMOTE_FLAG:
+            append((timestamp, channel - 1, prefix))
+        else:
+            append((timestamp, channel - 1, prefix + payload[:dlc].hex(" ").upper()))
+
+
+def _asc_datetime(dt: datetime) -> str:
+    """Format a header date like ASCWriter (milliseconds, as CANoe requires)."""
+    return dt.strftime(ASCWriter.FORMAT_DATE.format(dt.microsecond // 1000 % 1000))
+
+
+class _ASCTextWriter:
+    """Write an ASC file from frames formatted by _parse_asc_frames().
+
+    Produces the same file as ASCWriter, without a can.Message per frame.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._file = path.open("w", buffering=_WRITE_BUFFER_SIZE)
+        self._lines = [
+            f"date {_asc_datetime(datetime.now())}\n",
+            "base hex  timestamps absolute\n",
+            "internal events logged\n",
+        ]
+        self._started: float | None = None
+
+    def __enter__(self) -> "_ASCTextWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, timestamp: float, text: str) -> None:
+        """Add one event line; the first one also opens the trigger block."""
+        started = self._started
+        if started is None:
+            started = self._started = timestamp
+            self._lines.append(
+                f"Begin Triggerblock {_asc_datetime(datetime.fromtimestamp(timestamp))}\n"
+            )
+            self._lines.append(" 0.000000 Start of measurement\n")
+        # Timestamps are relative to the first frame (ASCWriter keeps earlier ones absolute)
+        if timestamp >= started:
+            timestamp -= started
+        self._lines.append(f"{timestamp: 9.6f} {text}\n")
+        if len(self._lines) >= _WRITE_BATCH_LINES:
+            self._file.write("".join(self._lines))
+            self._lines.clear()
+
+    def close(self) -> None:
+        """Write the remaining lines and the end of the file, then close it."""
+        if self._file.closed:
+            return
+        self._lines.append("End TriggerBlock\n")
+        self._file.write("".join(self._lines))
+        self._lines.clear()
+        self._file.close()
+
+
+@dataclass(slots=True)
+class _BLFColumns:
+    """Fields of every message in a BLF file, stored column by column.
+
+    Column i of each array belongs to the i-th message in the file.
+    """
+
+    timestamps: array
+    channels: array
+    arb_ids: array
+    is_extended: array
+
+
+def _load_blf_columns(blf_path: Path) -> _BLFColumns:
+    """Read a BLF file once into per-field columns.
+
+    Args:
+        blf_path: Path to input BLF file
+
+    Returns:
+        The message fields as typed arrays
+    """
+    columns = _BLFColumns(array("d"), array("l"), array("L"), array("b"))
+    append_ts = columns.timestamps.append
+    append_ch = columns.channels.append
+    append_id = columns.arb_ids.append
+    append_ext = columns.is_extended.append
+
+    for timestamp, channel, arb_id, is_extended, _ in _iter_records(blf_path):
+        append_ts(timestamp)
+        append_ch(channel)
+        append_id(arb_id)
+        append_ext(is_extended)
+
+    return columns
+
+
+class _P2Quantile:
+    """Streaming estimate of one quantile with the P² algorithm.
+
+    Jain & Chlamtac (1985): five markers track the minimum, the maximum, the
+    quantile and two points around it, and are adjusted with a parabolic
+    fit as samples arrive. Memory does not grow with the number of samples.
+    """
+
+    __slots__ = ("_p", "_samples", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p: float) -> None:
+        self._p = p
+        self._samples: list[float] = []  # Until the markers are set up
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = (0.0, p / 2, p, (1 + p) / 2, 1.0)
+
+    def update(self, x: float) -> None:
+        """Add one sample."""
+        q = self._heights
+        if not q:
+            self._samples.append(x)
+            if len(self._samples) == 5:
+                q.extend(sorted(self._samples))
+            return
+
+        # Find the cell the sample falls in, extending the range if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._desired
+        for i, increment in enumerate(self._increments):
+            desired[i] += increment
+
+        # Move the middle markers one step towards their desired positions
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def value(self) -> float:
+        """Get the current estimate (exact while fewer than five samples were added)."""
+        if self._heights:
+            return self._heights[2]
+        ordered = sorted(self._samples)
+        return ordered[min(int(len(ordered) * self._p), len(ordered) - 1)] if ordered else 0.0
+
+
+class _DeltaStats:
+    """Min, max, mean and percentiles of inter-frame deltas.
+
+    Samples are kept and the percentiles are exact up to EXACT_LIMIT
+    samples. Past that, the kept samples are fed to P² estimators and
+    dropped, so memory stays bounded on arbitrarily long logs.
+    """
+
+    EXACT_LIMIT = 1_000_000
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self) -> None:
+        self._samples = array("d")
+        self._estimators: tuple[_P2Quantile, ...] = ()
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def add(self, delta: float) -> None:
+        """Add one delta."""
+        if not self._estimators:
+            self._samples.append(delta)
+            if len(self._samples) >= self.EXACT_LIMIT:
+                self._start_estimating()
+            return
+        self._count += 1
+        self._total += delta
+        self._min = min(self._min, delta)
+        self._max = max(self._max, delta)
+        for estimator in self._estimators:
+            estimator.update(delta)
+
+    def _start_estimating(self) -> None:
+        """Move the kept samples into running totals and quantile estimators."""
+        samples = self._samples
+        self._count = len(samples)
+        self._total = sum(samples)
+        self._min = min(samples)
+        self._max = max(samples)
+        self._estimators = tuple(_P2Quantile(p) for p in self.QUANTILES)
+        for estimator in self._estimators:
+            for delta in samples:
+                estimator.update(delta)
+        self._samples = array("d")
+
+    def summary(self) -> tuple[float, float, float, float, float, float]:
+        """Get (min, max, mean, p50, p95, p99), all 0.0 if no delta was added."""
+        if self._estimators:
+            p50, p95, p99 = (estimator.value() for estimator in self._estimators)
+            return self._min, self._max, self._total / self._count, p50, p95, p99
+
+        samples = self._samples
+        if not samples:
+            return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        p50, p95, p99 = (ordered[min(int(len(ordered) * p), last)] for p in self.QUANTILES)
+        return ordered[0], ordered[-1], sum(samples) / len(samples), p50, p95, p99
 
 
 class LogExporter:
@@ -36,7 +572,7 @@ class LogExporter:
     """
 
     @staticmethod
-    def blf_to_asc(blf_path: Path, output_path: Path | None = None) -> Path:
+    def blf_to_asc(blf_path: Path, output_path: Path | None = None, fast: bool = True) -> Path:
         """Convert BLF to ASC format for replay (single file, all channels).
 
         ASC (ASCII Logging Format) is Vector's text-based format that:
@@ -47,6 +583,9 @@ class LogExporter:
         Args:
             blf_path: Path to input BLF file
             output_path: Path for output ASC file (default: same name with .asc)
+            fast: Format classic CAN frames directly instead of through
+                ASCWriter (same output; logs with CAN FD or error frames
+                always go through ASCWriter)
 
         Returns:
             Path to created ASC file
@@ -54,6 +593,15 @@ class LogExporter:
         if output_path is None:
             output_path = blf_path.with_suffix(".asc")
 
+        if fast:
+            try:
+                with _ASCTextWriter(output_path) as text_writer:
+                    for timestamp, _, text in _iter_parsed(blf_path, _parse_asc_frames):
+                        text_writer.write(timestamp, text)
+                return output_path
+            except _UnsupportedFrameError:
+                pass  # Rewrite the whole file with ASCWriter
+
         with BLFReader(str(blf_path)) as reader, ASCWriter(str(output_path)) as writer:
             for msg in reader:
                 writer.on_message_received(msg)
@@ -65,6 +613,7 @@ class LogExporter:
         blf_path: Path,
         iface0: str = "can0",
         iface1: str = "can1",
+        fast: bool = True,
     ) -> dict[str, Path]:
         """Convert BLF to separate ASC files per channel for replay.
 
@@ -79,6 +628,9 @@ class LogExporter:
             blf_path: Path to input BLF file
             iface0: Name of first interface (for filename, e.g., "vcan0")
             iface1: Name of second interface (for filename, e.g., "vcan1")
+            fast: Format classic CAN frames directly instead of through
+                ASCWriter (same output; logs with CAN FD or error frames
+                always go through ASCWriter)
 
         Returns:
             Dictionary with paths to created ASC files:
@@ -94,48 +646,84 @@ class LogExporter:
         asc_ch1_path = parent / f"{stem}_{iface0}.asc"
         asc_ch2_path = parent / f"{stem}_{iface1}.asc"
 
-        # Collect messages by channel
-        ch1_messages: list[can.Message] = []
-        ch2_messages: list[can.Message] = []
-
-        with BLFReader(str(blf_path)) as reader:
-            for msg in reader:
-                raw_ch = msg.channel
-                if isinstance(raw_ch, int):
-                    ch = raw_ch
-                elif isinstance(raw_ch, str):
-                    ch = int(raw_ch) if raw_ch.isdigit() else 0
-                else:
-                    ch = 0
-
-                if ch == 1:
-                    ch1_messages.append(msg)
-                elif ch == 2:
-                    ch2_messages.append(msg)
-
-        # Write channel 1 ASC (iface0 traffic)
-        if ch1_messages:
-            with ASCWriter(str(asc_ch1_path)) as writer:
-                for msg in ch1_messages:
-                    writer.on_message_received(msg)
-        else:
-            # Create empty file with header
-            asc_ch1_path.write_text(f"; No messages for channel 1 ({iface0})\n")
-
-        # Write channel 2 ASC (iface1 traffic)
-        if ch2_messages:
-            with ASCWriter(str(asc_ch2_path)) as writer:
-                for msg in ch2_messages:
-                    writer.on_message_received(msg)
-        else:
-            # Create empty file with header
-            asc_ch2_path.write_text(f"; No messages for channel 2 ({iface1})\n")
+        # Route each message straight to its channel's writer. A writer is only
+        # opened once its channel has a message, so empty channels get a placeholder.
+        asc_paths = {1: asc_ch1_path, 2: asc_ch2_path}
+        written = None
+        if fast:
+            # On unsupported frames the files are rewritten with ASCWriter below
+            with contextlib.suppress(_UnsupportedFrameError):
+                written = LogExporter._write_asc_channels_fast(blf_path, asc_paths)
+        if written is None:
+            written = LogExporter._write_asc_channels(blf_path, asc_paths)
+
+        for ch, iface in ((1, iface0), (2, iface1)):
+            if ch not in written:
+                # Create empty file with header
+                asc_paths[ch].write_text(f"; No messages for channel {ch} ({iface})\n")
 
         return {
             "ch1": asc_ch1_path,
             "ch2": asc_ch2_path,
         }
 
+    @staticmethod
+    def _write_asc_channels(blf_path: Path, asc_paths: dict[int, Path]) -> set[int]:
+        """Write the messages of each channel to its ASC file with ASCWriter.
+
+        Args:
+            blf_path: Path to input BLF file
+            asc_paths: Output path per channel; other channels are skipped
+
+        Returns:
+            The channels that had messages (only their files are created)
+        """
+        # ExitStack.enter_context() hands the ASCWriter back typed as MessageWriter
+        writers: dict[int, MessageWriter] = {}
+
+        channel_int = _channel_int
+        with BLFReader(str(blf_path)) as reader, ExitStack() as stack:
+            for msg in reader:
+                ch = channel_int(msg.channel)
+                writer = writers.get(ch)
+                if writer is None:
+                    if ch not in asc_paths:
+                        continue
+                    writer = stack.enter_context(ASCWriter(str(asc_paths[ch])))
+                    writers[ch] = writer
+                writer.on_message_received(msg)
+
+        return set(writers)
+
+    @staticmethod
+    def _write_asc_channels_fast(blf_path: Path, asc_paths: dict[int, Path]) -> set[int]:
+        """Write the frames of each channel to its ASC file, bypassing ASCWriter.
+
+        Args:
+            blf_path: Path to input BLF file
+            asc_paths: Output path per channel; other channels are skipped
+
+        Returns:
+            The channels that had messages (only their files are created)
+
+        Raises:
+            _UnsupportedFrameError: If the log has frames only ASCWriter can
+                write; files written so far are incomplete
+        """
+        writers: dict[int, _ASCTextWriter] = {}
+
+        with ExitStack() as stack:
+            for timestamp, ch, text in _iter_parsed(blf_path, _parse_asc_frames):
+                writer = writers.get(ch)
+                if writer is None:
+                    if ch not in asc_paths:
+                        continue
+                    writer = stack.enter_context(_ASCTextWriter(asc_paths[ch]))
+                    writers[ch] = writer
+                writer.write(timestamp, text)
+
+        return set(writers)
+
     @staticmethod
     def blf_to_human_readable(blf_path: Path, output_path: Path | None = None) -> Path:
         """Convert BLF to human-readable text log.
@@ -150,6 +738,22 @@ class LogExporter:
             blf_path: Path to input BLF file
             output_path: Path for output log file (default: same name with .log)
 
+        Returns:
+            Path to created log file
+        """
+        return LogExporter._write_human_readable(_iter_records(blf_path), blf_path, output_path)
+
+    @staticmethod
+    def _write_human_readable(
+        records: Iterable[_Record], blf_path: Path, output_path: Path | None
+    ) -> Path:
+        """Write the human-readable text log for blf_to_human_readable().
+
+        Args:
+            records: Frames of the BLF file, in file order
+            blf_path: Path to the BLF file the records come from
+            output_path: Path for output log file (default: same name with .log)
+
         Returns:
             Path to created log file
         """
@@ -160,34 +764,38 @@ class LogExporter:
             1: "0→1",
             2: "1→0",
         }
+        # Padded direction and ID strings, formatted once per distinct value
+        direction_cols: dict[int, str] = {}
+        id_strs: dict[tuple[int, bool], str] = {}
+        row_fmt = _HUMAN_READABLE_ROW
 
-        with BLFReader(str(blf_path)) as reader, output_path.open("w") as f:
+        with output_path.open("w", buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(f"# Gateway Log - Exported from {blf_path.name}\n")
             f.write(f"# Exported: {datetime.now().isoformat()}\n")
             f.write("# Format: [timestamp] DIR | ID=0xXXX | DLC=N | DATA=XX XX ...\n")
             f.write("#" + "=" * 70 + "\n\n")
 
-            for msg in reader:
-                ts = f"{msg.timestamp:.6f}" if msg.timestamp else "0.000000"
-                # Channel can be int, str, Sequence, or None - extract int value
-                raw_ch = msg.channel
-                if isinstance(raw_ch, int):
-                    ch = raw_ch
-                elif isinstance(raw_ch, str):
-                    ch = int(raw_ch) if raw_ch.isdigit() else 0
-                else:
-                    ch = 0
-                direction = channel_names.get(ch, f"CH{ch}")
-
-                if msg.is_extended_id:
-                    id_str = f"0x{msg.arbitration_id:08X}"
-                else:
-                    id_str = f"0x{msg.arbitration_id:03X}"
-
-                data_str = " ".join(f"{b:02X}" for b in msg.data)
-                dlc = len(msg.data)
-
-                f.write(f"[{ts}] {direction:4} | ID={id_str} | DLC={dlc} | DATA={data_str}\n")
+            lines: list[str] = []
+            for timestamp, ch, arb_id, is_extended, data in records:
+                direction = direction_cols.get(ch)
+                if direction is None:
+                    name = channel_names.get(ch, f"CH{ch}")
+                    direction = direction_cols[ch] = f"{name:4}"
+
+                id_str = id_strs.get((arb_id, is_extended))
+                if id_str is None:
+                    id_str = f"0x{arb_id:08X}" if is_extended else f"0x{arb_id:03X}"
+                    id_strs[arb_id, is_extended] = id_str
+
+                # "or 0.0" prints a zero timestamp without a sign, as before
+                lines.append(
+                    row_fmt
+                    % (timestamp or 0.0, direction, id_str, len(data), data.hex(" ").upper())
+                )
+                if len(lines) >= _WRITE_BATCH_LINES:
+                    f.write("".join(lines))
+                    lines.clear()
+            f.write("".join(lines))
 
         return output_path
 
@@ -217,54 +825,33 @@ class LogExporter:
                 "last_timestamp": float,
             }
         """
+        columns = _load_blf_columns(blf_path)
+        total = len(columns.timestamps)
+
+        # Count (ID, extended) pairs first so each distinct ID is formatted once
+        id_counts = Counter(zip(columns.arb_ids, columns.is_extended, strict=True))
         stats: dict = {
-            "total_messages": 0,
-            "by_channel": {},
-            "by_arbitration_id": {},
+            "total_messages": total,
+            "by_channel": dict(Counter(columns.channels)),
+            "by_arbitration_id": {
+                (f"0x{arb_id:08X}" if is_ext else f"0x{arb_id:03X}"): count
+                for (arb_id, is_ext), count in id_counts.items()
+            },
             "duration_s": 0.0,
             "messages_per_second": 0.0,
             "first_timestamp": None,
             "last_timestamp": None,
         }
 
-        first_ts: float | None = None
-        last_ts: float | None = None
-
-        with BLFReader(str(blf_path)) as reader:
-            for msg in reader:
-                stats["total_messages"] += 1
-
-                # By channel (extract int value for consistent keys)
-                raw_ch = msg.channel
-                if isinstance(raw_ch, int):
-                    ch = raw_ch
-                elif isinstance(raw_ch, str):
-                    ch = int(raw_ch) if raw_ch.isdigit() else 0
-                else:
-                    ch = 0
-                stats["by_channel"][ch] = stats["by_channel"].get(ch, 0) + 1
-
-                # By arbitration ID (formatted as hex string)
-                if msg.is_extended_id:
-                    arb_id = f"0x{msg.arbitration_id:08X}"
-                else:
-                    arb_id = f"0x{msg.arbitration_id:03X}"
-                stats["by_arbitration_id"][arb_id] = stats["by_arbitration_id"].get(arb_id, 0) + 1
-
-                # Track timestamps
-                if msg.timestamp is not None:
-                    if first_ts is None:
-                        first_ts = msg.timestamp
-                    last_ts = msg.timestamp
-
         # Calculate duration and throughput
-        stats["first_timestamp"] = first_ts
-        stats["last_timestamp"] = last_ts
-
-        if first_ts is not None and last_ts is not None:
+        if total:
+            first_ts = columns.timestamps[0]
+            last_ts = columns.timestamps[-1]
+            stats["first_timestamp"] = first_ts
+            stats["last_timestamp"] = last_ts
             stats["duration_s"] = last_ts - first_ts
             if stats["duration_s"] > 0:
-                stats["messages_per_second"] = stats["total_messages"] / stats["duration_s"]
+                stats["messages_per_second"] = total / stats["duration_s"]
 
         return stats
 
@@ -319,14 +906,10 @@ class LogExporter:
         lines.append("")
         lines.append("Top 10 Arbitration IDs:")
 
-        # Sort by count, take top 10
-        sorted_ids = sorted(
-            stats["by_arbitration_id"].items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
+        # Top 10 by count, without sorting the whole histogram
+        top_ids = heapq.nlargest(10, stats["by_arbitration_id"].items(), key=operator.itemgetter(1))
 
-        for arb_id, count in sorted_ids:
+        for arb_id, count in top_ids:
             pct = (count / stats["total_messages"] * 100) if stats["total_messages"] > 0 else 0
             lines.append(f"  {arb_id}: {count:,} ({pct:.1f}%)")
 
@@ -350,6 +933,22 @@ class LogExporter:
             blf_path: Path to input BLF file
             output_path: Path for output file (default: same name with .analysis.log)
 
+        Returns:
+            Path to created analysis file
+        """
+        return LogExporter._write_detailed_analysis(_iter_records(blf_path), blf_path, output_path)
+
+    @staticmethod
+    def _write_detailed_analysis(
+        records: Iterable[_Record], blf_path: Path, output_path: Path | None
+    ) -> Path:
+        """Write the analysis file for blf_to_detailed_analysis().
+
+        Args:
+            records: Frames of the BLF file, in file order
+            blf_path: Path to the BLF file the records come from
+            output_path: Path for output file (default: same name with .analysis.log)
+
         Returns:
             Path to created analysis file
         """
@@ -357,139 +956,190 @@ class LogExporter:
             output_path = blf_path.with_suffix(".analysis.log")
 
         channel_names = {1: "0→1", 2: "1→0"}
+        # Padded direction and ID columns, formatted once per distinct value
+        direction_cols: dict[int, str] = {}
+        id_cols: dict[tuple[int, bool], str] = {}
+        row_fmt = _ANALYSIS_ROW
+
+        by_direction: Counter[int] = Counter()
+        by_id: Counter[int] = Counter()
+        deltas = _DeltaStats()
+        total = 0
+        first_ts = prev_ts = 0.0
+
+        # Single streaming pass: the summary depends on every frame, so the
+        # per-frame rows go to a scratch file and are appended after it
+        with tempfile.TemporaryFile(
+            "w+", buffering=_WRITE_BUFFER_SIZE, dir=output_path.parent
+        ) as rows:
+            lines: list[str] = []
+            # Channels and IDs of the lines not yet written, counted per batch
+            batch_channels: list[int] = []
+            batch_ids: list[int] = []
+            for total, (ts, ch, arb_id, is_ext, data) in enumerate(records, 1):
+                # Delta from previous frame in microseconds (0 for the first)
+                delta_us = 0.0
+                if total == 1:
+                    first_ts = ts
+                else:
+                    delta_us = (ts - prev_ts) * 1_000_000
+                    if delta_us > 0:
+                        deltas.add(delta_us)
+                prev_ts = ts
+                batch_channels.append(ch)
+                batch_ids.append(arb_id)
+
+                direction = direction_cols.get(ch)
+                if direction is None:
+                    name = channel_names.get(ch, f"CH{ch}")
+                    direction = direction_cols[ch] = f"{name:>4}"
+                id_col = id_cols.get((arb_id, is_ext))
+                if id_col is None:
+                    id_str = f"0x{arb_id:08X}" if is_ext else f"0x{arb_id:03X}"
+                    id_col = id_cols[arb_id, is_ext] = f"{id_str:>10}"
+                lines.append(
+                    row_fmt
+                    % (
+                        total,
+                        ts,
+                        int(ts * 1_000_000_000),
+                        direction,
+                        id_col,
+                        len(data),
+                        delta_us,
+                        data.hex(" ").upper(),
+                    )
+                )
+                if len(lines) >= _WRITE_BATCH_LINES:
+                    rows.write("".join(lines))
+                    lines.clear()
+                    by_direction.update(batch_channels)
+                    by_id.update(batch_ids)
+                    batch_channels.clear()
+                    batch_ids.clear()
+            rows.write("".join(lines))
+            by_direction.update(batch_channels)
+            by_id.update(batch_ids)
+
+            # Calculate timing statistics
+            min_delta, max_delta, avg_delta, p50_delta, p95_delta, p99_delta = deltas.summary()
+
+            duration = prev_ts - first_ts
+
+            # Write analysis file: summary first, then the buffered per-frame rows
+            with output_path.open("w", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write("=" * 100 + "\n")
+                f.write("GATEWAY LOG DETAILED ANALYSIS\n")
+                f.write("=" * 100 + "\n")
+                f.write(f"Source: {blf_path.name}\n")
+                f.write(f"Exported: {datetime.now().isoformat()}\n")
+                f.write("\n")
+
+                # Summary statistics
+                f.write("-" * 50 + "\n")
+                f.write("SUMMARY STATISTICS\n")
+                f.write("-" * 50 + "\n")
+                f.write(f"Total Messages:    {total:,}\n")
+                f.write(f"Duration:          {duration:.6f} s\n")
+                if duration > 0:
+                    f.write(f"Throughput:        {total / duration:.1f} msg/s\n")
+                f.write("\n")
+                f.write(f"Direction 0→1:     {by_direction.get(1, 0):,} messages\n")
+                f.write(f"Direction 1→0:     {by_direction.get(2, 0):,} messages\n")
+                f.write(f"Unique IDs:        {len(by_id)}\n")
+                f.write("\n")
+
+                # Timing statistics
+                f.write("-" * 50 + "\n")
+                f.write("INTER-FRAME TIMING (microseconds)\n")
+                f.write("-" * 50 + "\n")
+                f.write(f"Min Delta:         {min_delta:.3f} us\n")
+                f.write(f"Max Delta:         {max_delta:.3f} us\n")
+                f.write(f"Avg Delta:         {avg_delta:.3f} us\n")
+                f.write(f"P50 (Median):      {p50_delta:.3f} us\n")
+                f.write(f"P95:               {p95_delta:.3f} us\n")
+                f.write(f"P99:               {p99_delta:.3f} us\n")
+                f.write("\n")
+
+                # Per-ID statistics
+                f.write("-" * 50 + "\n")
+                f.write("MESSAGES BY ARBITRATION ID\n")
+                f.write("-" * 50 + "\n")
+                for arb_id, count in heapq.nlargest(20, by_id.items(), key=operator.itemgetter(1)):
+                    pct = count / total * 100 if total > 0 else 0
+                    f.write(f"  0x{arb_id:03X}: {count:6,} ({pct:5.1f}%)\n")
+                if len(by_id) > 20:
+                    f.write(f"  ... and {len(by_id) - 20} more IDs\n")
+                f.write("\n")
+
+                # Per-frame data with nanosecond timestamps
+                f.write("=" * 100 + "\n")
+                f.write("PER-FRAME DATA (Nanosecond Timestamps)\n")
+                f.write("=" * 100 + "\n")
+                f.write(
+                    f"{'#':>6} | {'Timestamp (s)':>18} | {'Timestamp (ns)':>18} | "
+                    f"{'Dir':>4} | {'ID':>10} | {'DLC':>3} | {'Delta (us)':>12} | Data\n"
+                )
+                f.write("-" * 100 + "\n")
 
-        # First pass: collect all messages and compute statistics
-        messages: list[dict] = []
-        prev_ts: float | None = None
+                rows.seek(0)
+                shutil.copyfileobj(rows, f)
 
-        with BLFReader(str(blf_path)) as reader:
-            for msg in reader:
-                ts = msg.timestamp or 0.0
-                raw_ch = msg.channel
-                if isinstance(raw_ch, int):
-                    ch = raw_ch
-                elif isinstance(raw_ch, str):
-                    ch = int(raw_ch) if raw_ch.isdigit() else 0
-                else:
-                    ch = 0
+                f.write("\n")
+                f.write("=" * 100 + "\n")
+                f.write("END OF ANALYSIS\n")
+                f.write("=" * 100 + "\n")
 
-                # Calculate delta from previous message
-                delta_us = 0.0
-                if prev_ts is not None:
-                    delta_us = (ts - prev_ts) * 1_000_000  # Convert to microseconds
-
-                messages.append(
-                    {
-                        "timestamp": ts,
-                        "timestamp_ns": int(ts * 1_000_000_000),  # Nanoseconds
-                        "channel": ch,
-                        "direction": channel_names.get(ch, f"CH{ch}"),
-                        "arb_id": msg.arbitration_id,
-                        "is_extended": msg.is_extended_id,
-                        "dlc": len(msg.data),
-                        "data": msg.data,
-                        "delta_us": delta_us,
-                    }
-                )
-                prev_ts = ts
+        return output_path
 
-        # Calculate statistics
-        total = len(messages)
-        by_direction = {1: 0, 2: 0}
-        by_id: dict[int, int] = {}
-        deltas: list[float] = []
-
-        for m in messages:
-            by_direction[m["channel"]] = by_direction.get(m["channel"], 0) + 1
-            by_id[m["arb_id"]] = by_id.get(m["arb_id"], 0) + 1
-            if m["delta_us"] > 0:
-                deltas.append(m["delta_us"])
-
-        # Calculate timing statistics
-        if deltas:
-            avg_delta = sum(deltas) / len(deltas)
-            min_delta = min(deltas)
-            max_delta = max(deltas)
-            sorted_deltas = sorted(deltas)
-            p50_delta = sorted_deltas[len(sorted_deltas) // 2]
-            p95_idx = int(len(sorted_deltas) * 0.95)
-            p99_idx = int(len(sorted_deltas) * 0.99)
-            p95_delta = sorted_deltas[min(p95_idx, len(sorted_deltas) - 1)]
-            p99_delta = sorted_deltas[min(p99_idx, len(sorted_deltas) - 1)]
-        else:
-            avg_delta = min_delta = max_delta = p50_delta = p95_delta = p99_delta = 0.0
-
-        duration = messages[-1]["timestamp"] - messages[0]["timestamp"] if messages else 0.0
-
-        # Write analysis file
-        with output_path.open("w") as f:
-            f.write("=" * 100 + "\n")
-            f.write("GATEWAY LOG DETAILED ANALYSIS\n")
-            f.write("=" * 100 + "\n")
-            f.write(f"Source: {blf_path.name}\n")
-            f.write(f"Exported: {datetime.now().isoformat()}\n")
-            f.write("\n")
-
-            # Summary statistics
-            f.write("-" * 50 + "\n")
-            f.write("SUMMARY STATISTICS\n")
-            f.write("-" * 50 + "\n")
-            f.write(f"Total Messages:    {total:,}\n")
-            f.write(f"Duration:          {duration:.6f} s\n")
-            f.write(f"Throughput:        {total / duration:.1f} msg/s\n" if duration > 0 else "")
-            f.write("\n")
-            f.write(f"Direction 0→1:     {by_direction.get(1, 0):,} messages\n")
-            f.write(f"Direction 1→0:     {by_direction.get(2, 0):,} messages\n")
-            f.write(f"Unique IDs:        {len(by_id)}\n")
-            f.write("\n")
-
-            # Timing statistics
-            f.write("-" * 50 + "\n")
-            f.write("INTER-FRAME TIMING (microseconds)\n")
-            f.write("-" * 50 + "\n")
-            f.write(f"Min Delta:         {min_delta:.3f} us\n")
-            f.write(f"Max Delta:         {max_delta:.3f} us\n")
-            f.write(f"Avg Delta:         {avg_delta:.3f} us\n")
-            f.write(f"P50 (Median):      {p50_delta:.3f} us\n")
-            f.write(f"P95:               {p95_delta:.3f} us\n")
-            f.write(f"P99:               {p99_delta:.3f} us\n")
-            f.write("\n")
-
-            # Per-ID statistics
-            f.write("-" * 50 + "\n")
-            f.write("MESSAGES BY ARBITRATION ID\n")
-            f.write("-" * 50 + "\n")
-            sorted_ids = sorted(by_id.items(), key=lambda x: x[1], reverse=True)
-            for arb_id, count in sorted_ids[:20]:
-                pct = count / total * 100 if total > 0 else 0
-                f.write(f"  0x{arb_id:03X}: {count:6,} ({pct:5.1f}%)\n")
-            if len(sorted_ids) > 20:
-                f.write(f"  ... and {len(sorted_ids) - 20} more IDs\n")
-            f.write("\n")
-
-            # Per-frame data with nanosecond timestamps
-            f.write("=" * 100 + "\n")
-            f.write("PER-FRAME DATA (Nanosecond Timestamps)\n")
-            f.write("=" * 100 + "\n")
-            f.write(
-                f"{'#':>6} | {'Timestamp (s)':>18} | {'Timestamp (ns)':>18} | "
-                f"{'Dir':>4} | {'ID':>10} | {'DLC':>3} | {'Delta (us)':>12} | Data\n"
-            )
-            f.write("-" * 100 + "\n")
+    @staticmethod
+    def binary_to_csv(binary_path: Path, output_path: Path | None = None) -> Path:
+        """Convert a binary gateway metadata file to CSV.
 
-            for i, m in enumerate(messages):
-                id_str = f"0x{m['arb_id']:08X}" if m["is_extended"] else f"0x{m['arb_id']:03X}"
-                data_hex = " ".join(f"{b:02X}" for b in m["data"])
-                f.write(
-                    f"{i + 1:6} | {m['timestamp']:18.9f} | {m['timestamp_ns']:18} | "
-                    f"{m['direction']:>4} | {id_str:>10} | {m['dlc']:3} | "
-                    f"{m['delta_us']:12.3f} | {data_hex}\n"
-                )
+        The CSV has the same columns and formatting as the one GatewayLogger
+        writes in its default "csv" metadata format.
 
-            f.write("\n")
-            f.write("=" * 100 + "\n")
-            f.write("END OF ANALYSIS\n")
-            f.write("=" * 100 + "\n")
+        Args:
+            binary_path: Path to input .bin file
+            output_path: Path for output CSV file (default: same name with .csv)
+
+        Returns:
+            Path to created CSV file
+
+        Raises:
+            ValueError: If the file is not a gateway binary metadata file
+        """
+        if output_path is None:
+            output_path = binary_path.with_suffix(".csv")
+
+        with binary_path.open("rb") as f:
+            if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+                raise ValueError(f"Not a gateway binary log: {binary_path}")
+            content = f.read()
+
+        usable = len(content) - len(content) % BINARY_RECORD.size
+        with output_path.open("w", newline="", encoding="utf-8") as out:
+            writer = csv.writer(out)
+            writer.writerow(GatewayLogger.CSV_COLUMNS)
+            for record in BINARY_RECORD.iter_unpack(memoryview(content)[:usable]):
+                seq, event, direction, is_ext, dlc, arb_id, rx_ns, tx_ns = record[:8]
+                delay_ms, jitter_ms, loss_pct, latency_us, data = record[8:]
+                writer.writerow(
+                    (
+                        seq,
+                        BINARY_EVENTS[event],
+                        BINARY_DIRECTIONS[direction],
+                        f"{rx_ns / 1e9:.6f}",
+                        f"{tx_ns / 1e9:.6f}" if tx_ns >= 0 else "",
+                        f"0x{arb_id:08X}" if is_ext else f"0x{arb_id:03X}",
+                        dlc,
+                        data[:dlc].hex(" ").upper(),
+                        f"{delay_ms:.1f}",
+                        f"{jitter_ms:.1f}",
+                        f"{loss_pct:.1f}",
+                        "" if math.isnan(latency_us) else f"{latency_us:.1f}",
+                    )
+                )
 
         return output_path
 
@@ -521,9 +1171,22 @@ class LogExporter:
             }
         """
         asc_files = LogExporter.blf_to_asc_per_channel(blf_path, iface0, iface1)
+
+        frames = _iter_records(blf_path)
+        head = list(islice(frames, _EXPORT_CACHE_FRAMES + 1))
+        if len(head) <= _EXPORT_CACHE_FRAMES:
+            # Whole log cached: both text exports share one parse
+            log_path = LogExporter._write_human_readable(head, blf_path, None)
+            analysis_path = LogExporter._write_detailed_analysis(head, blf_path, None)
+        else:
+            # Too large to keep: the log continues the same pass, the analysis
+            # streams the file again, so memory stays bounded
+            log_path = LogExporter._write_human_readable(chain(head, frames), blf_path, None)
+            analysis_path = LogExporter.blf_to_detailed_analysis(blf_path)
+
         return {
             "asc_ch1": asc_files["ch1"],
             "asc_ch2": asc_files["ch2"],
-            "log": LogExporter.blf_to_human_readable(blf_path),
-            "analysis": LogExporter.blf_to_detailed_analysis(blf_path),
+            "log": log_path,
+            "analysis": analysis_path,
         }
@@ -5,6 +5,8 @@ the gateway. Supports ID filtering, byte-level operations, and configurable
 masks for testing ECU behavior under modified traffic.
 """
 
+import operator
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -20,6 +22,25 @@ class Operation(Enum):
     SUB = "sub"  # Subtract value (with wraparound)
 
 
+# Result of each operation on an original byte and an operand, before masking to a byte
+_OPERATIONS: dict[Operation, Callable[[int, int], int]] = {
+    Operation.SET: lambda _original, value: value,
+    Operation.AND: operator.and_,
+    Operation.OR: operator.or_,
+    Operation.XOR: operator.xor,
+    Operation.ADD: operator.add,  # Masking wraps around
+    Operation.SUB: operator.sub,
+}
+
+
+# ID mask of rules that match a single CAN ID (the ManipulationRule default)
+_EXACT_ID_MASK = 0x7FF
+
+# Message directions as bits, and the directions each rule direction setting covers
+_DIRECTION_BITS = {"0to1": 1, "1to0": 2}
+_RULE_DIRECTION_MASKS = {"both": 3, "0to1": 1, "1to0": 2}
+
+
 class Action(Enum):
     """What to do with matching messages."""
 
@@ -42,19 +63,16 @@ class ByteManipulation:
             return
 
         original = data[self.byte_index]
+        data[self.byte_index] = _OPERATIONS[self.operation](original, self.value) & 0xFF
 
-        if self.operation == Operation.SET:
-            data[self.byte_index] = self.value & 0xFF
-        elif self.operation == Operation.AND:
-            data[self.byte_index] = original & self.value
-        elif self.operation == Operation.OR:
-            data[self.byte_index] = original | self.value
-        elif self.operation == Operation.XOR:
-            data[self.byte_index] = original ^ self.value
-        elif self.operation == Operation.ADD:
-            data[self.byte_index] = (original + self.value) & 0xFF
-        elif self.operation == Operation.SUB:
-            data[self.byte_index] = (original - self.value) & 0xFF
+    def table(self) -> bytes:
+        """Build the lookup table giving the result for each original byte value.
+
+        Returns:
+            256 bytes where entry n is the manipulated value of byte n
+        """
+        operation = _OPERATIONS[self.operation]
+        return bytes(operation(original, self.value) & 0xFF for original in range(256))
 
 
 @dataclass
@@ -65,6 +83,9 @@ class ManipulationRule:
     - Limit charge power: match ID 0x123, set byte[2] = 0x10
     - Block specific ID: match ID 0x456, action = DROP
     - Mask bits: match ID 0x789, AND byte[0] with 0xF0
+
+    The manipulations are compiled when the rule is created, so a rule is
+    replaced rather than edited in place to change them.
     """
 
     name: str  # Human-readable name
@@ -75,6 +96,47 @@ class ManipulationRule:
     manipulations: list[ByteManipulation] = field(default_factory=list)
     enabled: bool = True
     extra_delay_ms: float = 0.0  # For Action.DELAY
+    # (byte_index, table) with all manipulations of that byte fused into one lookup table
+    _byte_tables: tuple[tuple[int, bytes], ...] = field(init=False, repr=False, compare=False)
+    # (and_mask, xor_mask) applied to the whole little-endian payload, or None
+    _masks: tuple[int, int] | None = field(init=False, repr=False, compare=False)
+    # Direction bits this rule covers, and arb_id & _id_mask == _id_key for a matching ID
+    _direction_mask: int = field(init=False, repr=False, compare=False)
+    _id_mask: int = field(init=False, repr=False, compare=False)
+    _id_key: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._direction_mask = _RULE_DIRECTION_MASKS.get(self.direction, 0)
+        self._id_mask = self.can_id_mask if self.can_id >= 0 else 0
+        self._id_key = self.can_id & self._id_mask
+
+        tables: dict[int, bytes] = {}
+        for manip in self.manipulations:
+            table = manip.table()
+            previous = tables.get(manip.byte_index)
+            # Translating the earlier table applies this manipulation after it
+            tables[manip.byte_index] = table if previous is None else previous.translate(table)
+
+        # Any mix of SET/AND/OR/XOR on a byte reduces to (byte & keep) ^ flip. When every
+        # modified byte is like that and there are two or more, the whole payload is
+        # manipulated as one integer; otherwise the table lookups are cheaper.
+        bitwise: dict[int, tuple[int, int]] = {}
+        for byte_index, table in tables.items():
+            flip = table[0]
+            keep = table[0xFF] ^ flip
+            if byte_index >= 0 and table == bytes((x & keep) ^ flip for x in range(256)):
+                bitwise[byte_index] = (keep, flip)
+
+        self._masks = None
+        if len(bitwise) >= 2 and len(bitwise) == len(tables):
+            and_mask, xor_mask = -1, 0
+            for byte_index, (keep, flip) in bitwise.items():
+                shift = byte_index << 3
+                and_mask &= ~((~keep & 0xFF) << shift)
+                xor_mask |= flip << shift
+            self._masks = (and_mask, xor_mask)
+            tables = {}
+        self._byte_tables = tuple(tables.items())
 
     def matches(self, arb_id: int, msg_direction: str) -> bool:
         """Check if this rule matches the message.
@@ -86,18 +148,11 @@ class ManipulationRule:
         Returns:
             True if rule matches this message
         """
-        if not self.enabled:
-            return False
-
-        # Check direction
-        if self.direction != "both" and self.direction != msg_direction:
-            return False
-
-        # Check ID (with mask) - return False if ID doesn't match
-        if self.can_id >= 0:
-            return (arb_id & self.can_id_mask) == (self.can_id & self.can_id_mask)
-
-        return True
+        return bool(
+            self.enabled
+            and self._direction_mask & _DIRECTION_BITS.get(msg_direction, 0)
+            and arb_id & self._id_mask == self._id_key
+        )
 
     def apply(self, data: bytes) -> tuple[Action, bytes, float]:
         """Apply rule to message data.
@@ -111,13 +166,30 @@ class ManipulationRule:
         if self.action == Action.DROP:
             return (Action.DROP, data, 0.0)
 
-        # Apply byte manipulations
-        modified = bytearray(data)
-        for manip in self.manipulations:
-            manip.apply(modified)
-
         extra_delay = self.extra_delay_ms if self.action == Action.DELAY else 0.0
-        return (Action.FORWARD, bytes(modified), extra_delay)
+        if self._masks is None and not self._byte_tables:
+            # Nothing to manipulate (e.g. a DELAY-only rule): no copy of the payload
+            return (Action.FORWARD, data, extra_delay)
+
+        size = len(data)
+        if self._masks is not None:
+            and_mask, xor_mask = self._masks
+            value = (int.from_bytes(data, "little") & and_mask) ^ xor_mask
+            data = (value & ((1 << (size << 3)) - 1)).to_bytes(size, "little")
+
+        # Otherwise apply byte manipulations with one table lookup per modified byte
+        if self._byte_tables:
+            modified = bytearray(data)
+            for byte_index, table in self._byte_tables:
+                if byte_index < size:
+                    modified[byte_index] = table[modified[byte_index]]
+            data = bytes(modified)
+
+        return (Action.FORWARD, data, extra_delay)
+
+
+# Rule index entry: (position in the rule list, rule, direction mask, ID mask, ID key)
+_IndexedRule = tuple[int, ManipulationRule, int, int, int]
 
 
 class ManipulationEngine:
@@ -125,11 +197,18 @@ class ManipulationEngine:
 
     Rules are evaluated in order. First matching rule wins.
     If no rules match, message is forwarded unchanged.
+
+    Rules with a concrete CAN ID and the default exact mask are indexed by
+    that ID, so a message is only checked against its own exact rules plus
+    the masked and wildcard ones.
     """
 
     def __init__(self):
         self._rules: list[ManipulationRule] = []
         self._enabled = True
+        # (exact rules by ID, masked rules). Replaced as a whole on every rule change so the
+        # gateway threads never see a partial update.
+        self._index: tuple[dict[int, list[_IndexedRule]], list[_IndexedRule]] = ({}, [])
 
     @property
     def enabled(self) -> bool:
@@ -141,9 +220,43 @@ class ManipulationEngine:
         """Enable or disable manipulation."""
         self._enabled = value
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the rule index after the rule list changed."""
+        exact: dict[int, list[_IndexedRule]] = {}
+        masked: list[_IndexedRule] = []
+        for position, rule in enumerate(self._rules):
+            entry = (position, rule, rule._direction_mask, rule._id_mask, rule._id_key)
+            if rule.can_id >= 0 and rule.can_id_mask == _EXACT_ID_MASK:
+                exact.setdefault(rule._id_key, []).append(entry)
+            else:
+                masked.append(entry)
+        self._index = (exact, masked)
+
+    def _find_rule(self, arb_id: int, direction: str) -> ManipulationRule | None:
+        """Find the first rule in list order that matches a message."""
+        exact, masked = self._index
+        direction_bit = _DIRECTION_BITS.get(direction, 0)
+        found = None
+        found_position = 0
+        # Same test as ManipulationRule.matches, on the values cached in the index
+        for position, rule, direction_mask, id_mask, id_key in exact.get(
+            arb_id & _EXACT_ID_MASK, ()
+        ):
+            if direction_mask & direction_bit and arb_id & id_mask == id_key and rule.enabled:
+                found, found_position = rule, position
+                break
+        # A masked rule only wins if it comes before the exact match
+        for position, rule, direction_mask, id_mask, id_key in masked:
+            if found is not None and position > found_position:
+                break
+            if direction_mask & direction_bit and arb_id & id_mask == id_key and rule.enabled:
+                return rule
+        return found
+
     def add_rule(self, rule: ManipulationRule) -> None:
         """Add a rule to the engine."""
         self._rules.append(rule)
+        self._rebuild_index()
 
     def remove_rule(self, name: str) -> bool:
         """Remove a rule by name.
@@ -154,12 +267,14 @@ class ManipulationEngine:
         for i, rule in enumerate(self._rules):
             if rule.name == name:
                 del self._rules[i]
+                self._rebuild_index()
                 return True
         return False
 
     def clear_rules(self) -> None:
         """Remove all rules."""
         self._rules.clear()
+        self._rebuild_index()
 
     def get_rules(self) -> list[ManipulationRule]:
         """Get all rules."""
@@ -168,10 +283,13 @@ class ManipulationEngine:
     def set_rules(self, rules: list[ManipulationRule]) -> None:
         """Replace all rules."""
         self._rules = list(rules)
+        self._rebuild_index()
 
     def process(self, arb_id: int, data: bytes, direction: str) -> tuple[Action, bytes, float]:
         """Process a message through the rules.
 
+        The input data is never modified; byte manipulations work on a copy.
+
         Args:
             arb_id: Message arbitration ID
             data: Message data bytes
@@ -183,9 +301,9 @@ class ManipulationEngine:
         if not self._enabled:
             return (Action.FORWARD, data, 0.0)
 
-        for rule in self._rules:
-            if rule.matches(arb_id, direction):
-                return rule.apply(data)
+        rule = self._find_rule(arb_id, direction)
+        if rule is not None:
+            return rule.apply(data)
 
         # No matching rule - forward unchanged
         return (Action.FORWARD, data, 0.0)
@@ -203,8 +321,4 @@ class ManipulationEngine:
         if not self._enabled:
             return None
 
-        for rule in self._rules:
-            if rule.matches(arb_id, direction):
-                return rule
-
-        return None
+        return self._find_rule(arb_id, direction)
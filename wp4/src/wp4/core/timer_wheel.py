@@ -0,0 +1,180 @@
+"""Hashed timer wheel for scheduling delayed CAN frames.
+
+Entries are bucketed by integer send time (time.monotonic_ns() values) at a
+fixed resolution (about 1 ms by default).
+Adding an entry is a deque append, and popping takes from the earliest
+occupied bucket. A small heap of occupied bucket ticks (one item per
+bucket, not per frame) finds the next due bucket without scanning empty
+slots.
+
+Entries that would span more than one wheel revolution go to a coarse
+second level whose buckets are one revolution wide. A coarse bucket is
+moved into a small overflow heap only once it may hold the earliest
+entry, so far-future frames cost O(1) to add.
+
+Within a bucket entries are kept in insertion order, so ordering is exact
+only to the wheel resolution. Overflow heap items carry an insertion
+sequence number after the send time, so ties never compare the rest of
+the entry (such as payload bytes).
+"""
+
+import heapq
+from collections import deque
+from typing import Any
+
+# Entries are tuples whose first item is the send time (e.g. ScheduledEntry)
+WheelEntry = tuple[Any, ...]
+
+
+class TimerWheel:
+    """Timer wheel ordering tuple entries by their first item (send time).
+
+    Example:
+        wheel = TimerWheel()
+        wheel.add((send_ns, recv_ns, arb_id, data, is_ext))
+        if wheel and wheel.peek_time() <= time.monotonic_ns():
+            entry = wheel.pop()
+    """
+
+    __slots__ = (
+        "_coarse",
+        "_coarse_count",
+        "_coarse_ticks",
+        "_count",
+        "_mask",
+        "_max_tick",
+        "_overflow",
+        "_res_shift",
+        "_seq",
+        "_shift",
+        "_slots",
+        "_ticks",
+    )
+
+    def __init__(self, resolution: int = 1 << 20, slots: int = 1024):
+        """Initialize the wheel.
+
+        Args:
+            resolution: Bucket width in nanoseconds (power of two, so the
+                bucket index is a shift)
+            slots: Number of buckets (power of two); slots * resolution is
+                the span of send times the wheel holds before overflowing
+                to the coarse level
+
+        Raises:
+            ValueError: If resolution or slots is not a power of two
+        """
+        if resolution <= 0 or resolution & (resolution - 1):
+            msg = f"resolution must be a power of two, got {resolution}"
+            raise ValueError(msg)
+        if slots <= 0 or slots & (slots - 1):
+            msg = f"slots must be a power of two, got {slots}"
+            raise ValueError(msg)
+        self._res_shift = resolution.bit_length() - 1
+        self._mask = slots - 1
+        self._shift = slots.bit_length() - 1
+        self._slots: list[deque[WheelEntry]] = [deque() for _ in range(slots)]
+        self._ticks: list[int] = []  # Heap of occupied bucket ticks
+        self._max_tick = 0  # Upper bound of occupied ticks while _ticks is non-empty
+        self._count = 0
+        # Coarse level: one bucket per revolution, keyed by tick >> shift
+        self._coarse: dict[int, list[WheelEntry]] = {}
+        self._coarse_ticks: list[int] = []  # Heap of occupied coarse ticks
+        self._coarse_count = 0
+        # Entries from coarse buckets that may be due, as (send_time, seq, entry)
+        self._overflow: list[tuple[int, int, WheelEntry]] = []
+        self._seq = 0
+
+    def add(self, entry: WheelEntry) -> None:
+        """Schedule an entry at its send time (entry[0])."""
+        tick = entry[0] >> self._res_shift
+        ticks = self._ticks
+        if ticks:
+            # All occupied ticks must stay within one revolution so that
+            # each maps to its own slot
+            low = ticks[0] if ticks[0] < tick else tick
+            high = self._max_tick if self._max_tick > tick else tick
+            if high - low > self._mask:
+                self._add_coarse(tick >> self._shift, entry)
+                return
+            self._max_tick = high
+        else:
+            self._max_tick = tick
+
+        slot = self._slots[tick & self._mask]
+        if not slot:
+            heapq.heappush(ticks, tick)
+        slot.append(entry)
+        self._count += 1
+
+    def _add_coarse(self, coarse_tick: int, entry: WheelEntry) -> None:
+        """Park an entry in the coarse bucket for its revolution."""
+        bucket = self._coarse.get(coarse_tick)
+        if bucket is None:
+            self._coarse[coarse_tick] = [entry]
+            heapq.heappush(self._coarse_ticks, coarse_tick)
+        else:
+            bucket.append(entry)
+        self._coarse_count += 1
+
+    def _cascade(self) -> None:
+        """Move coarse buckets that may hold the earliest entry to the overflow heap."""
+        coarse_ticks = self._coarse_ticks
+        while coarse_ticks:
+            head = self._head_time()
+            # Entries in later revolutions than the current head can't be earlier
+            if head is not None and coarse_ticks[0] > head >> self._res_shift >> self._shift:
+                return
+            bucket = self._coarse.pop(heapq.heappop(coarse_ticks))
+            self._coarse_count -= len(bucket)
+            seq = self._seq
+            for entry in bucket:
+                heapq.heappush(self._overflow, (entry[0], seq, entry))
+                seq += 1
+            self._seq = seq
+
+    def _head_time(self) -> int | None:
+        """Get the earliest send time in the fine wheel and overflow heap."""
+        head = self._slots[self._ticks[0] & self._mask][0][0] if self._ticks else None
+        if self._overflow and (head is None or self._overflow[0][0] < head):
+            return self._overflow[0][0]
+        return head
+
+    def peek_time(self) -> int | None:
+        """Get the send time of the next entry pop() returns, or None if empty."""
+        if self._coarse_ticks:
+            self._cascade()
+        return self._head_time()
+
+    def pop(self) -> WheelEntry:
+        """Remove and return the next due entry.
+
+        Raises:
+            IndexError: If the wheel is empty
+        """
+        if self._coarse_ticks:
+            self._cascade()
+        ticks = self._ticks
+        if ticks:
+            slot = self._slots[ticks[0] & self._mask]
+            if not self._overflow or slot[0][0] <= self._overflow[0][0]:
+                entry = slot.popleft()
+                if not slot:
+                    heapq.heappop(ticks)
+                self._count -= 1
+                return entry
+        return heapq.heappop(self._overflow)[2]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for tick in self._ticks:
+            self._slots[tick & self._mask].clear()
+        self._ticks.clear()
+        self._overflow.clear()
+        self._coarse.clear()
+        self._coarse_ticks.clear()
+        self._count = 0
+        self._coarse_count = 0
+
+    def __len__(self) -> int:
+        return self._count + len(self._overflow) + self._coarse_count
@@ -58,8 +58,13 @@ class QtEventAdapter(QObject):
         self.stats_updated.emit(data)
 
     def _on_interface_state_changed(self, data: Any) -> None:
-        """Handle INTERFACE_STATE_CHANGED event."""
-        if data and "interface" in data:
+        """Handle INTERFACE_STATE_CHANGED event (single interface or batch)."""
+        if not data:
+            return
+        if "states" in data:
+            for iface, state in data["states"].items():
+                self.interface_state_changed.emit(iface, state)
+        elif "interface" in data:
             iface = data["interface"]
             state = data.get("state")
             self.interface_state_changed.emit(iface, state)
@@ -12,11 +12,13 @@ from pathlib import Path
 
 
 def _get_project_logs_path() -> Path:
-    """Get the project logs directory path, creating it if needed."""
+    """Get the project logs directory path.
+
+    The directory is not created here, but where it is used (logging start,
+    file dialogs), so importing the config has no filesystem side effects.
+    """
     # Path relative to this file: wp4/src/wp4/gui/config.py -> wp4/logs
-    logs_path = Path(__file__).parent.parent.parent.parent / "logs"
-    logs_path.mkdir(parents=True, exist_ok=True)
-    return logs_path
+    return Path(__file__).parent.parent.parent.parent / "logs"
 
 
 @dataclass
@@ -81,12 +83,12 @@ class LoggingConfig:
     """Logging configuration.
 
     Attributes:
-        default_path: Default log directory path
+        default_path: Default log directory path (may not exist yet)
         auto_enable: Whether to enable logging by default
         filename_format: Format string for auto-generated filenames
     """
 
-    default_path: Path = field(default_factory=lambda: _get_project_logs_path())
+    default_path: Path = field(default_factory=_get_project_logs_path)
     auto_enable: bool = False
     filename_format: str = "gateway_{timestamp}.blf"
 
@@ -163,8 +165,8 @@ class GuiConfig:
         )
 
 
-# Default configuration instance
-_default_config: GuiConfig = GuiConfig()
+# Default configuration instance, created on first use
+_default_config: GuiConfig | None = None
 
 
 def get_default_config() -> GuiConfig:
@@ -173,6 +175,9 @@ def get_default_config() -> GuiConfig:
     Returns:
         GuiConfig: Default configuration instance
     """
+    global _default_config
+    if _default_config is None:
+        _default_config = GuiConfig()
     return _default_config
 
 
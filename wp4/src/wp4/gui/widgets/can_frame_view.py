@@ -6,10 +6,13 @@ grouped by message ID. Optimized for performance with large log files.
 Uses a background thread for parsing to avoid blocking the GUI.
 """
 
+from bisect import insort
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QThread, QTimer, Signal
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -22,8 +25,7 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QPushButton,
     QSpinBox,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -31,69 +33,113 @@ from PySide6.QtWidgets import (
 from wp4.gui.config import get_default_config
 from wp4.services.gateway_service import GatewayService
 
+# Maps each byte to itself if printable ASCII, else to "." (for the ASCII column)
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
 
-@dataclass
+# Invalid index: the (hidden) root of a tree model
+_ROOT = QModelIndex()
+
+
+@dataclass(slots=True, frozen=True)
 class CanFrame:
-    """A single CAN frame with metadata."""
+    """A single CAN frame with metadata (the DLC is len(data))."""
 
     timestamp: float
     direction: str  # "0→1" or "1→0"
     arbitration_id: int
     data: bytes
     is_extended_id: bool
-    dlc: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageGroup:
-    """Group of frames with the same arbitration ID."""
+    """Group of frames with the same arbitration ID.
+
+    Only the most recent frames are kept (up to the deque's maxlen); the
+    counts cover all frames.
+    """
 
     arbitration_id: int
     is_extended_id: bool
-    frames: list[CanFrame] = field(default_factory=list)
+    frames: deque[CanFrame] = field(default_factory=deque)
     count_0to1: int = 0
     count_1to0: int = 0
+    id_str: str = field(init=False, repr=False)  # "0x123" or "0x18DAF100"
+    # Header texts and the (count_0to1, count_1to0) they were formatted for
+    _labels: tuple[str, str] = field(default=("", ""), init=False, repr=False)
+    _labels_counts: tuple[int, int] = field(default=(-1, -1), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        arb_id = self.arbitration_id
+        self.id_str = f"0x{arb_id:08X}" if self.is_extended_id else f"0x{arb_id:03X}"
+
+    def labels(self) -> tuple[str, str]:
+        """Get the header texts: ID with frame count, and frames per direction.
+
+        The texts are formatted again only after the counts changed.
+        """
+        counts = (self.count_0to1, self.count_1to0)
+        if counts != self._labels_counts:
+            count_0to1, count_1to0 = counts
+            self._labels = (
+                f"{self.id_str} ({count_0to1 + count_1to0} frames)",
+                f"0→1:{count_0to1}  1→0:{count_1to0}",
+            )
+            self._labels_counts = counts
+        return self._labels
 
 
 class BLFParserWorker(QObject):
     """Background worker for parsing BLF files.
 
-    Runs in a separate thread to avoid blocking the GUI.
+    Lives in a separate thread to avoid blocking the GUI; each parse
+    request is queued to that thread through parse().
     """
 
-    finished = Signal(list)  # Emits list of CanFrame
+    frames_ready = Signal(list)  # Emits a batch of CanFrame while parsing
+    # Emits list of CanFrame not sent in a batch, and the number of BLF messages read
+    finished = Signal(list, int)
     progress = Signal(int)  # Emits progress percentage
     error = Signal(str)  # Emits error message
 
+    # Frames per frames_ready batch, so a huge log is never held twice in one list
+    BATCH_SIZE = 50_000
+
     # Channel mapping (from GatewayLogger)
     CHANNEL_TO_DIRECTION = {
         1: "0→1",
         2: "1→0",
     }
 
-    def __init__(self):
-        super().__init__()
-        self._blf_path: Path | None = None
-        self._enable_0to1 = True
-        self._enable_1to0 = True
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Abort the running parse and skip later ones (callable from any thread)."""
+        self._cancelled = True
 
-    def set_file(
+    def parse(
         self,
         blf_path: Path | None,
         enable_0to1: bool,
         enable_1to0: bool,
+        skip_messages: int = 0,
     ) -> None:
-        """Set which file to parse and direction filters."""
-        self._blf_path = blf_path
-        self._enable_0to1 = enable_0to1
-        self._enable_1to0 = enable_1to0
-
-    def run(self) -> None:
-        """Parse BLF file in background thread."""
+        """Parse BLF file in background thread.
+
+        Args:
+            blf_path: BLF file to parse
+            enable_0to1: Include frames of channel 1 (0→1)
+            enable_1to0: Include frames of channel 2 (1→0)
+            skip_messages: Number of messages at the start of the file that
+                were already read (only later ones become frames)
+        """
         frames: list[CanFrame] = []
+        read = skip_messages
 
-        if not self._blf_path or not self._blf_path.exists():
-            self.finished.emit(frames)
+        if self._cancelled or not blf_path or not blf_path.exists():
+            self.finished.emit(frames, read)
             return
 
         self.progress.emit(0)
@@ -101,48 +147,192 @@ class BLFParserWorker(QObject):
         try:
             from can.io.blf import BLFReader
 
-            with BLFReader(str(self._blf_path)) as reader:
-                msg_list = list(reader)
-
-            total = len(msg_list)
-            for i, msg in enumerate(msg_list):
-                # Get direction from channel
-                raw_ch = msg.channel
-                if isinstance(raw_ch, int):
-                    ch = raw_ch
-                elif isinstance(raw_ch, str):
-                    ch = int(raw_ch) if raw_ch.isdigit() else 0
-                else:
-                    ch = 0
-
-                direction = self.CHANNEL_TO_DIRECTION.get(ch, f"CH{ch}")
-
-                # Apply direction filter
-                if ch == 1 and not self._enable_0to1:
-                    continue
-                if ch == 2 and not self._enable_1to0:
-                    continue
-
-                frame = CanFrame(
-                    timestamp=msg.timestamp or 0.0,
-                    direction=direction,
-                    arbitration_id=msg.arbitration_id,
-                    data=bytes(msg.data),
-                    is_extended_id=msg.is_extended_id,
-                    dlc=len(msg.data),
-                )
-                frames.append(frame)
-
-                # Update progress every 1000 messages
-                if i % 1000 == 0:
-                    self.progress.emit(int(i / total * 100))
+            # Progress follows the read position, as the message count is unknown upfront
+            total_size = blf_path.stat().st_size or 1
+            last_pct = 0
+            with BLFReader(str(blf_path)) as reader:
+                # Messages already read are decoded but skipped; read counts all messages
+                for msg in islice(reader, skip_messages, None):
+                    if self._cancelled:
+                        break
+                    read += 1
+                    # Update progress only when the percentage changes
+                    pct = min(reader.file.tell() * 100 // total_size, 100)
+                    if pct != last_pct:
+                        self.progress.emit(pct)
+                        last_pct = pct
+
+                    # Get direction from channel
+                    raw_ch = msg.channel
+                    if isinstance(raw_ch, int):
+                        ch = raw_ch
+                    elif isinstance(raw_ch, str):
+                        ch = int(raw_ch) if raw_ch.isdigit() else 0
+                    else:
+                        ch = 0
+
+                    # Apply direction filter before building the frame
+                    if ch == 1 and not enable_0to1:
+                        continue
+                    if ch == 2 and not enable_1to0:
+                        continue
+
+                    frame = CanFrame(
+                        timestamp=msg.timestamp or 0.0,
+                        direction=self.CHANNEL_TO_DIRECTION.get(ch, f"CH{ch}"),
+                        arbitration_id=msg.arbitration_id,
+                        data=bytes(msg.data),
+                        is_extended_id=msg.is_extended_id,
+                    )
+                    frames.append(frame)
+
+                    if len(frames) >= self.BATCH_SIZE:
+                        self.frames_ready.emit(frames)
+                        frames = []
 
             self.progress.emit(100)
 
         except Exception as e:
             self.error.emit(str(e))
 
-        self.finished.emit(frames)
+        self.finished.emit(frames, read)
+
+
+class FrameTreeModel(QAbstractItemModel):
+    """Tree model with one top-level row per message group and its frames below.
+
+    A group's frame rows are only created when the view expands the group
+    (fetchMore), so collapsed groups cost a single row each.
+    """
+
+    HEADERS = ("ID / Time", "Dir", "DLC", "Data", "ASCII")
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._groups: list[MessageGroup] = []
+        self._rows: dict[int, int] = {}  # Arbitration ID -> top-level row
+        self._children: dict[int, list[CanFrame]] = {}  # Fetched frames per row, newest first
+
+        self._color_both = QBrush(QColor("#ffff66"))
+        self._color_0to1 = QBrush(QColor("#66ff66"))
+        self._color_1to0 = QBrush(QColor("#66ffff"))
+
+    def set_groups(self, groups: list[MessageGroup]) -> None:
+        """Show the given groups, in order, with all of them collapsed."""
+        self.beginResetModel()
+        self._groups = groups
+        self._rows = {group.arbitration_id: row for row, group in enumerate(groups)}
+        self._children = {}
+        self.endResetModel()
+
+    def index(self, row: int, column: int, parent: QModelIndex = _ROOT) -> QModelIndex:
+        """Get the index of a group row (top level) or frame row (below a group)."""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        # Frame rows point to their group, group rows to nothing
+        return self.createIndex(row, column, self._groups[parent.row()])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        """Get the group row of a frame row (the root for group rows)."""
+        if not index.isValid():
+            return QModelIndex()
+        group = index.internalPointer()
+        if group is None:
+            return QModelIndex()
+        return self.createIndex(self._rows[group.arbitration_id], 0)
+
+    def rowCount(self, parent: QModelIndex = _ROOT) -> int:
+        """Count the group rows, or the fetched frame rows of a group."""
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.column() == 0 and parent.internalPointer() is None:
+            return len(self._children.get(parent.row(), ()))
+        return 0
+
+    def columnCount(self, parent: QModelIndex = _ROOT) -> int:
+        """Count the columns (the same for all rows)."""
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent: QModelIndex = _ROOT) -> bool:
+        """Check for child rows, including frame rows not fetched yet."""
+        if not parent.isValid():
+            return bool(self._groups)
+        if parent.column() == 0 and parent.internalPointer() is None:
+            return bool(self._groups[parent.row()].frames)
+        return False
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Check if a group's frame rows still have to be created."""
+        return (
+            parent.isValid()
+            and parent.internalPointer() is None
+            and parent.row() not in self._children
+        )
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Create the frame rows of a group (called when it is expanded)."""
+        if not self.canFetchMore(parent):
+            return
+        row = parent.row()
+        # Most recent first
+        frames = list(reversed(self._groups[row].frames))
+        if not frames:
+            self._children[row] = frames
+            return
+        self.beginInsertRows(parent, 0, len(frames) - 1)
+        self._children[row] = frames
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        """Get the text or color of a cell."""
+        if not index.isValid():
+            return None
+        column = index.column()
+        group = index.internalPointer()
+
+        if group is None:
+            group = self._groups[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole:
+                if column == 0:
+                    return group.labels()[0]
+                if column == 3:
+                    return group.labels()[1]
+                return ""
+            if role == Qt.ItemDataRole.ForegroundRole and column == 0:
+                # Color based on direction mix
+                if group.count_0to1 > 0 and group.count_1to0 > 0:
+                    return self._color_both
+                return self._color_0to1 if group.count_0to1 > 0 else self._color_1to0
+            return None
+
+        frame = self._children[self._rows[group.arbitration_id]][index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return f"{frame.timestamp:.6f}"
+            if column == 1:
+                return frame.direction
+            if column == 2:
+                return str(len(frame.data))
+            if column == 3:
+                return frame.data.hex(" ").upper()
+            return frame.data.translate(_ASCII_TABLE).decode("ascii")
+        if role == Qt.ItemDataRole.ForegroundRole and column == 1:
+            # Color by direction
+            return self._color_0to1 if frame.direction == "0→1" else self._color_1to0
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        """Get the column titles."""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
 
 
 class CanFrameViewWidget(QWidget):
@@ -157,6 +347,9 @@ class CanFrameViewWidget(QWidget):
     - Integrates with GatewayService for auto-detection
     """
 
+    # Queues a parse to the worker thread: path, 0→1 enabled, 1→0 enabled, skip_messages
+    _parse_requested = Signal(object, bool, bool, int)
+
     def __init__(
         self,
         iface0: str = "can0",
@@ -173,6 +366,7 @@ class CanFrameViewWidget(QWidget):
 
         # Message groups by ID
         self._groups: dict[int, MessageGroup] = {}
+        self._sorted_ids: list[int] = []  # Keys of _groups in ascending order
         self._frame_count = 0
 
         # Filter settings
@@ -180,13 +374,23 @@ class CanFrameViewWidget(QWidget):
         self._show_1to0 = True
         self._max_frames_per_id = 100
 
-        # File modification tracking
+        # File modification tracking; a grown file is only read past the messages already read
         self._last_mtime = 0.0
+        self._last_size = 0
+        self._messages_read = 0
 
-        # Background parsing thread
-        self._worker_thread: QThread | None = None
-        self._worker: BLFParserWorker | None = None
+        # Background parsing thread, started once and reused for every parse
+        self._worker_thread: QThread | None = QThread(self)
+        self._worker = BLFParserWorker()
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._parse_requested.connect(self._worker.parse)
+        self._worker.progress.connect(self._on_parse_progress)
+        self._worker.frames_ready.connect(self._add_frames)
+        self._worker.finished.connect(self._on_parse_finished)
+        self._worker_thread.start()
         self._parsing_in_progress = False
+        self._reload_pending = False  # Reload requested while parsing
 
         self._setup_ui()
 
@@ -254,7 +458,7 @@ class CanFrameViewWidget(QWidget):
         self._max_frames_spin = QSpinBox()
         self._max_frames_spin.setRange(10, 10000)
         self._max_frames_spin.setValue(100)
-        self._max_frames_spin.valueChanged.connect(self._rebuild_tree)
+        self._max_frames_spin.valueChanged.connect(self._on_max_frames_changed)
         filter_layout.addWidget(self._max_frames_spin)
 
         filter_layout.addStretch()
@@ -273,9 +477,11 @@ class CanFrameViewWidget(QWidget):
 
         layout.addWidget(filter_group)
 
-        # Tree widget
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabels(["ID / Time", "Dir", "DLC", "Data", "ASCII"])
+        # Tree view; frame rows are created when an ID is expanded
+        self._model = FrameTreeModel(self)
+        self._tree = QTreeView()
+        self._tree.setModel(self._model)
+        self._tree.setUniformRowHeights(True)
         self._tree.setAlternatingRowColors(True)
         self._tree.setStyleSheet("font-family: monospace;")
 
@@ -315,16 +521,18 @@ class CanFrameViewWidget(QWidget):
             self._blf_path = path
             self._path_edit.setText(str(path))
             self._last_mtime = 0.0
+            self._messages_read = 0
             self._reload_blf()
 
     def _browse_blf(self) -> None:
         """Browse for BLF file."""
         # Use same default path as logging section
-        default_path = str(get_default_config().logging.default_path)
+        default_path = get_default_config().logging.default_path
+        default_path.mkdir(parents=True, exist_ok=True)
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Select BLF Log File",
-            default_path,
+            str(default_path),
             "BLF Files (*.blf);;All Files (*)",
         )
         if path:
@@ -340,84 +548,115 @@ class CanFrameViewWidget(QWidget):
 
     def _check_for_updates(self) -> None:
         """Check if BLF file has been modified."""
-        if not self._blf_path or not self._blf_path.exists():
+        # A change seen while parsing is left for a later check, not marked as seen
+        if self._parsing_in_progress or not self._blf_path or not self._blf_path.exists():
             return
 
         try:
-            mtime = self._blf_path.stat().st_mtime
-            if mtime > self._last_mtime:
-                self._last_mtime = mtime
-                self._reload_blf()
+            stat = self._blf_path.stat()
+            if stat.st_mtime > self._last_mtime:
+                self._last_mtime = stat.st_mtime
+                if self._messages_read and stat.st_size >= self._last_size:
+                    self._start_parse(self._messages_read)
+                else:
+                    self._reload_blf()
         except OSError:
             pass
 
     def _reload_blf(self) -> None:
-        """Reload BLF file in background thread."""
-        # Don't start new parsing if already in progress
+        """Reload BLF file from the start in background thread."""
         if self._parsing_in_progress:
+            # The running parse may be for another file or filter; reload once it is done
+            self._reload_pending = True
+            return
+        self._start_parse(0)
+
+    def _start_parse(self, skip_messages: int) -> None:
+        """Parse BLF file in background thread.
+
+        Args:
+            skip_messages: Number of messages already in the groups; 0
+                replaces the groups with the whole file
+        """
+        # Don't start new parsing if already in progress or stopped
+        if self._parsing_in_progress or self._worker_thread is None:
             return
 
         if not self._blf_path or not self._blf_path.exists():
             self._groups.clear()
+            self._sorted_ids.clear()
             self._frame_count = 0
+            self._messages_read = 0
             self._rebuild_tree()
             return
 
+        try:
+            self._last_size = self._blf_path.stat().st_size
+        except OSError:
+            self._last_size = 0
+
         self._parsing_in_progress = True
         self._progress_bar.setValue(0)
         self._progress_bar.show()
         self._count_label.setText("Loading...")
 
-        # Clean up previous thread if exists
-        if self._worker_thread is not None:
-            self._worker_thread.quit()
-            self._worker_thread.wait()
+        # Frames arrive in batches from here on
+        if not skip_messages:
+            self._groups.clear()
+            self._sorted_ids.clear()
+            self._frame_count = 0
 
-        # Create worker and thread
-        self._worker_thread = QThread()
-        self._worker = BLFParserWorker()
-        self._worker.set_file(
+        self._parse_requested.emit(
             self._blf_path,
             self._enable_0to1.isChecked(),
             self._enable_1to0.isChecked(),
+            skip_messages,
         )
 
-        # Move worker to thread
-        self._worker.moveToThread(self._worker_thread)
-
-        # Connect signals
-        self._worker_thread.started.connect(self._worker.run)
-        self._worker.progress.connect(self._on_parse_progress)
-        self._worker.finished.connect(self._on_parse_finished)
-        self._worker.finished.connect(self._worker_thread.quit)
-
-        # Start thread
-        self._worker_thread.start()
-
     def _on_parse_progress(self, percent: int) -> None:
         """Handle progress updates from worker."""
         self._progress_bar.setValue(percent)
 
-    def _on_parse_finished(self, frames: list[CanFrame]) -> None:
+    def _on_parse_finished(self, frames: list[CanFrame], messages_read: int) -> None:
         """Handle parsing completion."""
         self._parsing_in_progress = False
         self._progress_bar.hide()
+        self._messages_read = messages_read
 
-        # Clear and rebuild groups
-        self._groups.clear()
-        self._frame_count = 0
+        # Add the last batch and rebuild
         self._add_frames(frames)
         self._rebuild_tree()
 
+        if self._reload_pending:
+            self._reload_pending = False
+            self._reload_blf()
+
+    def _on_max_frames_changed(self, max_frames: int) -> None:
+        """Resize the per-ID frame history."""
+        grown = max_frames > self._max_frames_per_id
+        self._max_frames_per_id = max_frames
+        truncated = False
+        for group in self._groups.values():
+            truncated = truncated or len(group.frames) < group.count_0to1 + group.count_1to0
+            group.frames = deque(group.frames, maxlen=max_frames)
+
+        if grown and truncated:
+            # Older frames were already dropped, so read them from the file again
+            self.refresh()
+        else:
+            self._rebuild_tree()
+
     def _add_frames(self, frames: list[CanFrame]) -> None:
         """Add frames to groups."""
         for frame in frames:
             arb_id = frame.arbitration_id
 
             if arb_id not in self._groups:
+                insort(self._sorted_ids, arb_id)
                 self._groups[arb_id] = MessageGroup(
                     arbitration_id=arb_id,
                     is_extended_id=frame.is_extended_id,
+                    frames=deque(maxlen=self._max_frames_per_id),
                 )
 
             group = self._groups[arb_id]
@@ -430,74 +669,15 @@ class CanFrameViewWidget(QWidget):
                 group.count_1to0 += 1
 
     def _rebuild_tree(self) -> None:
-        """Rebuild tree widget from groups."""
-        self._tree.clear()
-        max_frames = self._max_frames_spin.value()
+        """Rebuild tree view from groups."""
+        # Groups ordered by ID
+        groups = [
+            self._groups[arb_id] for arb_id in self._sorted_ids if self._groups[arb_id].frames
+        ]
+        self._model.set_groups(groups)
 
-        # Sort groups by ID
-        sorted_ids = sorted(self._groups.keys())
-
-        total_0to1 = 0
-        total_1to0 = 0
-
-        for arb_id in sorted_ids:
-            group = self._groups[arb_id]
-
-            if not group.frames:
-                continue
-
-            # Limit frames per ID (most recent)
-            limited_frames = group.frames[-max_frames:]
-
-            # Create parent item for this ID
-            id_str = f"0x{arb_id:08X}" if group.is_extended_id else f"0x{arb_id:03X}"
-            parent = QTreeWidgetItem(
-                [
-                    f"{id_str} ({len(group.frames)} frames)",
-                    "",
-                    "",
-                    f"0→1:{group.count_0to1}  1→0:{group.count_1to0}",
-                    "",
-                ]
-            )
-            parent.setExpanded(False)
-
-            # Color based on direction mix
-            if group.count_0to1 > 0 and group.count_1to0 > 0:
-                parent.setForeground(0, QBrush(QColor("#ffff66")))  # Both
-            elif group.count_0to1 > 0:
-                parent.setForeground(0, QBrush(QColor("#66ff66")))  # 0→1
-            else:
-                parent.setForeground(0, QBrush(QColor("#66ffff")))  # 1→0
-
-            # Add child items (most recent first)
-            for frame in reversed(limited_frames):
-                ts_str = f"{frame.timestamp:.6f}"
-                data_hex = " ".join(f"{b:02X}" for b in frame.data)
-                ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in frame.data)
-
-                child = QTreeWidgetItem(
-                    [
-                        ts_str,
-                        frame.direction,
-                        str(frame.dlc),
-                        data_hex,
-                        ascii_str,
-                    ]
-                )
-
-                # Color by direction
-                if frame.direction == "0→1":
-                    child.setForeground(1, QBrush(QColor("#66ff66")))
-                else:
-                    child.setForeground(1, QBrush(QColor("#66ffff")))
-
-                parent.addChild(child)
-
-            self._tree.addTopLevelItem(parent)
-
-            total_0to1 += group.count_0to1
-            total_1to0 += group.count_1to0
+        total_0to1 = sum(group.count_0to1 for group in groups)
+        total_1to0 = sum(group.count_1to0 for group in groups)
 
         # Update statistics
         self._count_label.setText(f"{self._frame_count:,} frames")
@@ -517,7 +697,8 @@ class CanFrameViewWidget(QWidget):
 
         # Clean up worker thread
         if self._worker_thread is not None:
+            # A running parse stops at its next message, so the wait is short
+            self._worker.cancel()
             self._worker_thread.quit()
-            self._worker_thread.wait(1000)  # Wait max 1 second
+            self._worker_thread.wait()
             self._worker_thread = None
-            self._worker = None
@@ -630,6 +630,8 @@ class TrafficControlWidget(QWidget):
     def _browse_log_path(self):
         """Open file dialog to select log directory."""
         current_path = self._log_path_edit.text()
+        # The default log directory is only created when it is first used
+        Path(current_path).mkdir(parents=True, exist_ok=True)
         path = QFileDialog.getExistingDirectory(
             self,
             "Select Log Directory",
@@ -1,9 +1,17 @@
 """Tests for DirectionStats dataclass."""
 
-import heapq
 import time
 
-from wp4.core.direction_stats import DirectionStats, create_direction_pair
+import pytest
+
+from wp4.core.direction_stats import (
+    DirectionStats,
+    PayloadPool,
+    ScheduledRingBuffer,
+    create_direction_pair,
+)
+
+MS = 1_000_000  # Nanoseconds per millisecond
 
 
 class TestDirectionStats:
@@ -17,7 +25,7 @@ class TestDirectionStats:
         assert stats.received == 0
         assert stats.forwarded == 0
         assert stats.dropped == 0
-        assert stats.queue == []
+        assert len(stats.queue) == 0
         assert stats.enabled is True
         assert len(stats.latency_samples) == 0
 
@@ -32,18 +40,20 @@ class TestDirectionStats:
         stats.received = 100
         stats.forwarded = 90
         stats.dropped = 10
+        stats.tx_dropped = 5
 
         stats.reset_counters()
 
         assert stats.received == 0
         assert stats.forwarded == 0
         assert stats.dropped == 0
+        assert stats.tx_dropped == 0
 
     def test_clear_queue(self):
         """Test queue clearing."""
         stats = DirectionStats(direction="0to1")
-        stats.queue.append((1.0, 0.9, 0x123, b"\x01", False))
-        stats.queue.append((2.0, 1.9, 0x456, b"\x02", False))
+        stats.queue.push(1000 * MS, 900 * MS, 0x123, b"\x01", False)
+        stats.queue.push(2000 * MS, 1900 * MS, 0x456, b"\x02", False)
 
         assert len(stats.queue) == 2
 
@@ -67,7 +77,7 @@ class TestDirectionStats:
         """Test full reset."""
         stats = DirectionStats(direction="0to1")
         stats.received = 100
-        stats.queue.append((1.0, 0.9, 0x123, b"\x01", False))
+        stats.queue.push(1000 * MS, 900 * MS, 0x123, b"\x01", False)
         stats.latency_samples.append(1000.0)
 
         stats.reset_all()
@@ -82,42 +92,168 @@ class TestDirectionStats:
 
         assert stats.queue_size == 0
 
-        stats.queue.append((1.0, 0.9, 0x123, b"\x01", False))
+        stats.queue.push(1000 * MS, 900 * MS, 0x123, b"\x01", False)
         assert stats.queue_size == 1
 
-        stats.queue.append((2.0, 1.9, 0x456, b"\x02", False))
+        stats.queue.push(2000 * MS, 1900 * MS, 0x456, b"\x02", False)
+        assert stats.queue_size == 2
+
+    def test_queue_size_includes_fifo(self):
+        """Test queue_size counts both the priority queue and the FIFO."""
+        stats = DirectionStats(direction="0to1")
+
+        stats.queue.push(2000 * MS, 1900 * MS, 0x456, b"\x02", False)
+        stats.fifo.put((1000 * MS, 1000 * MS, 0x123, b"\x01", False))
         assert stats.queue_size == 2
 
+        stats.clear_queue()
+        assert stats.queue_size == 0
+        assert stats.fifo.empty()
+
+    def test_push_batch_hands_entries_to_fifo(self):
+        """Test push_batch puts entries on the FIFO for the send thread."""
+        stats = DirectionStats(direction="0to1")
+
+        dropped = stats.push_batch(
+            [
+                (1000 * MS, 1000 * MS, 0x100, b"\x01", False),
+                (1500 * MS, 1000 * MS, 0x200, b"\x02", False),  # delayed by a rule
+            ],
+            max_size=10,
+        )
+
+        assert dropped == 0
+        assert stats.fifo.get_nowait() == (1000 * MS, 1000 * MS, 0x100, b"\x01", False)
+        assert stats.fifo.get_nowait() == (1500 * MS, 1000 * MS, 0x200, b"\x02", False)
+        assert len(stats.queue) == 0
+
+    def test_push_batch_drops_oldest_when_full(self):
+        """Test push_batch drops the oldest pending entries beyond max_size."""
+        stats = DirectionStats(direction="0to1")
+        batch = [(i, 0, i, b"", False) for i in range(5)]
+
+        dropped = stats.push_batch(batch, max_size=3)
+
+        assert dropped == 2
+        assert stats.queue_size == 3
+        assert stats.fifo.get_nowait()[2] == 2
+
+    def test_push_batch_drops_new_entry_when_scheduler_full(self):
+        """Test push_batch drops the new entry when only the scheduler holds frames."""
+        stats = DirectionStats(direction="0to1")
+        stats.queue.push(1000 * MS, 0, 0x1, b"", False)
+
+        dropped = stats.push_batch([(2000 * MS, 0, 0x2, b"", False)], max_size=1)
+
+        assert dropped == 1
+        assert stats.fifo.empty()
+        assert len(stats.queue) == 1
+
+    def test_next_due_returns_due_entry_directly(self):
+        """Test a frame that is due on arrival bypasses the scheduler queue."""
+        stats = DirectionStats(direction="0to1")
+        stats.fifo.put((1000 * MS, 1000 * MS, 0x100, b"\x01", False))
+
+        assert stats.next_due(max_size=10) == (1000 * MS, 1000 * MS, 0x100, b"\x01", False)
+        assert len(stats.queue) == 0
+
+    def test_next_due_schedules_future_entry(self):
+        """Test a delayed frame is held in the scheduler until due."""
+        stats = DirectionStats(direction="0to1")
+        now = time.monotonic_ns()
+        stats.fifo.put((now + 50 * MS, now, 0x100, b"\x01", False))
+
+        assert stats.next_due(max_size=10, timeout=0.01) is None
+        assert len(stats.queue) == 1
+
+        entry = stats.next_due(max_size=10, timeout=1.0)
+        assert entry is not None
+        assert entry[2] == 0x100
+        assert time.monotonic_ns() >= now + 50 * MS
+
+    def test_next_due_keeps_send_time_order(self):
+        """Test a due frame is not sent ahead of an earlier scheduled one."""
+        stats = DirectionStats(direction="0to1")
+        stats.queue.push(1000 * MS, 500 * MS, 0x1, b"", False)
+        stats.fifo.put((2000 * MS, 2000 * MS, 0x2, b"", False))
+
+        assert stats.next_due(max_size=10)[2] == 0x1
+        assert stats.next_due(max_size=10)[2] == 0x2
+
+    def test_next_due_drops_earliest_when_scheduler_full(self):
+        """Test the scheduler drops its earliest frame beyond max_size."""
+        stats = DirectionStats(direction="0to1")
+        now = time.monotonic_ns()
+        stats.queue.push(now + 10_000 * MS, now, 0x1, b"", False)
+        stats.fifo.put((now + 20_000 * MS, now, 0x2, b"", False))
+
+        assert stats.next_due(max_size=1, timeout=0.01) is None
+        assert stats.tx_dropped == 1
+        assert stats.queue.pop_min()[2] == 0x2
+
+    def test_sender_idle_until_taken_entry_settled(self):
+        """Test sender_idle stays False while the send thread still holds an entry."""
+        stats = DirectionStats(direction="0to1")
+        assert stats.sender_idle
+
+        stats.push_batch([(1000 * MS, 1000 * MS, 0x100, b"\x01", False)], max_size=10)
+        assert not stats.sender_idle
+
+        assert stats.next_due(max_size=10) is not None
+        assert stats.queue_size == 0
+        assert not stats.sender_idle  # Taken but not yet sent
+
+        stats.settled += 1  # As the send loop does after sending
+        assert stats.sender_idle
+
+    def test_sender_idle_ignores_evicted_entries(self):
+        """Test entries dropped from the FIFO before the send thread saw them."""
+        stats = DirectionStats(direction="0to1")
+        stats.push_batch([(i, 0, i, b"", False) for i in range(5)], max_size=3)
+
+        for _ in range(3):
+            stats.next_due(max_size=10)
+            stats.settled += 1
+
+        assert stats.sender_idle
+
+    def test_next_due_times_out_when_idle(self):
+        """Test next_due returns None when nothing arrives within the timeout."""
+        stats = DirectionStats(direction="0to1")
+
+        assert stats.next_due(max_size=10, timeout=0.01) is None
+
+    def test_next_due_returns_none_on_wake_up(self):
+        """Test wake_sender interrupts a blocked next_due call."""
+        stats = DirectionStats(direction="0to1")
+        stats.wake_sender()
+
+        start = time.monotonic()
+        assert stats.next_due(max_size=10, timeout=1.0) is None
+        assert time.monotonic() - start < 0.5
+
     def test_queue_as_priority_queue(self):
-        """Test using queue as priority queue with heapq."""
+        """Test the scheduler queue pops in send_time order."""
         stats = DirectionStats(direction="0to1")
 
         # Push items in non-sorted order
-        heapq.heappush(stats.queue, (3.0, 2.9, 0x100, b"\x01", False))
-        heapq.heappush(stats.queue, (1.0, 0.9, 0x200, b"\x02", False))
-        heapq.heappush(stats.queue, (2.0, 1.9, 0x300, b"\x03", False))
+        stats.queue.push(3000 * MS, 2900 * MS, 0x100, b"\x01", False)
+        stats.queue.push(1000 * MS, 900 * MS, 0x200, b"\x02", False)
+        stats.queue.push(2000 * MS, 1900 * MS, 0x300, b"\x03", False)
 
         # Pop should return in sorted order by send_time
-        item1 = heapq.heappop(stats.queue)
-        assert item1[0] == 1.0
+        item1 = stats.queue.pop_min()
+        assert item1[0] == 1000 * MS
         assert item1[2] == 0x200
 
-        item2 = heapq.heappop(stats.queue)
-        assert item2[0] == 2.0
+        item2 = stats.queue.pop_min()
+        assert item2[0] == 2000 * MS
         assert item2[2] == 0x300
 
-        item3 = heapq.heappop(stats.queue)
-        assert item3[0] == 3.0
+        item3 = stats.queue.pop_min()
+        assert item3[0] == 3000 * MS
         assert item3[2] == 0x100
 
-    def test_condition_variable(self):
-        """Test condition variable exists and is usable."""
-        stats = DirectionStats(direction="0to1")
-
-        # Should be able to acquire and release
-        with stats.condition:
-            pass
-
     def test_latency_samples_maxlen(self):
         """Test latency samples has maxlen of 100."""
         stats = DirectionStats(direction="0to1")
@@ -133,6 +269,35 @@ class TestDirectionStats:
         assert min(stats.latency_samples) == 50.0
         assert max(stats.latency_samples) == 149.0
 
+    def test_latency_samples_iterate_oldest_first(self):
+        """Test latency samples iterate in insertion order after wrapping."""
+        stats = DirectionStats(direction="0to1")
+
+        for i in range(105):
+            stats.latency_samples.append(float(i))
+
+        samples = list(stats.latency_samples)
+        assert samples[0] == 5.0
+        assert samples[-1] == 104.0
+        assert samples == sorted(samples)
+
+    def test_latency_samples_single_precision(self):
+        """Test samples keep sub-microsecond precision in float32 storage."""
+        stats = DirectionStats(direction="0to1")
+        stats.latency_samples.append(1234.567)
+
+        assert abs(next(iter(stats.latency_samples)) - 1234.567) < 1e-3
+
+    def test_get_latency_stats_single_sample(self):
+        """Test latency stats with a single sample."""
+        stats = DirectionStats(direction="0to1")
+        stats.latency_samples.append(42.0)
+
+        result = stats.get_latency_stats()
+
+        assert result["min"] == result["max"] == result["avg"] == 42.0
+        assert result["p95"] == result["p99"] == 42.0
+
     def test_get_latency_stats_empty(self):
         """Test latency stats with no samples."""
         stats = DirectionStats(direction="0to1")
@@ -167,7 +332,7 @@ class TestDirectionStats:
         stats.forwarded = 90
         stats.dropped = 10
         stats.enabled = True
-        stats.queue.append((1.0, 0.9, 0x123, b"\x01", False))
+        stats.queue.push(1000 * MS, 900 * MS, 0x123, b"\x01", False)
 
         result = stats.to_dict()
 
@@ -179,6 +344,51 @@ class TestDirectionStats:
         assert result["enabled"] is True
         assert "latency_stats" in result
 
+    def test_dropped_includes_tx_dropped(self):
+        """Test to_dict reports receive- and send-side drops."""
+        stats = DirectionStats(direction="0to1")
+        stats.dropped = 3
+        stats.tx_dropped = 2
+
+        assert stats.total_dropped == 5
+        assert stats.to_dict()["dropped"] == 5
+
+    def test_uses_slots(self):
+        """Test instances have no per-instance __dict__."""
+        stats = DirectionStats(direction="0to1")
+
+        assert not hasattr(stats, "__dict__")
+
+    def test_to_dict_reflects_changes(self):
+        """Test cached to_dict output is refreshed after state changes."""
+        stats = DirectionStats(direction="0to1")
+        first = stats.to_dict()
+
+        stats.received = 5
+        stats.latency_samples.append(100.0)
+        second = stats.to_dict()
+
+        assert first["received"] == 0
+        assert first["latency_stats"]["min"] is None
+        assert second["received"] == 5
+        assert second["latency_stats"]["min"] == 100.0
+
+        stats.clear_latency_samples()
+        assert stats.to_dict()["latency_stats"]["min"] is None
+
+    def test_to_dict_returns_independent_copies(self):
+        """Test mutating a returned dict doesn't affect later calls."""
+        stats = DirectionStats(direction="0to1")
+        stats.latency_samples.append(100.0)
+
+        result = stats.to_dict()
+        result["received"] = 999
+        result["latency_stats"]["min"] = -1.0
+
+        again = stats.to_dict()
+        assert again["received"] == 0
+        assert again["latency_stats"]["min"] == 100.0
+
     def test_enabled_flag(self):
         """Test enabled flag toggling."""
         stats = DirectionStats(direction="0to1")
@@ -192,6 +402,96 @@ class TestDirectionStats:
         assert stats.enabled is True
 
 
+class TestScheduledRingBuffer:
+    """Tests for the struct-of-arrays scheduler queue."""
+
+    def test_empty(self):
+        """Test an empty buffer."""
+        buf = ScheduledRingBuffer(capacity=4)
+
+        assert len(buf) == 0
+        assert buf.peek_time() is None
+
+    def test_pop_returns_entry_fields(self):
+        """Test popped entries round-trip all fields."""
+        buf = ScheduledRingBuffer(capacity=4)
+        buf.push(1500 * MS, 1000 * MS, 0x1ABCDEF0, b"\xde\xad", True)
+
+        assert buf.pop_min() == (1500 * MS, 1000 * MS, 0x1ABCDEF0, b"\xde\xad", True)
+        assert len(buf) == 0
+
+    def test_in_order_pushes_wrap_around(self):
+        """Test monotonic pushes stay FIFO across the ring boundary."""
+        buf = ScheduledRingBuffer(capacity=3)
+
+        for i in range(10):
+            buf.push(i, i, i, b"", False)
+            assert buf.pop_min()[2] == i
+
+    def test_out_of_order_entries_interleave(self):
+        """Test out-of-order pushes are merged with ring entries by send_time."""
+        buf = ScheduledRingBuffer(capacity=8)
+        send_times = [t * MS for t in (2, 4, 1, 6, 3, 5)]
+        for send_time in send_times:
+            buf.push(send_time, 0, send_time // MS, b"", False)
+
+        assert buf.peek_time() == 1 * MS
+        assert [buf.pop_min()[0] for _ in range(6)] == sorted(send_times)
+
+    def test_overflow_beyond_capacity(self):
+        """Test pushes beyond ring capacity are still kept in order."""
+        buf = ScheduledRingBuffer(capacity=2)
+        for i in range(5):
+            buf.push(i, 0, i, b"", False)
+
+        assert len(buf) == 5
+        assert [buf.pop_min()[2] for _ in range(5)] == [0, 1, 2, 3, 4]
+
+    def test_pop_empty_raises(self):
+        """Test popping an empty buffer raises IndexError."""
+        buf = ScheduledRingBuffer(capacity=2)
+
+        with pytest.raises(IndexError):
+            buf.pop_min()
+
+    def test_payloads_survive_slot_reuse(self):
+        """Test payloads of different lengths are not mixed up when slots are reused."""
+        buf = ScheduledRingBuffer(capacity=2)
+        for i, data in enumerate((b"\x01\x02\x03", b"\x04", b"", b"\x05\x06")):
+            buf.push(i, 0, i, data, False)
+            assert buf.pop_min()[3] == data
+
+    def test_oversized_payload_kept(self):
+        """Test payloads larger than a pool slot are still delivered intact."""
+        buf = ScheduledRingBuffer(capacity=4)
+        data = bytes(range(100))
+        buf.push(1000 * MS, 0, 0x1, data, False)
+
+        assert buf.pop_min()[3] == data
+
+
+class TestPayloadPool:
+    """Tests for PayloadPool."""
+
+    def test_write_read(self):
+        """Test slots hold independent payloads."""
+        pool = PayloadPool(capacity=2, frame_size=8)
+        pool.write(0, b"\x01\x02")
+        pool.write(1, b"\x03\x04\x05\x06\x07\x08\x09\x0a")
+
+        assert pool.read(0) == b"\x01\x02"
+        assert pool.read(1) == b"\x03\x04\x05\x06\x07\x08\x09\x0a"
+        assert isinstance(pool.read(0), bytes)
+
+    def test_shorter_rewrite(self):
+        """Test rewriting a slot with a shorter payload truncates it."""
+        pool = PayloadPool(capacity=1, frame_size=8)
+        pool.write(0, b"\xff" * 8)
+        pool.write(0, b"\x01")
+
+        assert pool.read(0) == b"\x01"
+
+
 class TestCreateDirectionPair:
     """Tests for create_direction_pair helper."""
 
@@ -223,24 +523,17 @@ class TestCreateDirectionPair:
         """Test that queues are separate."""
         stats_0to1, stats_1to0 = create_direction_pair()
 
-        stats_0to1.queue.append((1.0, 0.9, 0x100, b"\x01", False))
+        stats_0to1.queue.push(1000 * MS, 900 * MS, 0x100, b"\x01", False)
 
         assert len(stats_0to1.queue) == 1
         assert len(stats_1to0.queue) == 0
 
-    def test_separate_conditions(self):
-        """Test that condition variables are separate."""
-        stats_0to1, stats_1to0 = create_direction_pair()
-
-        # Should be different objects
-        assert stats_0to1.condition is not stats_1to0.condition
-
 
 class TestThreadSafety:
     """Tests for thread-safe usage patterns."""
 
-    def test_condition_wait_notify(self):
-        """Test condition variable wait/notify pattern."""
+    def test_fifo_handoff_between_threads(self):
+        """Test frames pushed by one thread are returned by next_due in another."""
         import threading
 
         stats = DirectionStats(direction="0to1")
@@ -248,16 +541,14 @@ class TestThreadSafety:
 
         def producer():
             time.sleep(0.01)
-            with stats.condition:
-                stats.queue.append((1.0, 0.9, 0x123, b"\x01", False))
-                stats.condition.notify()
+            now = time.monotonic_ns()
+            stats.push_batch([(now, now, 0x123, b"\x01", False)], max_size=10)
 
         def consumer():
-            with stats.condition:
-                while not stats.queue:
-                    stats.condition.wait(timeout=1.0)
-                if stats.queue:
-                    item = stats.queue.pop(0)
+            deadline = time.monotonic() + 1.0
+            while not received_items and time.monotonic() < deadline:
+                item = stats.next_due(max_size=10, timeout=0.1)
+                if item is not None:
                     received_items.append(item)
 
         consumer_thread = threading.Thread(target=consumer)
@@ -1,8 +1,16 @@
 """Unit tests for EventBus and Direction enum."""
 
+import gc
+
 import pytest
 
-from wp4.core.events import Direction, EventBus, EventType
+from wp4.core.direction_stats import DirectionStats
+from wp4.core.events import (
+    Direction,
+    EventBus,
+    EventType,
+    StatsUpdatedEvent,
+)
 
 
 def test_event_bus_subscribe_and_publish():
@@ -102,6 +110,100 @@ def test_event_bus_exception_in_handler_doesnt_break_others():
     assert events[0] == {"msg": "test"}
 
 
+def test_event_bus_single_handler_exception_is_contained():
+    """Test that an exception in the only handler doesn't propagate."""
+    bus = EventBus()
+
+    def bad_handler(data):
+        raise ValueError("Handler error")
+
+    bus.subscribe(EventType.GATEWAY_STARTED, bad_handler)
+
+    # Should not raise
+    bus.publish(EventType.GATEWAY_STARTED, {"msg": "test"})
+
+
+class _Recorder:
+    """Subscriber object with a bound-method handler."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, data):
+        self.events.append(data)
+
+
+def test_event_bus_bound_method_subscriber_receives_events():
+    """Test bound-method subscribers are called while their object is alive."""
+    bus = EventBus()
+    recorder = _Recorder()
+
+    bus.subscribe(EventType.STATS_UPDATED, recorder.on_event)
+    bus.subscribe(EventType.STATS_UPDATED, recorder.on_event)
+    bus.publish(EventType.STATS_UPDATED, 1)
+
+    assert recorder.events == [1, 1]
+
+
+def test_event_bus_bound_method_subscriber_is_weak():
+    """Test subscribing does not keep the subscriber object alive."""
+    bus = EventBus()
+    events = []
+    recorder = _Recorder()
+
+    bus.subscribe(EventType.STATS_UPDATED, recorder.on_event)
+    bus.subscribe(EventType.STATS_UPDATED, events.append)
+    del recorder
+    gc.collect()
+    bus.publish(EventType.STATS_UPDATED, 1)
+
+    assert events == [1]
+    assert bus._listeners[EventType.STATS_UPDATED] == [events.append]
+
+
+def test_event_bus_dead_subscribers_deactivate_type():
+    """Test a type whose only subscriber was collected is no longer dispatched."""
+    bus = EventBus()
+    recorder = _Recorder()
+
+    bus.subscribe(EventType.STATS_UPDATED, recorder.on_event)
+    del recorder
+    gc.collect()
+    bus.publish(EventType.STATS_UPDATED, 1)
+
+    assert EventType.STATS_UPDATED not in bus._active
+
+
+def test_event_bus_unsubscribe_bound_method():
+    """Test bound methods can be unsubscribed with a fresh bound-method object."""
+    bus = EventBus()
+    recorder = _Recorder()
+
+    bus.subscribe(EventType.STATS_UPDATED, recorder.on_event)
+    bus.unsubscribe(EventType.STATS_UPDATED, recorder.on_event)
+    bus.publish(EventType.STATS_UPDATED, 1)
+
+    assert recorder.events == []
+
+
+def test_event_bus_subscribe_during_publish():
+    """Test that subscribing from a handler doesn't affect the running publish."""
+    bus = EventBus()
+    events = []
+
+    def late_handler(data):
+        events.append(("late", data))
+
+    def handler(data):
+        events.append(("first", data))
+        bus.subscribe(EventType.GATEWAY_STARTED, late_handler)
+
+    bus.subscribe(EventType.GATEWAY_STARTED, handler)
+    bus.publish(EventType.GATEWAY_STARTED, 1)
+
+    assert events == [("first", 1)]
+
+
 def test_event_bus_publish_none_data():
     """Test publishing event with None data."""
     bus = EventBus()
@@ -114,6 +216,45 @@ def test_event_bus_publish_none_data():
     assert events[0] is None
 
 
+def test_event_bus_unsubscribe_last_handler_deactivates_type():
+    """Test that removing the last handler stops dispatch for that type."""
+    bus = EventBus()
+    events = []
+
+    def handler(data):
+        events.append(data)
+
+    bus.subscribe(EventType.STATS_UPDATED, handler)
+    bus.unsubscribe(EventType.STATS_UPDATED, handler)
+    bus.publish(EventType.STATS_UPDATED, {"test": 1})
+
+    assert events == []
+    assert EventType.STATS_UPDATED not in bus._active
+
+
+def test_event_type_values():
+    """Test EventType keeps its string values."""
+    assert EventType.GATEWAY_STARTED.value == "gateway_started"
+    assert EventType.STATS_UPDATED.value == "stats_updated"
+    assert EventType.INTERFACE_STATE_CHANGED.value == "interface_state_changed"
+
+
+def test_stats_updated_event_from_stats():
+    """Test StatsUpdatedEvent snapshots DirectionStats counters."""
+    stats = DirectionStats(direction="1to0")
+    stats.received = 10
+    stats.forwarded = 8
+    stats.dropped = 2
+    stats.queue.push(1_000_000, 900_000, 0x123, b"\x01", False)
+
+    event = StatsUpdatedEvent.from_stats(stats)
+
+    assert event == StatsUpdatedEvent(
+        direction="1to0", received=10, forwarded=8, dropped=2, queue_size=1
+    )
+    assert event.direction is StatsUpdatedEvent.from_stats(stats).direction
+
+
 # Direction enum tests
 
 
@@ -1,12 +1,20 @@
 """Unit and integration tests for BidirectionalGateway."""
 
+import socket
+import struct
 import threading
 import time
 
 import can
 import pytest
 
-from wp4.core.gateway import BidirectionalGateway
+from wp4.core.gateway import (
+    _RANDOM_RANGE,
+    BidirectionalGateway,
+    _RandomPool,
+    _ReceiveConfig,
+    _schedule_frame,
+)
 
 
 @pytest.fixture
@@ -184,12 +192,12 @@ class TestLatencySamples:
 
     def test_latency_samples_max_size(self, gateway):
         """Test latency samples are capped at max size."""
-        # The deque has maxlen=100 (defined in DirectionStats)
+        # The ring buffer holds 100 samples (defined in DirectionStats)
         gateway.start()
         # After forwarding many messages, samples should be <= max
         time.sleep(0.1)
         samples = gateway.get_latency_samples("0to1")
-        # Max is 100 as defined in DirectionStats.latency_samples deque
+        # Max is 100 as defined by LATENCY_SAMPLE_CAPACITY
         assert len(samples) <= 100
 
 
@@ -224,6 +232,208 @@ class TestStatistics:
         assert gateway.queue_size_1to0 >= 0
 
 
+class TestReceiveConfig:
+    """Tests for the receive settings snapshot."""
+
+    def test_setters_bump_config_version(self, gateway):
+        """Test every setter invalidates the receive threads' snapshot."""
+        version = gateway._config_version
+        gateway.delay_ms = 5
+        gateway.jitter_ms = 1.5
+        gateway.loss_pct = 10.0
+        gateway.set_logger(None)
+        assert gateway._config_version == version + 4
+
+    def test_snapshot_reflects_settings(self, gateway):
+        """Test the snapshot carries the current settings."""
+        gateway.delay_ms = 5
+        gateway.jitter_ms = 1.5
+        gateway.loss_pct = 10.0
+        config = gateway._receive_config()
+        assert config.delay_ns == 5_000_000
+        assert config.jitter_ns == 1_500_000
+        assert config.loss_threshold == int(0.1 * _RANDOM_RANGE)
+        assert config.logger is None
+
+
+class _FakeBus:
+    """Bus stub that returns queued frames and records sent ones."""
+
+    def __init__(self, frames=()):
+        self._frames = list(frames)
+        self.sent = []
+
+    def recv(self, timeout=None):
+        if self._frames:
+            return self._frames.pop(0)
+        time.sleep(timeout or 0)
+        return None
+
+    def send(self, msg):
+        self.sent.append((msg.arbitration_id, bytes(msg.data)))
+
+
+class TestPassthrough:
+    """Tests for inline forwarding without delay, jitter, loss or rules."""
+
+    @staticmethod
+    def _run_receive_loop(gateway, recv_bus, send_bus):
+        gateway._running = True
+        thread = threading.Thread(
+            target=gateway._receive_loop, args=(recv_bus, send_bus, "0to1"), daemon=True
+        )
+        thread.start()
+        time.sleep(0.2)
+        gateway._running = False
+        thread.join(timeout=1.0)
+
+    def test_passthrough_only_without_effects(self, gateway):
+        """Test passthrough is off as soon as any effect is configured."""
+        assert gateway._receive_config().passthrough
+        gateway.jitter_ms = 1.0
+        assert not gateway._receive_config().passthrough
+        gateway.jitter_ms = 0.0
+        gateway.loss_pct = 1.0
+        assert not gateway._receive_config().passthrough
+
+    def test_zero_config_sends_from_receive_thread(self, gateway):
+        """Test frames bypass the scheduler when nothing is configured."""
+        recv_bus = _FakeBus([can.Message(arbitration_id=0x123, data=b"\x01")])
+        send_bus = _FakeBus()
+
+        self._run_receive_loop(gateway, recv_bus, send_bus)
+
+        assert send_bus.sent == [(0x123, b"\x01")]
+        assert gateway.forwarded_0to1 == 1
+        assert gateway.queue_size_0to1 == 0
+
+    def test_delay_uses_scheduler(self, gateway):
+        """Test frames are queued for the send thread when a delay is set."""
+        gateway.delay_ms = 50
+        recv_bus = _FakeBus([can.Message(arbitration_id=0x123, data=b"\x01")])
+        send_bus = _FakeBus()
+
+        self._run_receive_loop(gateway, recv_bus, send_bus)
+
+        assert send_bus.sent == []
+        assert gateway.queue_size_0to1 == 1
+
+
+class TestScheduleFrame:
+    """Tests for the per-frame loss and delay decision."""
+
+    @staticmethod
+    def _config(delay_ns=0, jitter_ns=0, loss_threshold=0):
+        return _ReceiveConfig(delay_ns, jitter_ns, loss_threshold, None, None)
+
+    def test_delay_and_extra_delay(self):
+        """Test the send time adds the configured and extra delay."""
+        assert _schedule_frame(1_000, self._config(delay_ns=500), _RandomPool(), 25) == 1_525
+
+    def test_jitter_stays_in_range(self):
+        """Test jitter is symmetric around the delay."""
+        config = self._config(delay_ns=1_000, jitter_ns=100)
+        rng = _RandomPool()
+        send_times = {_schedule_frame(0, config, rng) for _ in range(2000)}
+        assert min(send_times) >= 900
+        assert max(send_times) <= 1_100
+        assert len(send_times) > 1
+
+    def test_full_loss_drops_everything(self):
+        """Test 100% loss drops every frame."""
+        config = self._config(loss_threshold=_RANDOM_RANGE)
+        rng = _RandomPool()
+        assert all(_schedule_frame(0, config, rng) == -1 for _ in range(100))
+
+    def test_no_loss_keeps_everything(self):
+        """Test 0% loss never drops a frame."""
+        config = self._config()
+        rng = _RandomPool()
+        assert all(_schedule_frame(0, config, rng) == 0 for _ in range(100))
+
+    def test_partial_loss_rate(self):
+        """Test the loss threshold drops roughly its share of frames."""
+        config = self._config(loss_threshold=_RANDOM_RANGE // 4)
+        rng = _RandomPool(size=64)  # Refills several times
+        lost = sum(_schedule_frame(0, config, rng) == -1 for _ in range(4000))
+        assert 800 < lost < 1200
+
+
+class TestSocketDrain:
+    """Tests for draining raw SocketCAN frames."""
+
+    @staticmethod
+    def _frame(can_id: int, data: bytes) -> bytes:
+        return struct.pack("=IB3x8s", can_id, len(data), data)
+
+    def test_drain_parses_frames(self, gateway):
+        """Test raw frames are parsed into scheduled entries."""
+        reader, writer = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        with reader, writer:
+            writer.send(self._frame(0x123, b"\x01\x02"))
+            writer.send(self._frame(0x1ABCDEF0 | 0x80000000, b""))  # Extended ID
+            writer.send(self._frame(0x20000004, b"\x00" * 8))  # Error frame
+            writer.send(self._frame(0x7FF | 0x40000000, b"\xaa" * 4))  # Remote frame, DLC 4
+            batch = []
+
+            read = gateway._drain_socket(
+                reader,
+                bytearray(72),
+                gateway._receive_config(),
+                _RandomPool(),
+                "0to1",
+                gateway.get_direction_stats("0to1"),
+                batch,
+            )
+
+        assert read == 4
+        assert [entry[2:] for entry in batch] == [
+            (0x123, b"\x01\x02", False),
+            (0x1ABCDEF0, b"", True),
+            (0x7FF, b"", False),
+        ]
+        assert gateway.received_0to1 == 3
+
+    def test_drain_bounds_error_frames(self, gateway):
+        """Test a flood of error frames still ends the drain after a batch."""
+        reader, writer = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        with reader, writer:
+            for _ in range(gateway.RX_BATCH_SIZE + 10):
+                writer.send(self._frame(0x20000004, b"\x00" * 8))
+            batch = []
+
+            read = gateway._drain_socket(
+                reader,
+                bytearray(72),
+                gateway._receive_config(),
+                _RandomPool(),
+                "0to1",
+                gateway.get_direction_stats("0to1"),
+                batch,
+            )
+
+        assert read == gateway.RX_BATCH_SIZE - 1
+        assert batch == []
+
+    def test_drain_stops_when_socket_empty(self, gateway):
+        """Test draining an empty socket returns immediately."""
+        reader, writer = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        with reader, writer:
+            batch = []
+            read = gateway._drain_socket(
+                reader,
+                bytearray(72),
+                gateway._receive_config(),
+                _RandomPool(),
+                "0to1",
+                gateway.get_direction_stats("0to1"),
+                batch,
+            )
+
+        assert read == 0
+        assert batch == []
+
+
 class TestMessageForwarding:
     """Integration tests for actual message forwarding."""
 
@@ -530,6 +740,70 @@ class TestGatewayLoggerIntegration:
         gw.loss_pct = 5.0
         gw.set_logger(None)
 
+    def test_queued_frame_logs_nothing(self):
+        """Test queuing a delayed frame makes no logger call (log_queue is a no-op)."""
+        from unittest.mock import Mock
+
+        logger = Mock()
+        gw = BidirectionalGateway("vcan0", "vcan1", delay_ms=10, logger=logger)
+        logger.reset_mock()
+
+        entry = gw._prepare_entry(
+            gw._receive_config(), _RandomPool(), 0x123, b"\x01", False, "0to1", gw._stats_0to1
+        )
+
+        assert entry is not None
+        assert logger.method_calls == []
+
+    def test_manipulated_frames_log_received_payload(self):
+        """Test dropped and modified frames are logged with the payload as received."""
+        from unittest.mock import Mock
+
+        from wp4.core.manipulation import (
+            Action,
+            ByteManipulation,
+            ManipulationEngine,
+            ManipulationRule,
+            Operation,
+        )
+
+        manipulator = ManipulationEngine()
+        manipulator.add_rule(ManipulationRule("drop", 0x100, action=Action.DROP))
+        manipulator.add_rule(
+            ManipulationRule(
+                "modify",
+                0x200,
+                manipulations=[ByteManipulation(0, Operation.SET, 0xFF)],
+            )
+        )
+        logger = Mock()
+        gw = BidirectionalGateway("vcan0", "vcan1", logger=logger, manipulator=manipulator)
+        logger.reset_mock()
+        config = gw._receive_config()
+
+        for arb_id in (0x100, 0x200, 0x300):
+            gw._prepare_entry(config, _RandomPool(), arb_id, b"\x01", False, "0to1", gw._stats_0to1)
+
+        assert [call.args[2:4] for call in logger.log_drop.call_args_list] == [(0x100, b"\x01")]
+        # Only the modified frame needs an RX entry besides its TX entry
+        assert [call.args[2:4] for call in logger.log_rx.call_args_list] == [(0x200, b"\x01")]
+
+    def test_stopped_logger_not_called(self):
+        """Test forwarding skips the logger while it is not logging."""
+        from unittest.mock import Mock
+
+        logger = Mock(is_enabled=False)
+        gw = BidirectionalGateway("vcan0", "vcan1", logger=logger)
+        logger.reset_mock()
+        send_bus = _FakeBus()
+
+        gw._transmit(send_bus, can.Message(), (0, 0, 0x123, b"\x01", False), "0to1", gw._stats_0to1)
+        logger.is_enabled = True
+        gw._transmit(send_bus, can.Message(), (0, 0, 0x124, b"\x02", False), "0to1", gw._stats_0to1)
+
+        assert len(send_bus.sent) == 2
+        assert [call.args[2] for call in logger.log_tx.call_args_list] == [0x124]
+
 
 class TestEndToEndLogging:
     """End-to-end tests for full logging flow with real CAN traffic."""
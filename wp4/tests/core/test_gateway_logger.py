@@ -2,9 +2,16 @@
 
 import time
 
+import can
 import pytest
+from can.io.blf import BLFWriter
 
-from wp4.core.gateway_logger import GatewayLogger
+from wp4.core.gateway_logger import (
+    BINARY_MAGIC,
+    BINARY_RECORD,
+    GatewayLogger,
+    _FrameBLFWriter,
+)
 
 
 @pytest.fixture
@@ -75,7 +82,7 @@ class TestGatewayLogger:
 
         logger.log_rx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x123,
             data=bytes([0x01, 0x02]),
             is_extended=False,
@@ -96,7 +103,7 @@ class TestGatewayLogger:
 
         logger.log_tx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x456,
             data=bytes([0xAA, 0xBB]),
             is_extended=False,
@@ -118,23 +125,23 @@ class TestGatewayLogger:
         # Should not raise
         logger.log_queue(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x123,
             data=bytes([0x01]),
             is_extended=False,
-            scheduled_time=time.time() + 0.1,
+            scheduled_time=time.monotonic_ns() + 100_000_000,
         )
 
         logger.stop()
 
-    def test_log_drop_writes_csv(self, temp_log_dir):
-        """Test log_drop writes to CSV (not to BLF)."""
+    def test_log_drop_writes_csv_and_blf(self, temp_log_dir):
+        """Test log_drop writes a dropped CSV row and the frame to BLF."""
         logger = GatewayLogger(temp_log_dir)
         logger.start("vcan0", "vcan1")
 
         logger.log_drop(
             direction="1to0",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0xABC,
             data=bytes([0xFF]),
             is_extended=False,
@@ -159,15 +166,20 @@ class TestGatewayLogger:
         assert rows[0]["tx_ts"] == ""  # No TX timestamp for dropped
         assert rows[0]["latency_us"] == ""  # No latency for dropped
 
+        with can.BLFReader(str(logger.get_blf_path())) as reader:
+            messages = list(reader)
+        assert [(msg.arbitration_id, bytes(msg.data)) for msg in messages] == [(0xABC, b"\xff")]
+
     def test_log_when_disabled(self):
         """Test logging does nothing when disabled."""
         logger = GatewayLogger()
 
         # Should not raise
-        logger.log_rx("0to1", time.time(), 0x123, bytes([0x01]), False)
-        logger.log_queue("0to1", time.time(), 0x123, bytes([0x01]), False, time.time())
-        logger.log_tx("0to1", time.time(), 0x123, bytes([0x01]), False, 1000.0)
-        logger.log_drop("0to1", time.time(), 0x123, bytes([0x01]), False)
+        now = time.monotonic_ns()
+        logger.log_rx("0to1", now, 0x123, bytes([0x01]), False)
+        logger.log_queue("0to1", now, 0x123, bytes([0x01]), False, now)
+        logger.log_tx("0to1", now, 0x123, bytes([0x01]), False, 1000.0)
+        logger.log_drop("0to1", now, 0x123, bytes([0x01]), False)
 
     def test_set_log_path(self, temp_log_dir):
         """Test set_log_path changes the base path."""
@@ -217,7 +229,7 @@ class TestGatewayLogger:
         for i in range(10):
             logger.log_rx(
                 direction="0to1" if i % 2 == 0 else "1to0",
-                timestamp=time.time(),
+                timestamp=time.monotonic_ns(),
                 arb_id=0x100 + i,
                 data=bytes([i]),
                 is_extended=False,
@@ -238,7 +250,7 @@ class TestGatewayLogger:
 
         logger.log_rx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x18DAF100,
             data=bytes([0x01, 0x02]),
             is_extended=True,
@@ -311,7 +323,7 @@ class TestCSVLogging:
         logger.set_gateway_config(delay_ms=50.0, jitter_ms=10.0, loss_pct=5.0)
         logger.start("vcan0", "vcan1")
 
-        tx_timestamp = time.time()
+        tx_timestamp = time.monotonic_ns()
         logger.log_tx(
             direction="0to1",
             timestamp=tx_timestamp,
@@ -354,7 +366,7 @@ class TestCSVLogging:
 
         logger.log_tx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x100,
             data=bytes([0x01]),
             is_extended=False,
@@ -384,7 +396,7 @@ class TestCSVLogging:
         # First message with initial config
         logger.log_tx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x100,
             data=bytes([0x01]),
             is_extended=False,
@@ -397,7 +409,7 @@ class TestCSVLogging:
         # Second message with updated config
         logger.log_tx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x101,
             data=bytes([0x02]),
             is_extended=False,
@@ -449,7 +461,7 @@ class TestCSVLogging:
 
         logger.log_tx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x123,
             data=bytes([0x01]),
             is_extended=False,
@@ -493,7 +505,7 @@ class TestCSVLogging:
         for i in range(5):
             logger.log_tx(
                 direction="0to1",
-                timestamp=time.time(),
+                timestamp=time.monotonic_ns(),
                 arb_id=0x100 + i,
                 data=bytes([i]),
                 is_extended=False,
@@ -522,7 +534,7 @@ class TestCSVLogging:
         # Extended ID
         logger.log_tx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x18DAF100,
             data=bytes([0x01]),
             is_extended=True,
@@ -532,7 +544,7 @@ class TestCSVLogging:
         # Standard ID
         logger.log_tx(
             direction="0to1",
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             arb_id=0x123,
             data=bytes([0x02]),
             is_extended=False,
@@ -551,3 +563,150 @@ class TestCSVLogging:
         assert rows[0]["arb_id"] == "0x18DAF100"
         # Standard: 3 hex digits
         assert rows[1]["arb_id"] == "0x123"
+
+    def test_flush_writes_queued_events(self, temp_log_dir):
+        """Test flush() writes queued events while logging continues."""
+        import csv
+
+        logger = GatewayLogger(temp_log_dir)
+        logger.start("vcan0", "vcan1")
+
+        for i in range(300):  # More than one flusher batch
+            logger.log_drop("0to1", time.monotonic_ns(), 0x100 + i % 16, bytes([i % 256]), False)
+        logger.flush()
+
+        csv_path = logger.get_csv_path()
+        assert csv_path is not None
+        with csv_path.open() as f:
+            rows = list(csv.DictReader(f))
+
+        assert len(rows) == 300
+        assert logger.is_enabled
+        logger.stop()
+
+    def test_csv_flushed_periodically(self, temp_log_dir):
+        """Test queued rows reach the CSV file without an explicit flush()."""
+        import csv
+
+        logger = GatewayLogger(temp_log_dir)
+        logger.FLUSH_INTERVAL = 0.05
+        logger.start("vcan0", "vcan1")
+
+        logger.log_drop("0to1", time.monotonic_ns(), 0x123, bytes([0x01]), False)
+        time.sleep(0.3)
+
+        csv_path = logger.get_csv_path()
+        assert csv_path is not None
+        with csv_path.open() as f:
+            rows = list(csv.DictReader(f))
+
+        assert len(rows) == 1
+        logger.stop()
+
+    def test_binary_metadata_format(self, temp_log_dir):
+        """Test binary metadata format writes fixed-size records instead of CSV."""
+        logger = GatewayLogger(temp_log_dir, metadata_format="binary")
+        logger.start("vcan0", "vcan1")
+        for i in range(3):
+            logger.log_drop("0to1", time.monotonic_ns(), 0x100 + i, bytes([i]), False)
+        logger.stop()
+
+        binary_path = logger.get_binary_path()
+        assert logger.get_csv_path() is None
+        assert binary_path is not None
+        assert binary_path.suffix == ".bin"
+        content = binary_path.read_bytes()
+        assert content.startswith(BINARY_MAGIC)
+        assert len(content) == len(BINARY_MAGIC) + 3 * BINARY_RECORD.size
+
+    def test_unknown_metadata_format(self, temp_log_dir):
+        """Test an unknown metadata format is rejected."""
+        with pytest.raises(ValueError):
+            GatewayLogger(temp_log_dir, metadata_format="xml")
+
+    def test_events_dropped_when_flusher_behind(self, temp_log_dir):
+        """Test events beyond MAX_PENDING_EVENTS are counted, not queued."""
+        logger = GatewayLogger(temp_log_dir)
+        logger.MAX_PENDING_EVENTS = 0  # Every event finds the queue full
+        logger.start("vcan0", "vcan1")
+
+        logger.log_drop("0to1", time.monotonic_ns(), 0x123, bytes([0x01]), False)
+        logger.log_tx("0to1", time.monotonic_ns(), 0x123, bytes([0x01]), False, 1000.0)
+        logger.stop()
+
+        assert logger.dropped_events == 2
+
+    def test_blf_container_size(self, temp_log_dir):
+        """Test the BLF writer compresses containers of BLF_CONTAINER_SIZE."""
+        logger = GatewayLogger(temp_log_dir)
+        logger.start("vcan0", "vcan1")
+
+        assert logger._writer is not None
+        assert logger._writer.max_container_size == GatewayLogger.BLF_CONTAINER_SIZE
+
+        logger.stop()
+
+
+class TestFrameBLFWriter:
+    """Tests for the single-pack BLF frame path."""
+
+    FRAMES = [
+        (1, 10.0005, 0x123, bytes([0x01, 0x02]), False),
+        (2, 10.25, 0x18DAF100, bytes(range(8)), True),
+        (1, 11.0, 0x7FF, b"", False),
+    ]
+
+    FD_FRAME = can.Message(
+        channel=2, timestamp=11.5, arbitration_id=0x456, data=bytes(range(12)), is_fd=True
+    )
+
+    def test_matches_on_message_received(self, tmp_path):
+        """Test log_frame writes the same file as BLFWriter.on_message_received."""
+        fast = _FrameBLFWriter(str(tmp_path / "fast.blf"))
+        for frame in self.FRAMES:
+            fast.log_frame(*frame)
+        fast.on_message_received(self.FD_FRAME)
+        fast.stop()
+
+        reference = BLFWriter(str(tmp_path / "reference.blf"))
+        for channel, timestamp, arb_id, data, is_extended in self.FRAMES:
+            reference.on_message_received(
+                can.Message(
+                    channel=channel,
+                    timestamp=timestamp,
+                    arbitration_id=arb_id,
+                    data=data,
+                    is_extended_id=is_extended,
+                )
+            )
+        reference.on_message_received(self.FD_FRAME)
+        reference.stop()
+
+        assert (tmp_path / "fast.blf").read_bytes() == (tmp_path / "reference.blf").read_bytes()
+
+    def test_flushes_full_containers(self, tmp_path):
+        """Test frames are compressed once a container is full."""
+        path = tmp_path / "small.blf"
+        writer = _FrameBLFWriter(str(path), max_container_size=1024)
+        for i in range(100):
+            writer.log_frame(1, i * 0.001, 0x100, bytes([i]), False)
+        assert writer._buffer_size < 1024
+        writer.stop()
+
+        with can.BLFReader(str(path)) as reader:
+            messages = list(reader)
+        assert [msg.data[0] for msg in messages] == list(range(100))
+        assert all(msg.channel == 1 for msg in messages)
+
+    def test_large_objects_grow_buffer(self, tmp_path):
+        """Test objects larger than the preallocated buffer match BLFWriter output."""
+        paths = {}
+        for name, writer_class in (("fast", _FrameBLFWriter), ("reference", BLFWriter)):
+            paths[name] = tmp_path / f"{name}.blf"
+            writer = writer_class(str(paths[name]), max_container_size=64)
+            writer.on_message_received(can.Message(timestamp=1.0, arbitration_id=0x100))
+            writer.log_event("x" * 4096, 1.5)
+            writer.on_message_received(can.Message(timestamp=2.0, arbitration_id=0x101))
+            writer.stop()
+
+        assert paths["fast"].read_bytes() == paths["reference"].read_bytes()
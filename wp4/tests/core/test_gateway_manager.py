@@ -141,6 +141,27 @@ def test_gateway_manager_get_stats_not_running(config, event_bus):
     }
 
 
+def test_gateway_manager_get_stats_reads_direction(config, event_bus):
+    """Test stats come from the requested direction in a new dict per call."""
+    from wp4.core.gateway import BidirectionalGateway
+
+    manager = GatewayManager(config, event_bus)
+    manager._gateway = BidirectionalGateway("vcan0", "vcan1")  # Not started
+    stats = manager._gateway.get_direction_stats("1to0")
+    stats.received = 5
+    stats.forwarded = 3
+    stats.dropped = 1
+    stats.tx_dropped = 1
+
+    first = manager.get_stats("1to0")
+    assert first == {"received": 5, "forwarded": 3, "dropped": 2, "queue_size": 0}
+    assert manager.get_stats("0to1")["received"] == 0
+
+    stats.received = 6
+    assert manager.get_stats("1to0")["received"] == 6
+    assert first["received"] == 5  # Earlier results are snapshots
+
+
 def test_gateway_manager_get_stats_running(config, event_bus):
     """Test getting stats when gateway is running."""
     manager = GatewayManager(config, event_bus)
@@ -36,14 +36,16 @@ def test_interface_manager_bring_up_interfaces(config, event_bus):
 
     manager.bring_up_interfaces()
 
-    # Should publish 2 events (one per interface)
-    assert len(events) == 2
+    # Should publish 1 event for both interfaces
+    assert len(events) == 1
 
     # Check event data
-    for event in events:
-        assert event["interface"] in ["vcan0", "vcan1"]
-        assert event["state"] is not None
-        assert event["state"].state == "UP"
+    states = events[0]["states"]
+    assert list(states) == ["vcan0", "vcan1"]
+    for state in states.values():
+        assert state is not None
+        assert state.state == "UP"
+    assert "errors" not in events[0]
 
 
 def test_interface_manager_bring_down_interfaces(config, event_bus):
@@ -59,14 +61,15 @@ def test_interface_manager_bring_down_interfaces(config, event_bus):
     # Then bring down
     manager.bring_down_interfaces()
 
-    # Should publish 2 events (one per interface)
-    assert len(events) == 2
+    # Should publish 1 event for both interfaces
+    assert len(events) == 1
 
     # Check event data
-    for event in events:
-        assert event["interface"] in ["vcan0", "vcan1"]
-        assert event["state"] is not None
-        assert event["state"].state == "DOWN"
+    states = events[0]["states"]
+    assert list(states) == ["vcan0", "vcan1"]
+    for state in states.values():
+        assert state is not None
+        assert state.state == "DOWN"
 
 
 def test_interface_manager_get_state(config, event_bus):
@@ -140,11 +143,106 @@ def test_interface_manager_event_on_error(event_bus):
 
     manager.bring_up_interfaces()
 
-    # Should still publish events (with error information)
-    assert len(events) == 2
+    # Should still publish the event (with error information)
+    assert len(events) == 1
 
-    for event in events:
-        assert event["interface"] in ["nonexistent0", "nonexistent1"]
-        # State should be None and error should be present
-        assert event["state"] is None
-        assert "error" in event
+    # States should be None and errors should be present
+    assert events[0]["states"] == {"nonexistent0": None, "nonexistent1": None}
+    assert set(events[0]["errors"]) == {"nonexistent0", "nonexistent1"}
+
+
+def test_interface_manager_single_interface_event(event_bus):
+    """Test single-interface operations publish the per-interface event form."""
+    config = GatewayConfig(iface0="nonexistent0", iface1="nonexistent1")
+    manager = InterfaceManager(config, event_bus)
+
+    events = []
+    event_bus.subscribe(EventType.INTERFACE_STATE_CHANGED, lambda d: events.append(d))
+
+    with pytest.raises(OSError):
+        manager.bring_up_interface("nonexistent0")
+
+    assert len(events) == 1
+    assert events[0]["interface"] == "nonexistent0"
+    assert events[0]["state"] is None
+    assert "error" in events[0]
+
+
+def test_interface_manager_brings_up_in_parallel(config, event_bus, monkeypatch):
+    """Test both interfaces are brought up concurrently, states in interface order."""
+    import time
+
+    from wp4.core import interface_manager
+
+    def slow_set_up(iface, bitrate):
+        time.sleep(0.2)
+
+    monkeypatch.setattr(interface_manager, "set_interface_up", slow_set_up)
+    monkeypatch.setattr(interface_manager, "get_interface_state", lambda iface: iface)
+    manager = InterfaceManager(config, event_bus)
+    events = []
+    event_bus.subscribe(EventType.INTERFACE_STATE_CHANGED, lambda d: events.append(d))
+
+    start = time.monotonic()
+    manager.bring_up_interfaces()
+
+    assert time.monotonic() - start < 0.35
+    assert events == [{"states": {"vcan0": "vcan0", "vcan1": "vcan1"}}]
+
+
+def test_interface_manager_caches_states(config, event_bus, monkeypatch):
+    """Test states are reused for STATE_CACHE_TTL and refreshed by bring-up."""
+    from wp4.core import interface_manager
+
+    queries = []
+
+    def get_state(iface):
+        queries.append(iface)
+        return iface
+
+    monkeypatch.setattr(interface_manager, "get_interface_state", get_state)
+    monkeypatch.setattr(interface_manager, "set_interface_up", lambda iface, bitrate: None)
+    manager = InterfaceManager(config, event_bus)
+
+    manager.get_states()
+    manager.get_states()
+    manager.get_state("vcan0")
+    assert sorted(queries) == ["vcan0", "vcan1"]
+
+    manager.bring_up_interface("vcan0")
+    assert queries[-1] == "vcan0"
+    assert len(queries) == 3
+
+    manager._state_cache["vcan1"] = ("vcan1", 0.0)  # Expired
+    manager.get_state("vcan1")
+    assert len(queries) == 4
+
+
+def test_interface_manager_get_states_serves_cache_hits_inline(config, event_bus, monkeypatch):
+    """Test fresh cached states are returned without using the thread pool."""
+    from wp4.core import interface_manager
+
+    monkeypatch.setattr(interface_manager, "get_interface_state", lambda iface: iface)
+    manager = InterfaceManager(config, event_bus)
+    manager.get_states()
+
+    def no_executor():
+        raise AssertionError("thread pool used for cached states")
+
+    monkeypatch.setattr(manager, "_get_executor", no_executor)
+    assert manager.get_states() == {"vcan0": "vcan0", "vcan1": "vcan1"}
+
+    manager._state_cache["vcan1"] = ("vcan1", 0.0)  # Expired: queried inline
+    assert manager.get_states() == {"vcan0": "vcan0", "vcan1": "vcan1"}
+
+
+def test_interface_manager_shutdown_executor():
+    """Test the shared pool is shut down and recreated on next use."""
+    executor = InterfaceManager._get_executor()
+
+    InterfaceManager.shutdown_executor()
+
+    assert InterfaceManager._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(int)
+    assert InterfaceManager._get_executor() is not executor
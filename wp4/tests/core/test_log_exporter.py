@@ -1,11 +1,14 @@
 """Unit tests for LogExporter."""
 
+import random
 import time
 
+import can
 import pytest
+from can.io.blf import BLFParseError, BLFReader, BLFWriter
 
 from wp4.core.gateway_logger import GatewayLogger
-from wp4.core.log_exporter import LogExporter
+from wp4.core.log_exporter import LogExporter, _DeltaStats, _iter_records, _P2Quantile
 
 
 @pytest.fixture
@@ -21,18 +24,18 @@ def sample_blf_file(temp_log_dir):
     logger.start("vcan0", "vcan1")
 
     # Log some messages in both directions
-    base_time = time.time()
+    base_time = time.monotonic_ns()
     for i in range(10):
         logger.log_rx(
             direction="0to1" if i % 2 == 0 else "1to0",
-            timestamp=base_time + i * 0.001,
+            timestamp=base_time + i * 1_000_000,
             arb_id=0x100 + i,
             data=bytes([i, i + 1]),
             is_extended=False,
         )
         logger.log_tx(
             direction="0to1" if i % 2 == 0 else "1to0",
-            timestamp=base_time + i * 0.001 + 0.0005,
+            timestamp=base_time + i * 1_000_000 + 500_000,
             arb_id=0x100 + i,
             data=bytes([i, i + 1]),
             is_extended=False,
@@ -117,6 +120,22 @@ class TestLogExporter:
         total = sum(by_channel.values())
         assert total == stats["total_messages"]
 
+    def test_blf_to_statistics_counts(self, temp_log_dir):
+        """Test exact counts per channel and per formatted arbitration ID."""
+        logger = GatewayLogger(temp_log_dir)
+        logger.start("vcan0", "vcan1")
+        base_time = time.monotonic_ns()
+        frames = [("0to1", 0x123, False), ("1to0", 0x123, False), ("0to1", 0x18DAF100, True)]
+        for i, (direction, arb_id, is_ext) in enumerate(frames):
+            logger.log_tx(direction, base_time + i * 1_000_000, arb_id, b"\x01", is_ext, 1.0)
+        logger.stop()
+
+        stats = LogExporter.blf_to_statistics(logger.get_blf_path())
+
+        assert stats["by_channel"] == {1: 2, 2: 1}
+        assert stats["by_arbitration_id"] == {"0x123": 2, "0x18DAF100": 1}
+        assert stats["duration_s"] == pytest.approx(0.002, abs=1e-6)
+
     def test_format_statistics_report(self, sample_blf_file):
         """Test formatting statistics as report."""
         stats = LogExporter.blf_to_statistics(sample_blf_file)
@@ -160,11 +179,11 @@ class TestLogExporter:
         logger.start("vcan0", "vcan1")
 
         # Log messages with 100us intervals
-        base_time = time.time()
+        base_time = time.monotonic_ns()
         for i in range(5):
             logger.log_rx(
                 direction="0to1",
-                timestamp=base_time + i * 0.0001,  # 100us intervals
+                timestamp=base_time + i * 100_000,  # 100us intervals
                 arb_id=0x100,
                 data=bytes([i]),
                 is_extended=False,
@@ -208,6 +227,37 @@ class TestLogExporter:
         assert "vcan0" in result["asc_ch1"].name
         assert "vcan1" in result["asc_ch2"].name
 
+    def test_export_all_matches_single_exports(self, sample_blf_file, tmp_path):
+        """Test export_all writes the same text logs as the single-format methods."""
+        result = LogExporter.export_all(sample_blf_file, "vcan0", "vcan1")
+        log_path = LogExporter.blf_to_human_readable(sample_blf_file, tmp_path / "single.log")
+        analysis_path = LogExporter.blf_to_detailed_analysis(
+            sample_blf_file, tmp_path / "single.analysis.log"
+        )
+
+        def without_export_time(path):
+            return [line for line in path.read_text().splitlines() if "Exported:" not in line]
+
+        assert without_export_time(result["log"]) == without_export_time(log_path)
+        assert without_export_time(result["analysis"]) == without_export_time(analysis_path)
+
+    def test_export_all_large_log_matches_single_exports(
+        self, sample_blf_file, tmp_path, monkeypatch
+    ):
+        """Test a log over the frame cache limit is exported the same way."""
+        monkeypatch.setattr("wp4.core.log_exporter._EXPORT_CACHE_FRAMES", 1)
+        result = LogExporter.export_all(sample_blf_file, "vcan0", "vcan1")
+        log_path = LogExporter.blf_to_human_readable(sample_blf_file, tmp_path / "single.log")
+        analysis_path = LogExporter.blf_to_detailed_analysis(
+            sample_blf_file, tmp_path / "single.analysis.log"
+        )
+
+        def without_export_time(path):
+            return [line for line in path.read_text().splitlines() if "Exported:" not in line]
+
+        assert without_export_time(result["log"]) == without_export_time(log_path)
+        assert without_export_time(result["analysis"]) == without_export_time(analysis_path)
+
     def test_blf_to_asc_per_channel(self, sample_blf_file):
         """Test blf_to_asc_per_channel creates separate files."""
         result = LogExporter.blf_to_asc_per_channel(sample_blf_file, "vcan0", "vcan1")
@@ -221,6 +271,47 @@ class TestLogExporter:
         total_size = result["ch1"].stat().st_size + result["ch2"].stat().st_size
         assert total_size > 0
 
+    def test_blf_to_asc_per_channel_empty_channel(self, temp_log_dir):
+        """Test a channel without traffic gets a placeholder instead of an ASC log."""
+        logger = GatewayLogger(temp_log_dir)
+        logger.start("vcan0", "vcan1")
+        logger.log_tx("0to1", time.monotonic_ns(), 0x123, b"\x01", False, 1.0)
+        logger.stop()
+
+        result = LogExporter.blf_to_asc_per_channel(logger.get_blf_path(), "vcan0", "vcan1")
+
+        assert "Begin Triggerblock" in result["ch1"].read_text()
+        assert result["ch2"].read_text() == "; No messages for channel 2 (vcan1)\n"
+
+    @pytest.mark.parametrize("with_fd_frame", [False, True])
+    def test_blf_to_asc_fast_matches_ascwriter(self, tmp_path, with_fd_frame):
+        """Test the direct ASC formatting writes the same files as ASCWriter."""
+        blf_path = tmp_path / "frames.blf"
+        with BLFWriter(str(blf_path)) as writer:
+            messages = [
+                can.Message(arbitration_id=0x123, data=b"\x01\xab", channel=2),
+                can.Message(arbitration_id=0x18DAF100, data=bytes(8), is_rx=False, channel=1),
+                can.Message(arbitration_id=0x7FF, dlc=4, is_remote_frame=True, channel=2),
+                can.Message(arbitration_id=0x0, data=b"", is_extended_id=False, channel=1),
+            ]
+            if with_fd_frame:
+                messages.append(can.Message(arbitration_id=0x42, data=bytes(20), is_fd=True))
+            for i, msg in enumerate(messages * 3):
+                msg.timestamp = 1_700_000_000.0 + i * 0.25
+                writer.on_message_received(msg)
+
+        def without_date(path):
+            return path.read_text().split("\n", 1)[1]
+
+        slow = LogExporter.blf_to_asc(blf_path, tmp_path / "slow.asc", fast=False)
+        fast = LogExporter.blf_to_asc(blf_path, tmp_path / "fast.asc")
+        assert without_date(fast) == without_date(slow)
+
+        slow_channels = LogExporter.blf_to_asc_per_channel(blf_path, "slow0", "slow1", fast=False)
+        fast_channels = LogExporter.blf_to_asc_per_channel(blf_path, "fast0", "fast1")
+        for key in ("ch1", "ch2"):
+            assert without_date(fast_channels[key]) == without_date(slow_channels[key])
+
     def test_asc_format_valid(self, sample_blf_file):
         """Test ASC file has valid Vector format."""
         asc_path = LogExporter.blf_to_asc(sample_blf_file)
@@ -305,3 +396,161 @@ class TestLogExporter:
                 assert len(parts) >= 7, f"Expected 7+ columns, got {len(parts)}"
 
         assert data_rows > 0, "No data rows found in analysis file"
+
+    def test_analysis_rows(self, tmp_path):
+        """Test the exact column layout of the per-frame analysis rows."""
+        blf_path = tmp_path / "frames.blf"
+        with BLFWriter(str(blf_path)) as writer:
+            for i, (arb_id, is_ext, channel) in enumerate(
+                [(0x12, False, 1), (0x18DAF100, True, 2), (0x12, False, 1)]
+            ):
+                msg = can.Message(
+                    timestamp=1_700_000_000.0 + i * 0.25,
+                    arbitration_id=arb_id,
+                    is_extended_id=is_ext,
+                    data=bytes([0xAB, i]),
+                    channel=channel,
+                )
+                writer.on_message_received(msg)
+
+        content = LogExporter.blf_to_detailed_analysis(blf_path).read_text()
+
+        rows = [line for line in content.splitlines() if line[:6].strip().isdigit()]
+        assert [row.split(" | ")[3:] for row in rows] == [
+            [" 0→1", "     0x012", "  2", "       0.000", "AB 00"],
+            [" 1→0", "0x18DAF100", "  2", "  250000.000", "AB 01"],
+            [" 0→1", "     0x012", "  2", "  250000.000", "AB 02"],
+        ]
+
+    def test_analysis_empty_blf_file(self, temp_log_dir):
+        """Test analysis of an empty BLF file leaves only the analysis file behind."""
+        logger = GatewayLogger(temp_log_dir)
+        logger.start("vcan0", "vcan1")
+        logger.stop()
+        blf_path = logger.get_blf_path()
+        before = set(temp_log_dir.iterdir())
+
+        analysis_path = LogExporter.blf_to_detailed_analysis(blf_path)
+
+        content = analysis_path.read_text()
+        assert "Total Messages:    0\n" in content
+        assert content.endswith("END OF ANALYSIS\n" + "=" * 100 + "\n")
+        assert set(temp_log_dir.iterdir()) == before | {analysis_path}
+
+    def test_binary_to_csv_matches_csv_logging(self, temp_log_dir):
+        """Test binary metadata converts to the same CSV the logger writes."""
+        import csv
+
+        rows = {}
+        for metadata_format in ("csv", "binary"):
+            logger = GatewayLogger(temp_log_dir / metadata_format, metadata_format)
+            logger.set_gateway_config(delay_ms=10.0, jitter_ms=2.5, loss_pct=1.0)
+            logger.start("vcan0", "vcan1")
+            logger._start_ns = 1_000_000_000_000  # Same relative timestamps in both logs
+            logger.log_tx("0to1", 1_000_500_000_000, 0x123, bytes([0x01, 0xAB]), False, 1500.0)
+            logger.log_tx("1to0", 1_000_750_000_000, 0x18DAF100, bytes(range(12)), True, 250.0)
+            logger.log_drop("0to1", 1_001_000_000_000, 0x7FF, b"", False)
+            logger.stop()
+
+            if metadata_format == "binary":
+                assert logger.get_csv_path() is None
+                binary_path = logger.get_binary_path()
+                assert binary_path is not None
+                csv_path = LogExporter.binary_to_csv(binary_path)
+            else:
+                csv_path = logger.get_csv_path()
+            assert csv_path is not None
+            with csv_path.open() as f:
+                rows[metadata_format] = list(csv.DictReader(f))
+
+        assert len(rows["csv"]) == 3
+        assert rows["binary"] == rows["csv"]
+
+    def test_binary_to_csv_rejects_other_files(self, temp_log_dir):
+        """Test converting a file without the binary log header fails."""
+        temp_log_dir.mkdir(parents=True, exist_ok=True)
+        path = temp_log_dir / "other.bin"
+        path.write_bytes(b"not a log")
+
+        with pytest.raises(ValueError):
+            LogExporter.binary_to_csv(path)
+
+
+class TestIterRecords:
+    """Tests for the direct BLF frame parser."""
+
+    @pytest.mark.parametrize("compression_level", [0, 6])
+    def test_matches_blf_reader(self, tmp_path, compression_level):
+        """Test records match BLFReader for all frame kinds, across small containers."""
+        blf_path = tmp_path / "frames.blf"
+        messages = [
+            can.Message(arbitration_id=0x123, data=b"\x01\x02", is_extended_id=False),
+            can.Message(arbitration_id=0x18DAF100, data=bytes(8), is_extended_id=True),
+            can.Message(arbitration_id=0x7FF, dlc=4, is_remote_frame=True, is_extended_id=False),
+            can.Message(arbitration_id=0x42, data=bytes(range(20)), is_fd=True, channel=1),
+            can.Message(arbitration_id=0x1, data=b"\xff", is_error_frame=True),
+            can.Message(arbitration_id=0x0, data=b"", is_extended_id=False, channel=1),
+        ]
+        with BLFWriter(str(blf_path), compression_level=compression_level) as writer:
+            writer.max_container_size = 100  # Objects straddle container boundaries
+            for i in range(50):
+                msg = messages[i % len(messages)]
+                msg.timestamp = 1_700_000_000.0 + i * 0.000123
+                writer.on_message_received(msg)
+
+        with BLFReader(str(blf_path)) as reader:
+            expected = [
+                (m.timestamp, m.channel, m.arbitration_id, m.is_extended_id, bytes(m.data))
+                for m in reader
+            ]
+
+        assert list(_iter_records(blf_path)) == expected
+        assert len(expected) == 50
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test a file without the BLF signature is rejected."""
+        path = tmp_path / "other.blf"
+        path.write_bytes(bytes(200))
+
+        with pytest.raises(BLFParseError):
+            list(_iter_records(path))
+
+
+class TestDeltaStats:
+    """Tests for the inter-frame delta statistics."""
+
+    def test_exact_percentiles(self):
+        """Test percentiles are nearest-rank values of the sorted samples."""
+        stats = _DeltaStats()
+        for delta in range(100, 0, -1):
+            stats.add(float(delta))
+
+        assert stats.summary() == (1.0, 100.0, 50.5, 51.0, 96.0, 100.0)
+
+    def test_no_samples(self):
+        """Test all statistics are zero without samples."""
+        assert _DeltaStats().summary() == (0.0,) * 6
+
+    def test_estimates_past_exact_limit(self, monkeypatch):
+        """Test the P² estimates stay close to the exact percentiles on long inputs."""
+        monkeypatch.setattr(_DeltaStats, "EXACT_LIMIT", 1000)
+        rng = random.Random(1)
+        samples = [rng.expovariate(1 / 500) for _ in range(20_000)]
+        stats = _DeltaStats()
+        for delta in samples:
+            stats.add(delta)
+
+        ordered = sorted(samples)
+        min_delta, max_delta, avg_delta, *percentiles = stats.summary()
+        assert (min_delta, max_delta) == (ordered[0], ordered[-1])
+        assert avg_delta == pytest.approx(sum(samples) / len(samples))
+        for p, estimate in zip((0.5, 0.95, 0.99), percentiles, strict=True):
+            assert estimate == pytest.approx(ordered[int(len(ordered) * p)], rel=0.05)
+
+    def test_p2_few_samples_exact(self):
+        """Test the estimator returns the exact quantile before its markers are set up."""
+        estimator = _P2Quantile(0.5)
+        for x in (3.0, 1.0, 2.0):
+            estimator.update(x)
+
+        assert estimator.value() == 2.0
@@ -82,6 +82,16 @@ class TestByteManipulation:
         manip.apply(data)
         assert data == bytearray([0xFF])
 
+    def test_table_matches_apply(self):
+        """Lookup table gives the same result as apply for every byte value."""
+        for operation in Operation:
+            manip = ByteManipulation(byte_index=0, operation=operation, value=0x5A)
+            table = manip.table()
+            for original in range(256):
+                data = bytearray([original])
+                manip.apply(data)
+                assert table[original] == data[0]
+
 
 class TestManipulationRule:
     """Tests for ManipulationRule class."""
@@ -174,6 +184,13 @@ class TestManipulationRule:
         assert data == b"\x01\x02\x03"
         assert delay == 100.0
 
+    def test_apply_without_manipulation_returns_payload_as_is(self):
+        """Rules without manipulations hand back the payload object itself."""
+        payload = bytearray(b"\x01\x02\x03")
+        for action in (Action.FORWARD, Action.DELAY):
+            rule = ManipulationRule(name="test", can_id=0x123, action=action)
+            assert rule.apply(payload)[1] is payload
+
     def test_apply_multiple_manipulations(self):
         """Multiple byte manipulations are applied in order."""
         manipulations = [
@@ -190,6 +207,39 @@ class TestManipulationRule:
         assert action == Action.FORWARD
         assert data == b"\xaa\xff\x0f"
 
+    def test_apply_same_byte_in_order(self):
+        """Manipulations of the same byte are applied in list order."""
+        rule = ManipulationRule(
+            name="test",
+            can_id=0x123,
+            manipulations=[
+                ByteManipulation(byte_index=0, operation=Operation.SET, value=0x10),
+                ByteManipulation(byte_index=0, operation=Operation.ADD, value=0x05),
+                ByteManipulation(byte_index=1, operation=Operation.ADD, value=0x05),
+                ByteManipulation(byte_index=1, operation=Operation.SET, value=0x10),
+            ],
+        )
+        _, data, _ = rule.apply(b"\xff\xff\xff")
+        assert data == b"\x15\x10\xff"
+
+    def test_apply_bitwise_payload_matches_byte_operations(self):
+        """Whole-payload bitwise manipulation matches byte-by-byte application."""
+        manipulations = [
+            ByteManipulation(byte_index=0, operation=Operation.SET, value=0xAA),
+            ByteManipulation(byte_index=1, operation=Operation.OR, value=0xF0),
+            ByteManipulation(byte_index=1, operation=Operation.XOR, value=0x3C),
+            ByteManipulation(byte_index=3, operation=Operation.AND, value=0x0F),
+            ByteManipulation(byte_index=7, operation=Operation.XOR, value=0xFF),
+        ]
+        rule = ManipulationRule(name="test", can_id=0x123, manipulations=manipulations)
+
+        for payload in (b"", b"\x12", b"\x12\x34\x56\x78", bytes(range(0x80, 0x88))):
+            expected = bytearray(payload)
+            for manip in manipulations:
+                manip.apply(expected)
+            _, data, _ = rule.apply(payload)
+            assert data == expected
+
 
 class TestManipulationEngine:
     """Tests for ManipulationEngine class."""
@@ -291,6 +341,41 @@ class TestManipulationEngine:
         assert action == Action.DROP
         assert data == b"\x01\x02"
 
+    def test_process_first_match_across_exact_and_masked_rules(self):
+        """Rule order decides between exact-ID rules and masked or wildcard rules."""
+        exact = ManipulationRule(name="exact", can_id=0x123)
+        masked = ManipulationRule(name="masked", can_id=0x003, can_id_mask=0x00F)
+        wildcard = ManipulationRule(name="any", can_id=-1, direction="1to0")
+        disabled = ManipulationRule(name="disabled", can_id=0x123, enabled=False)
+        engine = ManipulationEngine()
+
+        engine.set_rules([exact, masked, wildcard])
+        assert engine.get_matching_rule(0x123, "0to1") is exact
+        assert engine.get_matching_rule(0x133, "0to1") is masked
+
+        engine.set_rules([masked, exact])
+        assert engine.get_matching_rule(0x123, "0to1") is masked
+
+        engine.set_rules([disabled, wildcard, exact])
+        assert engine.get_matching_rule(0x123, "0to1") is exact
+        assert engine.get_matching_rule(0x123, "1to0") is wildcard
+
+        # The exact mask compares only the low 11 bits, also for extended IDs
+        engine.set_rules([exact])
+        assert engine.get_matching_rule(0x18DAF123, "0to1") is exact
+        engine.remove_rule("exact")
+        assert engine.get_matching_rule(0x123, "0to1") is None
+
+    def test_process_follows_rule_enabled_flag(self):
+        """Disabling an added rule takes effect without re-adding it."""
+        rule = ManipulationRule(name="drop", can_id=-1, action=Action.DROP)
+        engine = ManipulationEngine()
+        engine.add_rule(rule)
+        assert engine.process(0x123, b"", "1to0")[0] == Action.DROP
+
+        rule.enabled = False
+        assert engine.process(0x123, b"", "1to0")[0] == Action.FORWARD
+
     def test_process_no_match_forwards(self):
         """Non-matching message is forwarded unchanged."""
         engine = ManipulationEngine()
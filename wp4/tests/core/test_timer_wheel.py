@@ -0,0 +1,110 @@
+"""Tests for TimerWheel."""
+
+import pytest
+
+from wp4.core.timer_wheel import TimerWheel
+
+RES = 1 << 20  # Default bucket width in nanoseconds
+
+
+def _entry(send_time: int, arb_id: int = 0) -> tuple[int, int, int, bytes, bool]:
+    return (send_time, 0, arb_id, b"", False)
+
+
+class TestTimerWheel:
+    """Tests for TimerWheel ordering and bookkeeping."""
+
+    def test_empty(self):
+        """Test an empty wheel."""
+        wheel = TimerWheel()
+
+        assert len(wheel) == 0
+        assert not wheel
+        assert wheel.peek_time() is None
+
+    def test_pop_empty_raises(self):
+        """Test popping an empty wheel raises IndexError."""
+        with pytest.raises(IndexError):
+            TimerWheel().pop()
+
+    def test_invalid_slot_count(self):
+        """Test slot count must be a power of two."""
+        with pytest.raises(ValueError, match="power of two"):
+            TimerWheel(slots=1000)
+
+    def test_invalid_resolution(self):
+        """Test resolution must be a power of two."""
+        with pytest.raises(ValueError, match="power of two"):
+            TimerWheel(resolution=1_000_000)
+
+    def test_pops_in_send_time_order(self):
+        """Test entries in different buckets pop in send_time order."""
+        wheel = TimerWheel()
+        base = 100_000 * RES
+        for offset in (5, 1, 3, 2, 4):
+            wheel.add(_entry(base + offset * RES))
+
+        assert wheel.peek_time() == base + RES
+        assert [(wheel.pop()[0] - base) // RES for _ in range(5)] == [1, 2, 3, 4, 5]
+        assert len(wheel) == 0
+
+    def test_same_bucket_keeps_insertion_order(self):
+        """Test entries within one bucket pop in insertion order."""
+        wheel = TimerWheel()
+        wheel.add(_entry(10 * RES + 200, arb_id=1))
+        wheel.add(_entry(10 * RES + 100, arb_id=2))
+
+        assert [wheel.pop()[2] for _ in range(2)] == [1, 2]
+
+    def test_entries_beyond_span_overflow(self):
+        """Test entries spanning more than one revolution still pop in order."""
+        wheel = TimerWheel(slots=16)
+        send_times = [1000 * RES, 1100 * RES, 1005 * RES, 900 * RES]  # Beyond 16 buckets
+        for send_time in send_times:
+            wheel.add(_entry(send_time))
+
+        assert len(wheel) == 4
+        assert [wheel.pop()[0] for _ in range(4)] == sorted(send_times)
+
+    def test_far_future_entries_cascade_in_order(self):
+        """Test entries many revolutions apart come back through the coarse level in order."""
+        wheel = TimerWheel(slots=16)
+        send_times = [t * RES for t in (5000, 1000, 3200, 1001, 500, 3201, 2000, 999)]
+        for send_time in send_times:
+            wheel.add(_entry(send_time))
+
+        assert len(wheel) == len(send_times)
+        assert wheel.peek_time() == 500 * RES
+        assert [wheel.pop()[0] for _ in range(len(send_times))] == sorted(send_times)
+        assert len(wheel) == 0
+
+    def test_overflow_ties_keep_insertion_order(self):
+        """Test equal send times in the overflow heap never compare the rest of the entry."""
+        wheel = TimerWheel(slots=4)
+        wheel.add((0, object()))
+        payloads = [object() for _ in range(3)]  # Unorderable
+        for payload in payloads:
+            wheel.add((1000 * RES, payload))
+
+        assert wheel.pop()[0] == 0
+        assert [wheel.pop()[1] for _ in range(3)] == payloads
+
+    def test_slots_reused_after_draining(self):
+        """Test buckets are reused once earlier ticks have been popped."""
+        wheel = TimerWheel(slots=4)
+        for i in range(20):
+            wheel.add(_entry(i * RES, arb_id=i))
+            assert wheel.pop()[2] == i
+
+    def test_clear(self):
+        """Test clear removes wheel and overflow entries."""
+        wheel = TimerWheel(slots=4)
+        for i in range(10):
+            wheel.add(_entry(i * 10 * RES))
+
+        wheel.clear()
+
+        assert len(wheel) == 0
+        assert wheel.peek_time() is None
+        wheel.add(_entry(5 * RES))
+        assert wheel.pop()[0] == 5 * RES
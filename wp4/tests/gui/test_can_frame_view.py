@@ -0,0 +1,289 @@
+"""GUI tests for CanFrameViewWidget and FrameTreeModel using pytest-qt."""
+
+import os
+import threading
+import time
+from collections import deque
+
+import can
+import pytest
+from can.io.blf import BLFReader
+
+from wp4.gui.widgets.can_frame_view import (
+    BLFParserWorker,
+    CanFrame,
+    CanFrameViewWidget,
+    FrameTreeModel,
+    MessageGroup,
+)
+
+
+def _messages(count: int, start: int = 0) -> list[can.Message]:
+    """Frames alternating between channel 1 (0→1) and 2 (1→0), over four IDs."""
+    return [
+        can.Message(
+            timestamp=1_700_000_000.0 + i * 0.001,
+            arbitration_id=0x100 + i % 4,
+            data=bytes([i % 256, 0x41]),
+            is_extended_id=False,
+            channel=1 + i % 2,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def _write_blf(path, messages: list[can.Message]) -> None:
+    """Write messages to a BLF file, replacing it, with a new modification time."""
+    with can.BLFWriter(str(path)) as writer:
+        for msg in messages:
+            writer.on_message_received(msg)
+    mtime = time.time() + 1
+    os.utime(path, (mtime, mtime))
+
+
+class _GatedBLFReader(BLFReader):
+    """BLFReader that waits for a gate before yielding each message."""
+
+    gate = threading.Event()
+
+    def __iter__(self):
+        for msg in super().__iter__():
+            self.gate.wait()
+            yield msg
+
+
+class _SlowBLFReader(BLFReader):
+    """BLFReader that takes a while for every message."""
+
+    def __iter__(self):
+        for msg in super().__iter__():
+            time.sleep(0.005)
+            yield msg
+
+
+@pytest.fixture
+def frame_view(qtbot):
+    """Create a CanFrameViewWidget that is stopped on teardown."""
+    widget = CanFrameViewWidget(iface0="vcan0", iface1="vcan1")
+    qtbot.addWidget(widget)
+    widget._refresh_timer.stop()  # File checks are triggered by the tests
+    yield widget
+    widget.stop()
+
+
+def _wait_parsed(qtbot, widget: CanFrameViewWidget, messages_read: int) -> None:
+    qtbot.waitUntil(
+        lambda: not widget._parsing_in_progress and widget._messages_read == messages_read,
+        timeout=5000,
+    )
+
+
+def _group(arb_id: int, frames: list[CanFrame]) -> MessageGroup:
+    group = MessageGroup(arbitration_id=arb_id, is_extended_id=False, frames=deque(frames))
+    for frame in frames:
+        if frame.direction == "0→1":
+            group.count_0to1 += 1
+        else:
+            group.count_1to0 += 1
+    return group
+
+
+class TestFrameTreeModel:
+    """Tests for the lazy frame tree model."""
+
+    @staticmethod
+    def _groups() -> list[MessageGroup]:
+        return [
+            _group(
+                0x100,
+                [
+                    CanFrame(1.0, "0→1", 0x100, b"\x01\x41", False),
+                    CanFrame(2.0, "1→0", 0x100, b"\x02", False),
+                ],
+            ),
+            _group(0x200, [CanFrame(3.0, "1→0", 0x200, b"", False)]),
+        ]
+
+    def test_model_tester_empty(self, qtmodeltester):
+        """Test an empty model passes QAbstractItemModelTester."""
+        qtmodeltester.check(FrameTreeModel())
+
+    def test_model_tester_with_groups(self, qtmodeltester):
+        """Test a model with groups passes QAbstractItemModelTester.
+
+        The tester fetches the frame rows of every group itself, so the
+        inserted rows are checked as well.
+        """
+        model = FrameTreeModel()
+        model.set_groups(self._groups())
+        qtmodeltester.check(model)
+
+        assert not model.canFetchMore(model.index(0, 0))
+        assert model.rowCount(model.index(0, 0)) == 2
+
+    def test_frame_rows_created_on_fetch(self):
+        """Test frame rows appear only after fetchMore, newest first."""
+        model = FrameTreeModel()
+        model.set_groups(self._groups())
+        group_index = model.index(0, 0)
+
+        assert model.rowCount() == 2
+        assert model.hasChildren(group_index)
+        assert model.rowCount(group_index) == 0
+        assert model.canFetchMore(group_index)
+
+        model.fetchMore(group_index)
+
+        assert not model.canFetchMore(group_index)
+        assert model.rowCount(group_index) == 2
+        newest = model.index(0, 0, group_index)
+        assert model.parent(newest) == group_index
+        assert model.data(newest) == "2.000000"
+        assert model.data(model.index(1, 3, group_index)) == "01 41"
+        assert model.data(model.index(1, 4, group_index)) == ".A"
+
+    def test_group_row_texts(self):
+        """Test group rows show the ID with counts per direction."""
+        model = FrameTreeModel()
+        model.set_groups(self._groups())
+
+        assert model.data(model.index(0, 0)) == "0x100 (2 frames)"
+        assert model.data(model.index(0, 3)) == "0→1:1  1→0:1"
+        assert model.data(model.index(1, 0)) == "0x200 (1 frames)"
+
+
+class TestBLFParserWorker:
+    """Tests for the background BLF parser."""
+
+    def test_frames_emitted_in_batches(self, tmp_path, monkeypatch):
+        """Test frames arrive in BATCH_SIZE batches plus the rest with finished."""
+        blf_path = tmp_path / "batches.blf"
+        _write_blf(blf_path, _messages(25))
+        monkeypatch.setattr(BLFParserWorker, "BATCH_SIZE", 10)
+        worker = BLFParserWorker()
+        batches = []
+        finished = []
+        worker.frames_ready.connect(batches.append)
+        worker.finished.connect(lambda frames, read: finished.append((frames, read)))
+
+        worker.parse(blf_path, True, True)
+
+        assert [len(batch) for batch in batches] == [10, 10]
+        assert len(finished[0][0]) == 5
+        assert finished[0][1] == 25
+
+    def test_direction_filter_and_skip(self, tmp_path):
+        """Test skipped messages and filtered directions produce no frames."""
+        blf_path = tmp_path / "filter.blf"
+        _write_blf(blf_path, _messages(20))
+        worker = BLFParserWorker()
+        finished = []
+        worker.finished.connect(lambda frames, read: finished.append((frames, read)))
+
+        worker.parse(blf_path, True, False, skip_messages=10)
+
+        frames, read = finished[0]
+        assert read == 20
+        assert len(frames) == 5
+        assert {frame.direction for frame in frames} == {"0→1"}
+        assert frames[0].timestamp == pytest.approx(1_700_000_000.010)
+
+
+class TestCanFrameViewWidget:
+    """Tests for loading BLF files into the frame view."""
+
+    def test_load_groups_frames_by_id(self, qtbot, frame_view, tmp_path):
+        """Test a loaded file shows one collapsed row per ID."""
+        blf_path = tmp_path / "load.blf"
+        _write_blf(blf_path, _messages(40))
+
+        frame_view.set_blf_path(blf_path)
+        _wait_parsed(qtbot, frame_view, 40)
+
+        model = frame_view._model
+        assert model.rowCount() == 4
+        assert model.data(model.index(0, 0)) == "0x100 (10 frames)"
+        assert frame_view._count_label.text() == "40 frames"
+        assert frame_view._unique_ids_label.text() == "4 unique IDs"
+
+    def test_grown_file_only_reads_new_messages(self, qtbot, frame_view, tmp_path):
+        """Test a grown file is parsed from the first message not read yet."""
+        blf_path = tmp_path / "grow.blf"
+        _write_blf(blf_path, _messages(20))
+        frame_view.set_blf_path(blf_path)
+        _wait_parsed(qtbot, frame_view, 20)
+
+        requests = []
+        frame_view._parse_requested.connect(lambda *args: requests.append(args))
+        _write_blf(blf_path, _messages(20) + _messages(8, start=20))
+        frame_view._check_for_updates()
+        _wait_parsed(qtbot, frame_view, 28)
+
+        assert [skip for *_, skip in requests] == [20]
+        assert frame_view._frame_count == 28
+        assert frame_view._count_label.text() == "28 frames"
+
+    def test_frame_history_is_bounded(self, qtbot, frame_view, tmp_path):
+        """Test only the newest max frames per ID are kept, while counts cover all."""
+        blf_path = tmp_path / "bounded.blf"
+        _write_blf(blf_path, _messages(100))
+        frame_view._max_frames_spin.setValue(10)
+
+        frame_view.set_blf_path(blf_path)
+        _wait_parsed(qtbot, frame_view, 100)
+
+        group = frame_view._groups[0x100]
+        assert len(group.frames) == 10
+        assert group.count_0to1 + group.count_1to0 == 25
+
+    def test_reload_during_parse_runs_after_it(self, qtbot, frame_view, tmp_path, monkeypatch):
+        """Test a file selected while a parse runs is loaded once that parse ends."""
+        monkeypatch.setattr("can.io.blf.BLFReader", _GatedBLFReader)
+        _GatedBLFReader.gate.clear()
+        first = tmp_path / "first.blf"
+        second = tmp_path / "second.blf"
+        _write_blf(first, _messages(12))
+        _write_blf(second, _messages(6))
+
+        frame_view.set_blf_path(first)
+        assert frame_view._parsing_in_progress
+        frame_view.set_blf_path(second)
+        _GatedBLFReader.gate.set()
+
+        _wait_parsed(qtbot, frame_view, 6)
+        assert frame_view._frame_count == 6
+
+    def test_file_change_during_parse_is_not_lost(self, qtbot, frame_view, tmp_path, monkeypatch):
+        """Test a file change seen while parsing is picked up by a later check."""
+        monkeypatch.setattr("can.io.blf.BLFReader", _GatedBLFReader)
+        _GatedBLFReader.gate.clear()
+        blf_path = tmp_path / "busy.blf"
+        _write_blf(blf_path, _messages(10))
+        frame_view.set_blf_path(blf_path)
+
+        # Replaced, so the running parse still reads the old file
+        grown_path = tmp_path / "grown.blf"
+        _write_blf(grown_path, _messages(15))
+        os.replace(grown_path, blf_path)
+        frame_view._check_for_updates()  # Parse still running
+        _GatedBLFReader.gate.set()
+        _wait_parsed(qtbot, frame_view, 10)
+
+        frame_view._check_for_updates()
+        _wait_parsed(qtbot, frame_view, 15)
+        assert frame_view._frame_count == 15
+
+    def test_stop_during_parse(self, qtbot, frame_view, tmp_path, monkeypatch):
+        """Test stop() ends a running parse promptly and later reloads do nothing."""
+        monkeypatch.setattr("can.io.blf.BLFReader", _SlowBLFReader)
+        blf_path = tmp_path / "slow.blf"
+        _write_blf(blf_path, _messages(2000))
+        frame_view.set_blf_path(blf_path)
+        worker_thread = frame_view._worker_thread
+
+        start = time.monotonic()
+        frame_view.stop()
+
+        assert time.monotonic() - start < 1.0
+        assert worker_thread.isFinished()
+        frame_view.refresh()  # No worker thread any more
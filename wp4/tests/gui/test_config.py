@@ -0,0 +1,28 @@
+"""Tests for the GUI configuration."""
+
+import importlib
+from pathlib import Path
+
+import wp4.gui.config as gui_config
+
+
+class TestLoggingConfig:
+    """Tests for the default log directory."""
+
+    def test_default_path_is_project_logs(self):
+        """Test the default log directory is the project logs directory."""
+        default_path = gui_config.GuiConfig().logging.default_path
+
+        assert isinstance(default_path, Path)
+        assert default_path == Path(gui_config.__file__).parents[3] / "logs"
+
+    def test_config_creates_no_directories(self, monkeypatch):
+        """Test importing and building the config leaves the filesystem alone."""
+        created = []
+        monkeypatch.setattr(Path, "mkdir", lambda path, *args, **kwargs: created.append(path))
+
+        importlib.reload(gui_config)
+        gui_config.GuiConfig()
+        gui_config.get_default_config()
+
+        assert created == []